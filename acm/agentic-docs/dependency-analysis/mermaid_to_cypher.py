@@ -6,12 +6,31 @@ Converts Mermaid graph files to unified Neo4j Cypher import script
 
 import re
 import os
+import sys
+import json
 import argparse
+import contextlib
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
-@dataclass
+METRICS_STAGES = ('parse', 'generate', 'write')
+
+def use_loader_modules() -> None:
+    """Make the modules of the GraphML loader in src/ importable: the run
+    metrics, snapshots, analytics (these need numpy) and the Cypher builder.
+    They are imported where an option needs them, so a plain conversion
+    works without them"""
+    src = Path(__file__).resolve().parent.parent.parent.parent / 'src'
+    if str(src) not in sys.path:
+        sys.path.insert(0, str(src))
+
+# slots: a parse of a large diagram set holds one of these per node and
+# relationship, without a __dict__ each
+@dataclass(slots=True)
 class GraphNode:
     id: str
     label: str
@@ -22,7 +41,7 @@ class GraphNode:
     deployment_pattern: str = ""
     model_role: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class GraphRelationship:
     source: str
     target: str
@@ -30,178 +49,472 @@ class GraphRelationship:
     subsystem: str
     is_cross_cluster: bool = False
 
-class MermaidParser:
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        # Identity of a relationship: repeating an edge line does not add another one
+        return (self.source, self.relationship_type, self.target)
+
+DEFAULT_GLOB = 'mermaid/*.mmd'
+FILE_NAME_PREFIX = 'rhacm-'
+FRONT_MATTER_DELIMITER = '---'
+# The overview diagram defines the shared top-level components, so without a
+# priority: front-matter key it is merged first and owns them. Its classes are
+# generic (Controller, External, ...); a subsystem diagram's class wins.
+OVERVIEW_SUBSYSTEM = 'Overview'
+OVERVIEW_PRIORITY = 1
+
+@dataclass
+class DiagramFile:
+    path: Path
+    subsystem: str
+    priority: int = 0
+
+def read_front_matter(lines: Iterator[str]) -> Tuple[Dict[str, str], Iterator[str]]:
+    """Split the front-matter block (between --- lines at the top) from the diagram lines"""
+    first = next(lines, None)
+    if first is None:
+        return {}, iter(())
+    if first.strip() != FRONT_MATTER_DELIMITER:
+        return {}, itertools.chain([first], lines)
+    meta = {}
+    for line in lines:
+        if line.strip() == FRONT_MATTER_DELIMITER:
+            break
+        # Only top-level `key: value` pairs, nested blocks such as config: are Mermaid's
+        if line[:1].isspace() or ':' not in line:
+            continue
+        key, value = line.split(':', 1)
+        meta[key.strip()] = value.strip().strip('\'"')
+    return meta, lines
+
+def subsystem_from_file_name(path: Path) -> str:
+    """rhacm-cluster-lifecycle.mmd -> Cluster Lifecycle"""
+    stem = path.stem
+    if stem.startswith(FILE_NAME_PREFIX):
+        stem = stem[len(FILE_NAME_PREFIX):]
+    return ' '.join(word.title() for word in re.split(r'[-_\s]+', stem) if word)
+
+def discover_diagrams(input_dir: Path, pattern: str = DEFAULT_GLOB) -> List[DiagramFile]:
+    """Find the diagrams matching pattern, with subsystem and priority from
+    their front-matter (file name and 0 otherwise, OVERVIEW_PRIORITY for the
+    overview).
+
+    The returned order is the merge order and with it the conflict policy for
+    node ids defined in several files: the definition from the file with the
+    highest priority wins, ties go to the file whose path relative to
+    input_dir sorts first. It does not depend on how the files are parsed."""
+    diagrams = []
+    for path in input_dir.glob(pattern):
+        if not path.is_file():
+            continue
+        with open(path, 'r', encoding='utf-8') as file:
+            meta, _ = read_front_matter(file)
+        subsystem = meta.get('subsystem') or subsystem_from_file_name(path)
+        default_priority = OVERVIEW_PRIORITY if subsystem == OVERVIEW_SUBSYSTEM else 0
+        diagrams.append(DiagramFile(
+            path=path,
+            subsystem=subsystem,
+            priority=int(meta.get('priority', default_priority))
+        ))
+    diagrams.sort(key=lambda diagram: (-diagram.priority, diagram.path.relative_to(input_dir).as_posix()))
+    return diagrams
+
+# Mermaid flowchart grammar, compiled once. Every pattern is matched at a
+# position inside the current line so a statement is tokenized in one pass.
+NODE_ID_PATTERN = re.compile(r'\s*(\w+)')
+# Node shapes, longest delimiters first: (((circle))), ((circle)), ([stadium]),
+# [[subroutine]], [(cylinder)], {{hexagon}}, [/parallelogram/], [\trapezoid/],
+# [rect], (round), {rhombus}, >asymmetric]
+NODE_SHAPE_PATTERN = re.compile(
+    r'\(\(\((.*?)\)\)\)|\(\((.*?)\)\)|\(\[(.*?)\]\)|\[\[(.*?)\]\]|\[\((.*?)\)\]|\{\{(.*?)\}\}'
+    r'|\[[/\\](.*?)[/\\]\]|\[(.*?)\]|\((.*?)\)|\{(.*?)\}|>(.*?)\]'
+)
+NODE_CLASS_PATTERN = re.compile(r':::(\w+)')
+AMPERSAND_PATTERN = re.compile(r'\s*&')
+# A -- text --> B, A -. text .-> B, A == text ==> B
+TEXT_LINK_PATTERN = re.compile(
+    r'\s*(?P<start>[<ox])?(?P<open>--|==|-\.)\s+(?P<text>[^\s\-=.|>][^|]*?)\s+'
+    r'(?P<line>-{2,}|={2,}|\.+-)(?P<end>>|[ox](?=[\s|]))?'
+)
+# -->, --->, ---, ==>, -.->, -..-, --o, --x, <-->, o--o, ~~~
+LINK_PATTERN = re.compile(
+    r'\s*(?P<start>[<ox])?(?P<line>-{2,}|={2,}|-?\.+-|~{3,})(?P<end>>|[ox](?=[\s|]))?'
+)
+LINK_LABEL_PATTERN = re.compile(r'\s*\|(.*?)\|')
+STATEMENT_END_PATTERN = re.compile(r'\s*(;|$)')
+# Fast paths for the two statements that make up almost every diagram,
+# `ID[Label]` and `A[..] -->|LABEL| B[..]`; anything else goes through the
+# general statement tokenizer
+SIMPLE_NODE_PATTERN = re.compile(r'(\w+)\[([^\]"]*)\]')
+SIMPLE_LINK_PATTERN = re.compile(
+    r'(\w+)(?:\[([^\]"]*)\])?\s*(-->|-\.->|==>|---)\s*(?:\|([^|"]*)\|)?\s*(\w+)(?:\[([^\]"]*)\])?'
+)
+SIMPLE_LINK_KINDS = {'-->': 'solid', '-.->': 'dotted', '==>': 'thick', '---': 'solid'}
+CLASS_STATEMENT_PATTERN = re.compile(r'class\s+([\w,\s]+?)\s+(\w+)\s*;?\s*$')
+# Statements that neither define nodes nor connect them
+SKIPPED_KEYWORDS = ('graph', 'flowchart', 'classDef', 'style', 'linkStyle', 'click', 'subgraph', 'end', 'direction')
+
+@dataclass
+class MermaidLink:
+    kind: str  # solid, thick, dotted or invisible
+    text: str
+    bidirectional: bool
+
+class MermaidTokenizer:
+    """Single-pass tokenizer for Mermaid flowcharts.
+
+    Emits ('node', id, label), ('edge', source, target, link) and
+    ('class', ids, class_name) tokens as it reads the lines. label is None
+    for a node that is only referenced, not defined."""
+
     def __init__(self):
+        self._links: Dict[Tuple[str, str], MermaidLink] = {}
+
+    def tokenize(self, lines: Iterable[str]) -> Iterator[tuple]:
+        simple_node = SIMPLE_NODE_PATTERN.fullmatch
+        simple_link = SIMPLE_LINK_PATTERN.fullmatch
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('%%'):
+                continue
+            match = simple_node(line)
+            if match:
+                yield ('node', match.group(1), match.group(2))
+                continue
+            match = simple_link(line)
+            if match:
+                source, source_label, arrow, text, target, target_label = match.groups()
+                yield ('node', source, source_label)
+                yield ('node', target, target_label)
+                yield ('edge', source, target, self._simple_link(SIMPLE_LINK_KINDS[arrow], (text or '').strip()))
+                continue
+            keyword = line.split(None, 1)[0]
+            if keyword == 'class':
+                match = CLASS_STATEMENT_PATTERN.match(line)
+                if match:
+                    yield ('class', [n.strip() for n in match.group(1).split(',') if n.strip()], match.group(2))
+                continue
+            if keyword in SKIPPED_KEYWORDS:
+                continue
+            pos = 0
+            while pos < len(line):
+                tokens = []
+                pos = self._tokenize_statement(line, pos, tokens)
+                if pos is None:
+                    # Not flowchart syntax we understand, skip the rest
+                    break
+                yield from tokens
+
+    def _tokenize_statement(self, line: str, pos: int, tokens: List[tuple]) -> Optional[int]:
+        """Tokenize `A --> B & C -->|label| D; ...` starting at pos into
+        tokens. Returns the position after the statement or None if it could
+        not be parsed."""
+        group, pos = self._node_group(line, pos, tokens)
+        if group is None:
+            return None
+        while True:
+            end = STATEMENT_END_PATTERN.match(line, pos)
+            if end:
+                return end.end()
+            link, pos = self._link(line, pos)
+            if link is None:
+                return None
+            targets, pos = self._node_group(line, pos, tokens)
+            if targets is None:
+                return None
+            for source in group:
+                for target in targets:
+                    tokens.append(('edge', source, target, link))
+            # A --> B --> C chains continue from the last group
+            group = targets
+
+    def _node_group(self, line: str, pos: int, tokens: List[tuple]) -> Tuple[Optional[List[str]], int]:
+        """A node, or several joined with &"""
+        group = []
+        while True:
+            match = NODE_ID_PATTERN.match(line, pos)
+            if not match:
+                return None, pos
+            node_id = match.group(1)
+            pos = match.end()
+            label = None
+            shape = NODE_SHAPE_PATTERN.match(line, pos)
+            if shape:
+                label = next(text for text in shape.groups() if text is not None)
+                if len(label) > 1 and label[0] == label[-1] == '"':
+                    label = label[1:-1]
+                pos = shape.end()
+            tokens.append(('node', node_id, label))
+            node_class = NODE_CLASS_PATTERN.match(line, pos)
+            if node_class:
+                tokens.append(('class', [node_id], node_class.group(1)))
+                pos = node_class.end()
+            group.append(node_id)
+            ampersand = AMPERSAND_PATTERN.match(line, pos)
+            if not ampersand:
+                return group, pos
+            pos = ampersand.end()
+
+    def _simple_link(self, kind: str, text: str) -> MermaidLink:
+        key = (kind, text)
+        link = self._links.get(key)
+        if link is None:
+            link = self._links[key] = MermaidLink(kind, text, False)
+        return link
+
+    def _link(self, line: str, pos: int) -> Tuple[Optional[MermaidLink], int]:
+        text = ''
+        match = TEXT_LINK_PATTERN.match(line, pos)
+        if match:
+            text = match.group('text')
+        else:
+            match = LINK_PATTERN.match(line, pos)
+            if not match:
+                return None, pos
+        pos = match.end()
+        label = LINK_LABEL_PATTERN.match(line, pos)
+        if label:
+            text = label.group(1)
+            pos = label.end()
+        text = text.strip()
+        if len(text) > 1 and text[0] == text[-1] == '"':
+            text = text[1:-1]
+
+        line_token = match.group('line')
+        if line_token[0] == '~':
+            kind = 'invisible'
+        elif '.' in line_token or (match.groupdict().get('open') == '-.'):
+            kind = 'dotted'
+        elif line_token[0] == '=':
+            kind = 'thick'
+        else:
+            kind = 'solid'
+        bidirectional = match.group('start') == '<' and match.group('end') == '>'
+        return MermaidLink(kind, text, bidirectional), pos
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().with_name('classification_rules.json')
+
+class ClassificationRules:
+    """Node type and deployment model rules of classification_rules.json,
+    compiled once: exact ids become a dict lookup and the label rules
+    lower-cased keywords, tried in rule order with plain substring checks
+    against the lower-cased label like the if/elif chains they came from."""
+
+    def __init__(self, table: dict):
+        node_types = table['node_types']
+        self.default_type = node_types['default']
+        # (keyword, type) of every rule, in rule order
+        self.type_keywords: List[Tuple[str, str]] = [
+            (keyword.lower(), rule['type']) for rule in node_types['rules'] for keyword in rule['label_contains']
+        ]
+
+        deployment = table['deployment_models']
+        default = deployment['default']
+        self.default_model = (default['model'], default['pattern'], default['role'])
+        self.model_by_id: Dict[str, Tuple[str, str, str]] = {}
+        for entry in deployment['ids']:
+            for node_id, role in entry['roles'].items():
+                self.model_by_id.setdefault(node_id, (entry['model'], entry['pattern'], role))
+        self.model_rules = []
+        for rule in deployment['rules']:
+            mode = 'all' if 'all' in rule else 'any'
+            conditions = [self._compile_condition(condition) for condition in rule[mode]]
+            self.model_rules.append((mode == 'all', conditions, (rule['model'], rule['pattern'], rule['role'])))
+
+    @staticmethod
+    def _compile_condition(condition: dict) -> Tuple[str, object]:
+        (kind, values), = condition.items()
+        if kind == 'label_contains':
+            return kind, tuple(value.lower() for value in values)
+        if kind == 'subsystem':
+            return kind, frozenset(values)
+        if kind == 'id_suffix':
+            return kind, tuple(values)
+        raise ValueError(f"Unknown classification condition: {kind}")
+
+    def _node_type(self, label_lower: str) -> str:
+        for keyword, node_type in self.type_keywords:
+            if keyword in label_lower:
+                return node_type
+        return self.default_type
+
+    def node_type(self, label: str) -> str:
+        return self._node_type(label.lower())
+
+    def classify(self, node_id: str, label: str, subsystem: str) -> Tuple[str, str, str, str]:
+        """(node type, deployment model, pattern, role) of a node"""
+        label_lower = label.lower()
+        model = self.model_by_id.get(node_id) or self._match_model(node_id, label_lower, subsystem)
+        return (self._node_type(label_lower),) + model
+
+    def _match_model(self, node_id: str, label_lower: str, subsystem: str) -> Tuple[str, str, str]:
+        for require_all, conditions, model in self.model_rules:
+            for kind, values in conditions:
+                if kind == 'label_contains':
+                    holds = False
+                    for keyword in values:
+                        if keyword in label_lower:
+                            holds = True
+                            break
+                elif kind == 'subsystem':
+                    holds = subsystem in values
+                else:
+                    holds = node_id.endswith(values)
+                # The first failing condition decides an `all` rule, the
+                # first holding one an `any` rule
+                if holds != require_all:
+                    break
+            else:
+                if require_all:
+                    return model
+                continue
+            if not require_all:
+                return model
+        return self.default_model
+
+@functools.lru_cache(maxsize=None)
+def load_classification_rules(path: Optional[str] = None) -> ClassificationRules:
+    """Load and compile a rule table once per process"""
+    with open(path or DEFAULT_RULES_PATH, 'r', encoding='utf-8') as file:
+        return ClassificationRules(json.load(file))
+
+class MermaidParser:
+    def __init__(self, rules: Optional[ClassificationRules] = None):
+        self.rules = rules or load_classification_rules()
         self.nodes: Dict[str, GraphNode] = {}
-        self.relationships: List[GraphRelationship] = []
+        # (source, type, target) -> first relationship seen with that key
+        self.relationships: Dict[Tuple[str, str, str], GraphRelationship] = {}
+        self.relationship_lines = 0
         self.class_definitions: Dict[str, str] = {}
+        # node id -> rank of the file its class was taken from (see merge)
+        self.class_ranks: Dict[str, Tuple[bool, bool]] = {}
+        # Ids only seen in links, with the subsystem that first referenced them
+        self.referenced: Dict[str, str] = {}
+        self.tokenizer = MermaidTokenizer()
         
-    def parse_mermaid_file(self, file_path: Path, subsystem: str) -> None:
+    def parse_mermaid_file(self, file_path: Path, subsystem: Optional[str] = None) -> None:
         """Parse a single Mermaid file and extract nodes and relationships"""
-        print(f"Parsing {file_path.name} for {subsystem} subsystem...")
-        
         with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Extract node definitions
-        self._extract_nodes(content, subsystem)
-        
-        # Extract relationships
-        self._extract_relationships(content, subsystem)
-        
-        # Extract class definitions for styling
-        self._extract_class_definitions(content)
+            meta, lines = read_front_matter(file)
+            subsystem = subsystem or meta.get('subsystem') or subsystem_from_file_name(file_path)
+            print(f"Parsing {file_path.name} for {subsystem} subsystem...")
+            self.parse_lines(lines, subsystem)
     
-    def _extract_nodes(self, content: str, subsystem: str) -> None:
-        """Extract node definitions from Mermaid content"""
-        # Pattern for node definitions: ID[Label] or ID[Label with spaces]
-        node_pattern = r'(\w+)\[(.*?)\]'
-        
-        for match in re.finditer(node_pattern, content):
-            node_id = match.group(1)
-            node_label = match.group(2)
-            
-            # Skip if already exists (avoid duplicates across files)
+    def parse_lines(self, lines: Iterable[str], subsystem: str) -> None:
+        """Consume the tokens of one Mermaid document as they are produced"""
+        for token in self.tokenizer.tokenize(lines):
+            kind = token[0]
+            if kind == 'node':
+                _, node_id, label = token
+                if label is None:
+                    self.referenced.setdefault(node_id, subsystem)
+                elif node_id not in self.nodes:
+                    # First definition wins (avoid duplicates across files)
+                    self._add_node(node_id, label, subsystem)
+            elif kind == 'edge':
+                self._add_relationships(token[1], token[2], token[3], subsystem)
+            else:
+                for node_id in token[1]:
+                    self.class_definitions[node_id] = token[2]
+    
+    def merge(self, other: 'MermaidParser', overview: bool = False) -> None:
+        """Fold the result of another parser into this one. Node definitions
+        already known here win over those of other. Classes are a policy of
+        their own: a file that defines the node beats one that only links to
+        it, a subsystem diagram beats the overview, then the earlier file wins"""
+        for node_id, node in other.nodes.items():
             if node_id not in self.nodes:
-                model_info = self._classify_deployment_model(node_id, node_label, subsystem)
-                self.nodes[node_id] = GraphNode(
-                    id=node_id,
-                    label=node_label,
-                    subsystem=subsystem,
-                    node_type=self._determine_node_type(node_label),
-                    description=self._generate_description(node_label, subsystem),
-                    deployment_model=model_info['model'],
-                    deployment_pattern=model_info['pattern'],
-                    model_role=model_info['role']
-                )
+                self.nodes[node_id] = self._intern_node(node)
+        # Strings of a partial parsed in another process are copies; intern
+        # them again so every file shares one instance per value
+        for key, rel in other.relationships.items():
+            if key not in self.relationships:
+                rel.source = sys.intern(rel.source)
+                rel.target = sys.intern(rel.target)
+                rel.relationship_type = sys.intern(rel.relationship_type)
+                rel.subsystem = sys.intern(rel.subsystem)
+                self.relationships[rel.key] = rel
+        self.relationship_lines += other.relationship_lines
+        for node_id, class_name in other.class_definitions.items():
+            rank = (node_id not in other.nodes, overview)
+            if node_id not in self.class_ranks or rank < self.class_ranks[node_id]:
+                self.class_ranks[node_id] = rank
+                self.class_definitions[node_id] = class_name
+        for node_id, subsystem in other.referenced.items():
+            self.referenced.setdefault(node_id, subsystem)
     
-    def _extract_relationships(self, content: str, subsystem: str) -> None:
-        """Extract relationships from Mermaid content"""
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if line.startswith('%%') or not line or line.startswith('graph') or line.startswith('class'):
-                continue
-            
-            # Parse different relationship types
-            relationships = self._parse_relationship_line(line, subsystem)
-            self.relationships.extend(relationships)
-    
-    def _parse_relationship_line(self, line: str, subsystem: str) -> List[GraphRelationship]:
-        """Parse a single line for relationships"""
-        relationships = []
-        
-        # Solid arrows with semantic labels: -->|LABEL|
-        if '-->|' in line:
-            relationships.extend(self._extract_semantic_relationships(line, '-->|', subsystem))
-        # Regular solid arrows: -->
-        elif '-->' in line:
-            relationships.extend(self._extract_arrow_relationships(line, '-->', 'DEPENDS_ON', subsystem))
-        
-        # Dotted arrows with semantic labels: -.->|LABEL|
-        if '-.->|' in line:
-            relationships.extend(self._extract_semantic_relationships(line, '-.->|', subsystem, True))
-        # Regular dotted arrows: -.->
-        elif '-.-> ' in line:
-            relationships.extend(self._extract_arrow_relationships(line, '-.-> ', 'COMMUNICATES_WITH', subsystem, True))
-        
-        return relationships
+    def add_referenced_nodes(self) -> None:
+        """Add the nodes that are only referenced by links, with their id as
+        label like Mermaid shows them. Call after the last file so a definition
+        in any file wins."""
+        for node_id, subsystem in self.referenced.items():
+            if node_id not in self.nodes:
+                self._add_node(node_id, node_id, subsystem)
     
-    def _extract_semantic_relationships(self, line: str, arrow_start: str, subsystem: str, cross_cluster: bool = False) -> List[GraphRelationship]:
-        """Extract relationships with semantic labels from arrow notation"""
-        relationships = []
-        
-        if arrow_start in line:
-            # Split on the arrow start to get source and target parts
-            parts = line.split(arrow_start)
-            if len(parts) == 2:
-                source = parts[0].strip()
-                target_part = parts[1].strip()
-                
-                # Extract the semantic label and target
-                if '|' in target_part:
-                    label_and_target = target_part.split('|', 1)
-                    if len(label_and_target) == 2:
-                        semantic_label = label_and_target[0].strip()
-                        target = label_and_target[1].strip()
-                        
-                        # Clean up node IDs (remove brackets and labels)
-                        source = re.sub(r'\[.*?\]', '', source).strip()
-                        target = re.sub(r'\[.*?\]', '', target).strip()
-                        
-                        if source and target and semantic_label:
-                            relationships.append(GraphRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=semantic_label,
-                                subsystem=subsystem,
-                                is_cross_cluster=cross_cluster
-                            ))
-        
-        return relationships
+    def stats(self) -> Dict[str, int]:
+        """Deduplication counts and the approximate memory of the model
+        (objects and containers; interned strings are shared and not counted)"""
+        memory = (sys.getsizeof(self.nodes) + sys.getsizeof(self.relationships)
+                  + sum(sys.getsizeof(node) for node in self.nodes.values())
+                  + sum(sys.getsizeof(key) + sys.getsizeof(rel) for key, rel in self.relationships.items()))
+        return {
+            'nodes': len(self.nodes),
+            'relationship_lines': self.relationship_lines,
+            'relationships': len(self.relationships),
+            'duplicates': self.relationship_lines - len(self.relationships),
+            'model_bytes': memory,
+        }
     
-    def _extract_arrow_relationships(self, line: str, arrow: str, rel_type: str, subsystem: str, cross_cluster: bool = False) -> List[GraphRelationship]:
-        """Extract relationships from arrow notation"""
-        relationships = []
-        
-        if arrow in line:
-            parts = line.split(arrow)
-            if len(parts) == 2:
-                source = parts[0].strip()
-                target = parts[1].strip()
-                
-                # Clean up node IDs (remove brackets and labels)
-                source = re.sub(r'\[.*?\]', '', source).strip()
-                target = re.sub(r'\[.*?\]', '', target).strip()
-                
-                if source and target:
-                    relationships.append(GraphRelationship(
-                        source=source,
-                        target=target,
-                        relationship_type=rel_type,
-                        subsystem=subsystem,
-                        is_cross_cluster=cross_cluster
-                    ))
-        
-        return relationships
+    def _add_node(self, node_id: str, node_label: str, subsystem: str) -> None:
+        node_type, model, pattern, role = self.rules.classify(node_id, node_label, subsystem)
+        self.nodes[node_id] = self._intern_node(GraphNode(
+            id=node_id,
+            label=node_label,
+            subsystem=subsystem,
+            node_type=node_type,
+            description=self._generate_description(node_label, subsystem),
+            deployment_model=model,
+            deployment_pattern=pattern,
+            model_role=role
+        ))
     
-    def _extract_class_definitions(self, content: str) -> None:
-        """Extract CSS class definitions for styling information"""
-        class_pattern = r'class\s+([\w,\s]+)\s+(\w+)'
-        
-        for match in re.finditer(class_pattern, content):
-            nodes = [n.strip() for n in match.group(1).split(',')]
-            class_name = match.group(2)
-            
-            for node in nodes:
-                if node:
-                    self.class_definitions[node] = class_name
+    def _intern_node(self, node: GraphNode) -> GraphNode:
+        """Intern the fields shared by many nodes"""
+        node.id = sys.intern(node.id)
+        node.subsystem = sys.intern(node.subsystem)
+        node.node_type = sys.intern(node.node_type)
+        node.deployment_model = sys.intern(node.deployment_model)
+        node.deployment_pattern = sys.intern(node.deployment_pattern)
+        node.model_role = sys.intern(node.model_role)
+        return node
+    
+    def _add_relationships(self, source: str, target: str, link: MermaidLink, subsystem: str) -> None:
+        """Map a Mermaid link onto relationships: dotted links are cross
+        cluster communication, solid and thick ones dependencies, invisible
+        links only affect the layout"""
+        if link.kind == 'invisible':
+            return
+        cross_cluster = link.kind == 'dotted'
+        rel_type = sys.intern(link.text or ('COMMUNICATES_WITH' if cross_cluster else 'DEPENDS_ON'))
+        source = sys.intern(source)
+        target = sys.intern(target)
+        pairs = [(source, target), (target, source)] if link.bidirectional else [(source, target)]
+        for rel_source, rel_target in pairs:
+            self.relationship_lines += 1
+            key = (rel_source, rel_type, rel_target)
+            if key in self.relationships:
+                continue
+            self.relationships[key] = GraphRelationship(
+                source=rel_source,
+                target=rel_target,
+                relationship_type=rel_type,
+                subsystem=sys.intern(subsystem),
+                is_cross_cluster=cross_cluster
+            )
     
     def _determine_node_type(self, label: str) -> str:
         """Determine node type based on label content"""
-        label_lower = label.lower()
-        
-        if 'operator' in label_lower:
-            return 'Operator'
-        elif 'controller' in label_lower:
-            return 'Controller'
-        elif 'api' in label_lower:
-            return 'API'
-        elif 'cluster' in label_lower:
-            return 'Cluster'
-        elif 'policy' in label_lower:
-            return 'Policy'
-        elif 'prometheus' in label_lower or 'grafana' in label_lower or 'thanos' in label_lower:
-            return 'Observability'
-        elif 'application' in label_lower or 'subscription' in label_lower:
-            return 'Application'
-        elif 'search' in label_lower:
-            return 'Search'
-        else:
-            return 'Component'
+        return self.rules.node_type(label)
     
     def _generate_description(self, label: str, subsystem: str) -> str:
         """Generate description based on label and subsystem"""
@@ -209,130 +522,151 @@ class MermaidParser:
     
     def _classify_deployment_model(self, node_id: str, label: str, subsystem: str) -> dict:
         """Classify component's deployment model and patterns"""
-        label_lower = label.lower()
-        node_id_lower = node_id.lower()
-        
-        # Subscription Model Components
-        if node_id in ['MULTICLOUD_OPS_SUBSCRIPTION', 'MULTICLOUD_OPS_CHANNEL', 'APPLICATION_MANAGER']:
-            return {
-                'model': 'subscription',
-                'pattern': 'hub_stream_sync',
-                'role': self._get_subscription_role(node_id)
-            }
-        
-        # Channel Types (part of Subscription Model)
-        if node_id in ['GIT_CHANNEL', 'HELM_CHANNEL', 'OBJECTSTORAGE_CHANNEL']:
-            return {
-                'model': 'subscription',
-                'pattern': 'content_streaming',
-                'role': 'content_source'
-            }
-        
-        # ArgoCD Push Model Components
-        if node_id in ['MULTICLOUD_INTEGRATIONS', 'GITOPS_CLUSTER_CTRL', 'GITOPS_SYNC_RESOURCE_CTRL', 
-                       'STATUS_AGGREGATION_CTRL', 'PROPAGATION_CTRL', 'GITOPS_ADDON_CTRL']:
-            return {
-                'model': 'argocd_push',
-                'pattern': 'hub_orchestrated',
-                'role': self._get_push_role(node_id)
-            }
-        
-        # ArgoCD Pull Model Components  
-        if node_id in ['ARGOCD_PULL_INTEGRATION', 'APPLICATION_CTRL', 'APPLICATION_STATUS_CTRL', 'CLUSTER_CTRL']:
-            return {
-                'model': 'argocd_pull',
-                'pattern': 'spoke_autonomous',
-                'role': self._get_pull_role(node_id)
-            }
-        
-        # GitOps Operator (serves both ArgoCD models)
-        if node_id == 'GITOPS_OPERATOR':
-            return {
-                'model': 'argocd_push,argocd_pull',
-                'pattern': 'gitops_reconciliation',
-                'role': 'application_deployer'
-            }
-        
-        # Cross-cluster components
-        if 'cluster' in label_lower and subsystem == 'Cluster':
-            return {
-                'model': 'multi_model',
-                'pattern': 'cross_cluster',
-                'role': 'cluster_manager'
-            }
-        
-        # Hub-centric components
-        if subsystem in ['Overview', 'Console'] or 'manager' in label_lower:
-            return {
-                'model': 'hub_centric',
-                'pattern': 'centralized_management',
-                'role': 'hub_service'
-            }
-        
-        # Addon components (deployed to spokes)
-        if 'addon' in label_lower or node_id.endswith('_ADDON'):
-            return {
-                'model': 'addon_framework',
-                'pattern': 'hub_to_spoke_deployment',
-                'role': 'spoke_service'
-            }
-        
-        # Default classification
-        return {
-            'model': '',
-            'pattern': '',
-            'role': ''
-        }
+        _, model, pattern, role = self.rules.classify(node_id, label, subsystem)
+        return {'model': model, 'pattern': pattern, 'role': role}
+
+OUTPUT_FORMATS = ('statements', 'unwind')
+DEFAULT_BATCH_SIZE = 500
+
+def parse_diagram(diagram: DiagramFile, rules_path: Optional[str] = None) -> MermaidParser:
+    """Parse one file into its own partial result (runs in a worker process)"""
+    parser = MermaidParser(load_classification_rules(rules_path))
+    parser.parse_mermaid_file(diagram.path, diagram.subsystem)
+    return parser
+
+def parse_diagrams(diagrams: List[DiagramFile], workers: int = 1, rules_path: Optional[str] = None) -> MermaidParser:
+    """Parse every diagram, in a process pool when workers > 1, and merge the
+    partial results in the order of diagrams so the result is the same for
+    any number of workers"""
+    if workers > 1 and len(diagrams) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(diagrams) // (workers * 4))
+            partials = list(executor.map(functools.partial(parse_diagram, rules_path=rules_path), diagrams,
+                                         chunksize=chunksize))
+    else:
+        partials = (parse_diagram(diagram, rules_path) for diagram in diagrams)
     
-    def _get_subscription_role(self, node_id: str) -> str:
-        """Get role for subscription model components"""
-        role_map = {
-            'MULTICLOUD_OPS_SUBSCRIPTION': 'content_consumer',
-            'MULTICLOUD_OPS_CHANNEL': 'content_router',
-            'APPLICATION_MANAGER': 'deployment_executor'
-        }
-        return role_map.get(node_id, 'subscription_component')
-    
-    def _get_push_role(self, node_id: str) -> str:
-        """Get role for ArgoCD push model components"""
-        role_map = {
-            'MULTICLOUD_INTEGRATIONS': 'integration_orchestrator',
-            'GITOPS_CLUSTER_CTRL': 'cluster_onboarder',
-            'GITOPS_SYNC_RESOURCE_CTRL': 'sync_coordinator',
-            'STATUS_AGGREGATION_CTRL': 'status_collector',
-            'PROPAGATION_CTRL': 'deployment_propagator',
-            'GITOPS_ADDON_CTRL': 'addon_lifecycle_manager'
-        }
-        return role_map.get(node_id, 'push_component')
-    
-    def _get_pull_role(self, node_id: str) -> str:
-        """Get role for ArgoCD pull model components"""
-        role_map = {
-            'ARGOCD_PULL_INTEGRATION': 'pull_orchestrator',
-            'APPLICATION_CTRL': 'application_watcher',
-            'APPLICATION_STATUS_CTRL': 'status_syncer',
-            'CLUSTER_CTRL': 'cluster_coordinator'
-        }
-        return role_map.get(node_id, 'pull_component')
+    merged = MermaidParser(load_classification_rules(rules_path))
+    for diagram, partial in zip(diagrams, partials):
+        merged.merge(partial, overview=diagram.subsystem == OVERVIEW_SUBSYSTEM)
+    merged.add_referenced_nodes()
+    return merged
+
+def parser_from_snapshot(graph: 'CompactGraph', extra: dict, rules_path: Optional[str] = None) -> MermaidParser:
+    """Rebuild a merged parser from a snapshot written by load_diagrams"""
+    parser = MermaidParser(load_classification_rules(rules_path))
+    ids = list(graph.ids)
+    labels = list(graph.labels)
+    subsystems = [graph.names('subsystem')[code] for code in graph.codes('subsystem').tolist()]
+    node_types = [graph.names('type')[code] for code in graph.codes('type').tolist()]
+    for i, text in enumerate(graph.properties):
+        props = json.loads(text)
+        parser.nodes[ids[i]] = parser._intern_node(GraphNode(
+            id=ids[i],
+            label=labels[i],
+            subsystem=subsystems[i],
+            node_type=node_types[i],
+            description=props['description'],
+            deployment_model=props['deployment_model'],
+            deployment_pattern=props['deployment_pattern'],
+            model_role=props['model_role']
+        ))
+    sources = graph.edge_sources().tolist()
+    targets = graph.outTargets.tolist()
+    rel_types = [sys.intern(name) for name in graph.relTypeNames]
+    types = graph.outTypes.tolist()
+    cross_cluster = graph.crossCluster.tolist()
+    edge_properties = list(graph.edgeProperties)
+    # Edge properties repeat per subsystem, decode each distinct one once
+    edge_subsystems: Dict[str, str] = {}
+    for r in graph.insertion_order().tolist():
+        text = edge_properties[r]
+        subsystem = edge_subsystems.get(text)
+        if subsystem is None:
+            subsystem = edge_subsystems[text] = sys.intern(json.loads(text)['subsystem'])
+        rel = GraphRelationship(
+            source=sys.intern(ids[sources[r]]),
+            target=sys.intern(ids[targets[r]]),
+            relationship_type=rel_types[types[r]],
+            subsystem=subsystem,
+            is_cross_cluster=bool(cross_cluster[r])
+        )
+        parser.relationships[rel.key] = rel
+    parser.class_definitions = extra['class_definitions']
+    parser.relationship_lines = extra['relationship_lines']
+    return parser
+
+def load_diagrams(diagrams: List[DiagramFile], workers: int = 1, rules_path: Optional[str] = None,
+                  snapshot: Optional[str] = None, input_dir: Path = Path('.')) -> Tuple[MermaidParser, bool]:
+    """parse_diagrams, or with a snapshot directory the parser saved there
+    by an earlier run while the diagrams and rules are unchanged (a stale
+    or missing snapshot is written again). Returns (parser, from snapshot)"""
+    if snapshot is None:
+        return parse_diagrams(diagrams, workers, rules_path), False
+    use_loader_modules()
+    from compact_graph import CompactGraph
+    from snapshot import load_snapshot, source_hashes, write_snapshot
+    # Keyed by the path relative to input_dir, so moving the checkout keeps it
+    sources = source_hashes([diagram.path for diagram in diagrams] + [rules_path or DEFAULT_RULES_PATH], input_dir)
+    # The subsystem and order of the diagrams decide which file defines a node
+    params = {'subsystems': [diagram.subsystem for diagram in diagrams]}
+    loaded = load_snapshot(snapshot, sources, params)
+    if loaded is not None:
+        return parser_from_snapshot(*loaded, rules_path), True
+    parser = parse_diagrams(diagrams, workers, rules_path)
+    write_snapshot(snapshot, CompactGraph.from_parser(parser, keepProperties=True), sources, params,
+                   {'class_definitions': parser.class_definitions, 'relationship_lines': parser.relationship_lines})
+    return parser, False
+
+def graph_analytics(parser: MermaidParser) -> Dict[str, dict]:
+    """Analytics of every node by id (see src/graph_analytics.py), root and leaf following DEPENDS_ON"""
+    use_loader_modules()
+    from compact_graph import CompactGraph
+    from graph_analytics import node_analytics, node_rows
+    graph = CompactGraph.from_parser(parser)
+    return {graph.ids[i]: props for i, props in node_rows(graph, node_analytics(graph, 'DEPENDS_ON'))}
+
+def cypher_literal(value) -> str:
+    """Cypher literal of an analytics value"""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return repr(value)
 
 class CypherGenerator:
-    def __init__(self, nodes: Dict[str, GraphNode], relationships: List[GraphRelationship], class_definitions: Dict[str, str]):
+    def __init__(self, nodes: Dict[str, GraphNode], relationships: List[GraphRelationship], class_definitions: Dict[str, str],
+                 output_format: str = 'statements', batch_size: int = DEFAULT_BATCH_SIZE,
+                 source_files: Optional[List[str]] = None, analytics: Optional[Dict[str, dict]] = None):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive: {batch_size}")
         self.nodes = nodes
         self.relationships = relationships
         self.class_definitions = class_definitions
+        self.output_format = output_format
+        self.batch_size = batch_size
+        self.source_files = source_files
+        self.analytics = analytics
     
     def generate_cypher_script(self) -> str:
         """Generate complete Cypher import script"""
+        if self.output_format == 'unwind':
+            nodes = self._generate_nodes_unwind()
+            relationships = self._generate_relationships_unwind()
+        else:
+            nodes = self._generate_nodes()
+            relationships = self._generate_relationships()
         cypher_parts = [
             self._generate_header(),
             self._generate_schema(),
-            self._generate_nodes(),
-            self._generate_relationships(),
+            nodes,
+            relationships,
+            self._generate_version_bump(),
             self._generate_verification_queries(),
             self._generate_footer()
         ]
         
-        return '\n\n'.join(cypher_parts)
+        return '\n\n'.join(part for part in cypher_parts if part)
     
     def _generate_header(self) -> str:
         """Generate script header"""
@@ -353,7 +687,7 @@ class CypherGenerator:
     
     def _generate_schema(self) -> str:
         """Generate schema constraints and indexes"""
-        return """// Schema Setup: Constraints and Indexes
+        schema = """// Schema Setup: Constraints and Indexes
 CREATE CONSTRAINT rhacm_component_id IF NOT EXISTS
 FOR (n:RHACMComponent) REQUIRE n.id IS UNIQUE;
 
@@ -365,6 +699,12 @@ FOR (n:RHACMComponent) ON (n.type);
 
 CREATE INDEX rhacm_label_index IF NOT EXISTS
 FOR (n:RHACMComponent) ON (n.label);"""
+        if self.analytics is None:
+            return schema
+        from graph_analytics import INDEXED_PROPERTIES
+        indexes = [f"CREATE INDEX rhacm_{prop}_index IF NOT EXISTS\nFOR (n:RHACMComponent) ON (n.{prop});"
+                   for prop in INDEXED_PROPERTIES]
+        return '\n\n'.join([schema] + indexes)
     
     def _generate_nodes(self) -> str:
         """Generate node creation statements"""
@@ -372,31 +712,56 @@ FOR (n:RHACMComponent) ON (n.label);"""
         
         for node in self.nodes.values():
             node_labels = self._get_node_labels(node)
-            # Build properties dynamically
-            properties = [
-                f"id: '{node.id}'",
-                f"label: {self._escape_string(node.label)}",
-                f"subsystem: '{node.subsystem}'",
-                f"type: '{node.node_type}'",
-                f"description: {self._escape_string(node.description)}"
-            ]
-            
-            # Add deployment model properties if they exist
-            if node.deployment_model:
-                properties.append(f"deployment_model: '{node.deployment_model}'")
-            if node.deployment_pattern:
-                properties.append(f"deployment_pattern: '{node.deployment_pattern}'")
-            if node.model_role:
-                properties.append(f"model_role: '{node.model_role}'")
-            
             cypher_nodes.append(
                 f"CREATE (:{':'.join(node_labels)} {{"
-                f"{', '.join(properties)}"
+                f"{', '.join(self._node_properties(node))}"
                 f"}});"
             )
         
         return '\n'.join(cypher_nodes)
     
+    def _node_properties(self, node: GraphNode) -> List[str]:
+        """Build the property map entries of a node"""
+        properties = [
+            f"id: '{node.id}'",
+            f"label: {self._escape_string(node.label)}",
+            f"subsystem: '{node.subsystem}'",
+            f"type: '{node.node_type}'",
+            f"description: {self._escape_string(node.description)}"
+        ]
+        
+        # Add deployment model properties if they exist
+        if node.deployment_model:
+            properties.append(f"deployment_model: '{node.deployment_model}'")
+        if node.deployment_pattern:
+            properties.append(f"deployment_pattern: '{node.deployment_pattern}'")
+        if node.model_role:
+            properties.append(f"model_role: '{node.model_role}'")
+        
+        # Precomputed analytics (degrees, PageRank, components, ...)
+        if self.analytics is not None:
+            properties.extend(f"{name}: {cypher_literal(value)}" for name, value in self.analytics[node.id].items())
+        
+        return properties
+    
+    def _generate_nodes_unwind(self) -> str:
+        """Generate batched node creation, one UNWIND per label set"""
+        cypher_nodes = ["// Node Creation - RHACM Components (batched by label set)"]
+        
+        label_groups: Dict[Tuple[str, ...], List[GraphNode]] = {}
+        for node in self.nodes.values():
+            label_groups.setdefault(tuple(self._get_node_labels(node)), []).append(node)
+        
+        for node_labels, nodes in label_groups.items():
+            rows = [f"{{{', '.join(self._node_properties(node))}}}" for node in nodes]
+            cypher_nodes.extend(self._unwind_batches(
+                f"\n// :{':'.join(node_labels)} nodes",
+                rows,
+                f"CREATE (n:{':'.join(node_labels)}) SET n = row;"
+            ))
+        
+        return '\n'.join(cypher_nodes)
+    
     def _generate_relationships(self) -> str:
         """Generate relationship creation statements"""
         cypher_rels = ["// Relationship Creation - Component Dependencies"]
@@ -421,6 +786,49 @@ FOR (n:RHACMComponent) ON (n.label);"""
         
         return '\n'.join(cypher_rels)
     
+    def _generate_relationships_unwind(self) -> str:
+        """Generate batched relationship creation, one UNWIND per relationship type.
+        Endpoints are matched on :RHACMComponent so the id constraint's index is used."""
+        cypher_rels = ["// Relationship Creation - Component Dependencies (batched by type)"]
+        
+        rel_groups: Dict[str, List[GraphRelationship]] = {}
+        for rel in self.relationships:
+            rel_groups.setdefault(rel.relationship_type, []).append(rel)
+        
+        for rel_type, rels in rel_groups.items():
+            rows = [
+                f"{{source: '{rel.source}', target: '{rel.target}', "
+                f"subsystem: '{rel.subsystem}', cross_cluster: {str(rel.is_cross_cluster).lower()}}}"
+                for rel in rels
+            ]
+            cypher_rels.extend(self._unwind_batches(
+                f"\n// {rel_type} relationships",
+                rows,
+                "MATCH (source:RHACMComponent {id: row.source}) "
+                "MATCH (target:RHACMComponent {id: row.target}) "
+                f"CREATE (source)-[:{rel_type} {{subsystem: row.subsystem, cross_cluster: row.cross_cluster}}]->(target);"
+            ))
+        
+        return '\n'.join(cypher_rels)
+    
+    def _unwind_batches(self, comment: str, rows: List[str], body: str) -> List[str]:
+        """Split rows into UNWIND statements of at most batch_size rows each"""
+        statements = [comment]
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            statements.append("UNWIND [\n  " + ",\n  ".join(batch) + "\n] AS row\n" + body)
+        return statements
+    
+    def _generate_version_bump(self) -> str:
+        """Give the graph a new version stamp, dropping query results cached by src/query_service.py"""
+        use_loader_modules()
+        try:
+            from cypher_builder import GRAPH_VERSION_BUMP
+        except ImportError:
+            print("⚠️  src/cypher_builder.py not found - the script does not bump the graph version")
+            return ""
+        return f"// Graph Version\n{GRAPH_VERSION_BUMP};"
+    
     def _generate_verification_queries(self) -> str:
         """Generate verification and analysis queries"""
         return """// Verification and Analysis Queries
@@ -459,7 +867,26 @@ FOR (n:RHACMComponent) ON (n.label);"""
 // MATCH (n:RHACMComponent)
 // WHERE NOT ()-[:DEPENDS_ON]->(n)
 // RETURN n.subsystem as Subsystem, n.label as RootComponent, n.type as Type
-// ORDER BY Subsystem, RootComponent;"""
+// ORDER BY Subsystem, RootComponent;""" + (self._analytics_queries() if self.analytics is not None else '')
+    
+    def _analytics_queries(self) -> str:
+        """Queries over the precomputed analytics properties"""
+        return """
+//
+// 6. Most Central Components (precomputed PageRank)
+// MATCH (n:RHACMComponent)
+// RETURN n.label as Component, n.subsystem as Subsystem, n.pagerank as PageRank
+// ORDER BY PageRank DESC LIMIT 20;
+//
+// 7. Subsystem Boundary Components
+// MATCH (n:RHACMComponent) WHERE n.subsystem_boundary
+// RETURN n.subsystem as Subsystem, n.label as Component, n.cross_subsystem_degree as CrossSubsystemDeps
+// ORDER BY CrossSubsystemDeps DESC;
+//
+// 8. Dependency Cycles (strongly connected components)
+// MATCH (n:RHACMComponent) WHERE n.scc_size > 1
+// RETURN n.scc_id as Cycle, collect(n.label) as Components
+// ORDER BY size(Components) DESC;"""
     
     def _generate_footer(self) -> str:
         """Generate script footer with summary"""
@@ -467,6 +894,16 @@ FOR (n:RHACMComponent) ON (n.label);"""
         total_relationships = len(self.relationships)
         subsystems = set(node.subsystem for node in self.nodes.values())
         
+        if self.source_files is not None:
+            sources = '\n'.join(f"// - {source}" for source in self.source_files)
+            return f"""// Script Summary
+// Total Components: {total_nodes}
+// Total Dependencies: {total_relationships}
+// Subsystems: {', '.join(sorted(subsystems))}
+// 
+// Generated from Mermaid files:
+{sources}"""
+        
         return f"""// Script Summary
 // Total Components: {total_nodes}
 // Total Dependencies: {total_relationships}
@@ -510,62 +947,111 @@ FOR (n:RHACMComponent) ON (n.label);"""
 def main():
     parser = argparse.ArgumentParser(description='Convert RHACM Mermaid graphs to Neo4j Cypher')
     parser.add_argument('--input-dir', default='.', help='Directory containing Mermaid files')
+    parser.add_argument('--glob', default=DEFAULT_GLOB,
+                        help='Mermaid files to convert, relative to --input-dir. The subsystem comes from a '
+                             '"subsystem:" front-matter key or the file name; "priority:" decides which file '
+                             'defines a node id that appears in several files (highest first, then path; the '
+                             'Overview diagram defaults to 1)')
+    parser.add_argument('--rules', help='Node type / deployment model rule table (JSON), '
+                                         'default: classification_rules.json next to this script')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes parsing files in parallel (the output does not depend on it)')
     parser.add_argument('--output', default='knowledge-graph/rhacm_architecture_comprehensive_final.cypher', help='Output Cypher file')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='statements',
+                        help='statements: one CREATE/MATCH per node and relationship; '
+                             'unwind: labeled UNWIND batches grouped by label set and relationship type')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Rows per UNWIND statement with --format unwind')
+    parser.add_argument('--metrics', metavar='DIR',
+                        help='Write stage wall/CPU times, model sizes and peak RSS to DIR/mermaid_to_cypher.json '
+                             'and DIR/mermaid_to_cypher.prom (Prometheus text format)')
+    parser.add_argument('--cprofile', metavar='FILE', help='Run under cProfile and write the stats to FILE')
+    parser.add_argument('--snapshot', metavar='DIR',
+                        help='Keep the parsed diagrams as a memory-mapped snapshot in DIR and load it instead of '
+                             'parsing while the Mermaid files and rules are unchanged')
+    parser.add_argument('--analytics', action='store_true',
+                        help='Add precomputed degrees, subsystem boundary, root/leaf, PageRank and strongly '
+                             'connected component properties to every node, with indexes on them')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
-    # Define Mermaid files and their corresponding subsystems
-    mermaid_files = {
-        'mermaid/rhacm-overview.mmd': 'Overview',
-        'mermaid/rhacm-governance.mmd': 'Governance',
-        'mermaid/rhacm-application.mmd': 'Application',
-        'mermaid/rhacm-observability.mmd': 'Observability',
-        'mermaid/rhacm-cluster.mmd': 'Cluster',
-        'mermaid/rhacm-search.mmd': 'Search',
-        'mermaid/rhacm-console.mmd': 'Console'
-    }
-    
-    # Initialize parser
-    parser_instance = MermaidParser()
-    
-    # Parse each Mermaid file
+    metrics = None
+    profile = contextlib.nullcontext()
+    if args.metrics or args.cprofile or args.verbose:
+        use_loader_modules()
+        from metrics import RunMetrics, StageTimer, profiled
+        metrics = RunMetrics('mermaid_to_cypher', StageTimer(METRICS_STAGES))
+        profile = profiled(args.cprofile)
+    with profile:
+        status = convert(args, metrics)
+    if args.metrics and status == 0:
+        metrics.write(args.metrics)
+    return status
+
+def timed(metrics: Optional['RunMetrics'], stage: str):
+    """The stage timer of metrics, nothing when there are no metrics"""
+    return metrics.timer.stage(stage) if metrics is not None else contextlib.nullcontext()
+
+def convert(args: argparse.Namespace, metrics: Optional['RunMetrics'] = None) -> int:
+    """Runs the conversion, timing each stage into metrics when given"""
+    # Discover Mermaid files and their subsystems
     input_path = Path(args.input_dir)
-    parsed_files = 0
-    
-    for filename, subsystem in mermaid_files.items():
-        file_path = input_path / filename
-        if file_path.exists():
-            parser_instance.parse_mermaid_file(file_path, subsystem)
-            parsed_files += 1
-            if args.verbose:
-                print(f"✓ Parsed {filename} ({subsystem})")
-        else:
-            print(f"⚠ Warning: {filename} not found in {input_path}")
-    
-    if parsed_files == 0:
-        print("❌ Error: No Mermaid files found!")
+    diagrams = discover_diagrams(input_path, args.glob)
+    if not diagrams:
+        print(f"❌ Error: No Mermaid files match {args.glob} in {input_path}!")
         return 1
     
+    # Parse each Mermaid file into its own result and merge them
+    with timed(metrics, 'parse'):
+        parser_instance, from_snapshot = load_diagrams(diagrams, args.workers, args.rules, args.snapshot,
+                                                       input_path)
+    parsed_files = len(diagrams)
+    source_files = [f"{diagram.path.relative_to(input_path).as_posix()} ({diagram.subsystem})" for diagram in diagrams]
+    if from_snapshot:
+        print(f"♻️  Loaded the parsed diagrams from {args.snapshot}")
+    elif args.verbose:
+        for source in source_files:
+            print(f"✓ Parsed {source}")
+    
     # Generate Cypher script
+    with timed(metrics, 'generate'):
+        analytics = graph_analytics(parser_instance) if args.analytics else None
     generator = CypherGenerator(
         parser_instance.nodes, 
-        parser_instance.relationships,
-        parser_instance.class_definitions
+        list(parser_instance.relationships.values()),
+        parser_instance.class_definitions,
+        output_format=args.format,
+        batch_size=args.batch_size,
+        source_files=source_files,
+        analytics=analytics
     )
     
-    cypher_script = generator.generate_cypher_script()
+    with timed(metrics, 'generate'):
+        cypher_script = generator.generate_cypher_script()
     
     # Write output
     output_path = Path(args.output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(cypher_script)
+    with timed(metrics, 'write'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(cypher_script)
     
     # Summary
     print(f"\n✅ Conversion Complete!")
     print(f"📊 Parsed {parsed_files} Mermaid files")
     print(f"🔗 Found {len(parser_instance.nodes)} components")
-    print(f"↔️  Found {len(parser_instance.relationships)} dependencies")
+    stats = parser_instance.stats()
+    if metrics is not None:
+        metrics.set('files', parsed_files)
+        for name, value in stats.items():
+            metrics.set(name, value)
+        metrics.set('script_bytes', len(cypher_script.encode('utf-8')))
+    print(f"↔️  Found {stats['relationships']} dependencies "
+          f"({stats['duplicates']} repeated edge lines dropped)")
+    if args.verbose:
+        print(f"🧮 Model size ~{stats['model_bytes'] / 1024:.1f} KiB for {stats['nodes']} nodes "
+              f"and {stats['relationships']} relationships")
+        print(metrics.timer.report())
     print(f"💾 Generated {output_path}")
     print(f"\n🚀 Next steps:")
     print(f"   1. Start Neo4j database")
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Reachability index of the RHACM architecture graph
+Answers transitive dependency questions (does A depend on B, everything X
+depends on, everything that breaks when X fails) from the Mermaid diagrams
+without variable-length traversals, and follows edits of single diagrams
+"""
+
+import sys
+import json
+import argparse
+import contextlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from mermaid_to_cypher import DEFAULT_GLOB, DiagramFile, MermaidParser, discover_diagrams, parse_diagram
+# src/ is on the path once mermaid_to_cypher is imported
+from node_keys import file_hash
+
+def bit_positions(bits: int) -> List[int]:
+    """Positions of the set bits of a bitset, lowest first"""
+    if not bits:
+        return []
+    data = np.frombuffer(bits.to_bytes((bits.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder='little')).tolist()
+
+class ReachabilityIndex:
+    """Transitive closure of the relationships of a set of diagrams.
+
+    Nodes are condensed into their strongly connected components (Tarjan)
+    and every component keeps two bitsets over component numbers: the
+    components it reaches through at least one relationship and the ones
+    reaching it. A component on a cycle reaches itself. "A depends on B" is
+    one bit test, the upstream and blast radius of a node are the members of
+    the components set in one bitset.
+
+    The index keeps the relationships every diagram contributes. When
+    diagrams are added, changed or removed only the components that could
+    reach a changed relationship are condensed and labeled again: nothing
+    else reaches the changed part, so its bitsets stay valid. The components
+    reachable from the relabeled ones then collect who reaches them again."""
+
+    def __init__(self, relationship_types: Optional[Iterable[str]] = None):
+        # None: every relationship type
+        self.relationship_types = set(relationship_types) if relationship_types is not None else None
+        # Diagram key -> (content hash, node ids, (source, target) -> relationships)
+        self.files: Dict[str, Tuple[Optional[str], Set[str], Dict[Tuple[str, str], int]]] = {}
+        # Node id -> number of diagrams naming it, in the order nodes were first seen
+        self.node_files: Dict[str, int] = {}
+        # Source -> target -> number of relationships (of any diagram and type)
+        self.successors: Dict[str, Dict[str, int]] = {}
+        self.predecessors: Dict[str, Set[str]] = {}
+        self.component: Dict[str, int] = {}
+        # Per component number; None / 0 for numbers that are free
+        self.members: List[Optional[List[str]]] = []
+        self.reach: List[int] = []
+        self.reached_by: List[int] = []
+        self.free: List[int] = []
+
+    @classmethod
+    def from_diagrams(cls, diagrams: List[DiagramFile], rules_path: Optional[str] = None,
+                      relationship_types: Optional[Iterable[str]] = None) -> 'ReachabilityIndex':
+        """Index of the merged diagrams"""
+        index = cls(relationship_types)
+        index.refresh(diagrams, rules_path)
+        return index
+
+    def refresh(self, diagrams: List[DiagramFile], rules_path: Optional[str] = None) -> List[str]:
+        """Follow the diagrams as they are now: parse the ones that are new or
+        whose content changed, drop the ones that are gone and update the
+        index once for all of them. Returns the keys of the changed diagrams"""
+        changed = []
+        contributions = {}
+        for diagram in diagrams:
+            key = str(diagram.path)
+            content_hash = file_hash(str(diagram.path))
+            if key in self.files and self.files[key][0] == content_hash:
+                continue
+            changed.append(key)
+            contributions[key] = self._contribution(parse_diagram(diagram, rules_path), content_hash)
+        keys = {str(diagram.path) for diagram in diagrams}
+        for key in self.files:
+            if key not in keys:
+                changed.append(key)
+                contributions[key] = None
+        if changed:
+            self._apply(contributions)
+        return changed
+
+    def update_file(self, key: str, parser: MermaidParser, content_hash: Optional[str] = None) -> None:
+        """Replace what diagram key contributes by the result of its parser"""
+        self._apply({key: self._contribution(parser, content_hash)})
+
+    def remove_file(self, key: str) -> None:
+        """Drop everything diagram key contributes"""
+        self._apply({key: None})
+
+    def depends_on(self, source: str, target: str) -> bool:
+        """True if a chain of relationships leads from source to target"""
+        return bool(self.reach[self._component_of(source)] >> self._component_of(target) & 1)
+
+    def upstream(self, node_id: str) -> List[str]:
+        """Every node node_id depends on, directly or through others"""
+        return self._nodes_of(self.reach[self._component_of(node_id)], node_id)
+
+    def blast_radius(self, node_id: str) -> List[str]:
+        """Every node depending on node_id, directly or through others"""
+        return self._nodes_of(self.reached_by[self._component_of(node_id)], node_id)
+
+    def dependency_chain(self, source: str, target: str) -> Optional[List[str]]:
+        """A shortest chain of relationships from source to target, None if
+        there is none. Only nodes that reach target are searched"""
+        if not self.depends_on(source, target):
+            return None
+        target_bit = self._component_of(target)
+        parents: Dict[str, Optional[str]] = {source: None}
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for successor in self.successors.get(node, ()):
+                    if successor in parents:
+                        continue
+                    if successor == target:
+                        chain = [target, node]
+                        while parents[chain[-1]] is not None:
+                            chain.append(parents[chain[-1]])
+                        return chain[::-1]
+                    if self.reach[self.component[successor]] >> target_bit & 1:
+                        parents[successor] = node
+                        next_frontier.append(successor)
+            frontier = next_frontier
+        return None
+
+    def strongly_connected(self, node_id: str) -> List[str]:
+        """The nodes on a cycle with node_id (node_id alone if there is none)"""
+        return sorted(self.members[self._component_of(node_id)])
+
+    def cycles(self) -> List[List[str]]:
+        """The strongly connected components of more than one node"""
+        return sorted(sorted(members) for members in self.members if members is not None and len(members) > 1)
+
+    def stats(self) -> Dict[str, int]:
+        """Size of the index: nodes, relationships, components and bitset bytes"""
+        components = [c for c, members in enumerate(self.members) if members is not None]
+        return {
+            'nodes': len(self.component),
+            'relationships': sum(len(targets) for targets in self.successors.values()),
+            'components': len(components),
+            'cyclic_components': sum(1 for c in components if self.reach[c] >> c & 1),
+            'reachable_pairs': sum(self.reach[c].bit_count() for c in components),
+            'bitset_bytes': sum((self.reach[c].bit_length() + self.reached_by[c].bit_length() + 7) // 8
+                                for c in components),
+        }
+
+    def _component_of(self, node_id: str) -> int:
+        try:
+            return self.component[node_id]
+        except KeyError:
+            raise KeyError(f"Unknown component id: {node_id}") from None
+
+    def _nodes_of(self, bits: int, exclude: str) -> List[str]:
+        return sorted(node for c in bit_positions(bits) for node in self.members[c] if node != exclude)
+
+    def _contribution(self, parser: MermaidParser, content_hash: Optional[str]):
+        nodes = set(parser.nodes) | set(parser.referenced)
+        pairs: Dict[Tuple[str, str], int] = {}
+        for source, rel_type, target in parser.relationships:
+            if self.relationship_types is None or rel_type in self.relationship_types:
+                pairs[source, target] = pairs.get((source, target), 0) + 1
+        return content_hash, nodes, pairs
+
+    def _apply(self, contributions: Dict[str, Optional[tuple]]) -> None:
+        """Swap the contributions of some diagrams (None removes one) and
+        relabel the components that reach a changed relationship"""
+        changed_sources: Set[str] = set()
+        added_nodes: List[str] = []
+        removed_nodes: Set[str] = set()
+        for key, contribution in contributions.items():
+            _, old_nodes, old_pairs = self.files.pop(key, (None, set(), {}))
+            _, new_nodes, new_pairs = contribution or (None, set(), {})
+            if contribution is not None:
+                self.files[key] = contribution
+            for node in new_nodes - old_nodes:
+                count = self.node_files.get(node, 0)
+                self.node_files[node] = count + 1
+                if count == 0:
+                    added_nodes.append(node)
+                    removed_nodes.discard(node)
+            for node in old_nodes - new_nodes:
+                self.node_files[node] -= 1
+                if self.node_files[node] == 0:
+                    del self.node_files[node]
+                    removed_nodes.add(node)
+            for pair in old_pairs.keys() | new_pairs.keys():
+                delta = new_pairs.get(pair, 0) - old_pairs.get(pair, 0)
+                if delta:
+                    self._count_relationship(pair, delta, changed_sources)
+
+        # Components that could reach a changed relationship: the ones of its
+        # source and everything reaching them. No other component does, so
+        # their reach cannot change, and new chains start in one of these
+        upstream_bits = 0
+        for node in changed_sources | removed_nodes | set(added_nodes):
+            c = self.component.get(node)
+            if c is not None:
+                upstream_bits |= 1 << c | self.reached_by[c]
+        old_components = bit_positions(upstream_bits)
+        affected = {node for c in old_components for node in self.members[c]}
+        affected.update(added_nodes)
+        affected -= removed_nodes
+
+        # Release the old components. Components they reached forget them
+        old_reach = 0
+        for c in old_components:
+            old_reach |= self.reach[c]
+        for c in bit_positions(old_reach & ~upstream_bits):
+            self.reached_by[c] &= ~upstream_bits
+        for c in old_components:
+            for node in self.members[c]:
+                del self.component[node]
+            self.members[c] = None
+            self.reach[c] = 0
+            self.reached_by[c] = 0
+            self.free.append(c)
+
+        # Condense what is affected again, successors first, so each
+        # component ORs the finished bitsets of the components it points to
+        order = [node for node in self.node_files if node in affected]
+        new_components = []
+        for members in self._strongly_connected(order, affected):
+            c = self.free.pop() if self.free else self._new_component()
+            self.members[c] = members
+            for node in members:
+                self.component[node] = c
+            bits = 1 << c if len(members) > 1 else 0
+            for node in members:
+                for successor in self.successors.get(node, ()):
+                    d = self.component[successor]
+                    if d == c:
+                        bits |= 1 << c
+                    else:
+                        bits |= 1 << d | self.reach[d]
+            self.reach[c] = bits
+            new_components.append(c)
+
+        # Who reaches a component changes (or is renumbered) only downstream
+        # of the new components; predecessors first, so each one ORs the
+        # finished bitsets of the components pointing to it
+        for c in self._topological(new_components):
+            bits = 1 << c if self.reach[c] >> c & 1 else 0
+            for node in self.members[c]:
+                for predecessor in self.predecessors.get(node, ()):
+                    d = self.component[predecessor]
+                    if d != c:
+                        bits |= 1 << d | self.reached_by[d]
+            self.reached_by[c] = bits
+
+    def _count_relationship(self, pair: Tuple[str, str], delta: int, changed_sources: Set[str]) -> None:
+        source, target = pair
+        targets = self.successors.setdefault(source, {})
+        count = targets.get(target, 0) + delta
+        if count:
+            targets[target] = count
+            self.predecessors.setdefault(target, set()).add(source)
+        else:
+            del targets[target]
+            if not targets:
+                del self.successors[source]
+            sources = self.predecessors[target]
+            sources.discard(source)
+            if not sources:
+                del self.predecessors[target]
+        # Only a relationship appearing or disappearing changes reachability
+        if (count == 0) != (count == delta):
+            changed_sources.add(source)
+
+    def _new_component(self) -> int:
+        self.members.append(None)
+        self.reach.append(0)
+        self.reached_by.append(0)
+        return len(self.members) - 1
+
+    def _topological(self, roots: List[int]) -> List[int]:
+        """The components reachable from roots, each after the ones of them
+        pointing to it (reversed depth-first postorder)"""
+        seen: Set[int] = set()
+        postorder = []
+        for root in roots:
+            if root in seen:
+                continue
+            seen.add(root)
+            work = [(root, iter(self._component_successors(root)))]
+            while work:
+                c, successors = work[-1]
+                for d in successors:
+                    if d not in seen:
+                        seen.add(d)
+                        work.append((d, iter(self._component_successors(d))))
+                        break
+                else:
+                    work.pop()
+                    postorder.append(c)
+        return postorder[::-1]
+
+    def _component_successors(self, c: int) -> Set[int]:
+        return {self.component[successor] for node in self.members[c]
+                for successor in self.successors.get(node, ())} - {c}
+
+    def _strongly_connected(self, order: List[str], nodes: Set[str]) -> List[List[str]]:
+        """Strongly connected components of the nodes (relationships leaving
+        them are ignored) in reverse topological order: iterative Tarjan"""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components = []
+        for root in order:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.successors.get(root, ())))]
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if successor not in nodes:
+                        continue
+                    if successor not in index:
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.successors.get(successor, ()))))
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            members.append(member)
+                            if member == node:
+                                break
+                        components.append(members)
+        return components
+
+QUERIES = ('depends-on', 'upstream', 'blast-radius', 'chain', 'cycles', 'stats')
+
+def main():
+    parser = argparse.ArgumentParser(description='Transitive dependency queries over the RHACM Mermaid graphs')
+    parser.add_argument('query', choices=QUERIES,
+                        help='depends-on A B: does A depend on B; upstream X: everything X depends on; '
+                             'blast-radius X: everything depending on X; chain A B: a shortest dependency '
+                             'chain; cycles: components depending on each other; stats: index size')
+    parser.add_argument('ids', nargs='*', help='Component ids of the query')
+    parser.add_argument('--input-dir', default='.', help='Directory containing Mermaid files')
+    parser.add_argument('--glob', default=DEFAULT_GLOB, help='Mermaid files to index, relative to --input-dir')
+    parser.add_argument('--rules', help='Node type / deployment model rule table (JSON)')
+    parser.add_argument('--type', dest='relationship_types', action='append', metavar='TYPE',
+                        help='Only follow relationships of TYPE (repeatable, default: every type)')
+    parser.add_argument('--json', action='store_true', help='Print the answer as JSON')
+    args = parser.parse_args()
+
+    arity = {'depends-on': 2, 'chain': 2, 'upstream': 1, 'blast-radius': 1}.get(args.query, 0)
+    if len(args.ids) != arity:
+        parser.error(f"{args.query} takes {arity} component id(s)")
+    diagrams = discover_diagrams(Path(args.input_dir), args.glob)
+    if not diagrams:
+        print(f"❌ Error: No Mermaid files match {args.glob} in {args.input_dir}!", file=sys.stderr)
+        return 1
+    # The parser reports its progress on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        index = ReachabilityIndex.from_diagrams(diagrams, args.rules, args.relationship_types)
+
+    try:
+        if args.query == 'depends-on':
+            answer = index.depends_on(*args.ids)
+        elif args.query == 'upstream':
+            answer = index.upstream(*args.ids)
+        elif args.query == 'blast-radius':
+            answer = index.blast_radius(*args.ids)
+        elif args.query == 'chain':
+            answer = index.dependency_chain(*args.ids)
+        elif args.query == 'cycles':
+            answer = index.cycles()
+        else:
+            answer = index.stats()
+    except KeyError as e:
+        print(f"❌ Error: {e.args[0]}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(answer, indent=1))
+    elif isinstance(answer, bool):
+        print('yes' if answer else 'no')
+    elif answer is None:
+        print('no chain')
+    elif args.query == 'chain':
+        print(' -> '.join(answer))
+    elif args.query == 'cycles':
+        for members in answer:
+            print(', '.join(members))
+    elif args.query == 'stats':
+        for name, value in answer.items():
+            print(f"{name}: {value}")
+    else:
+        for node_id in answer:
+            print(node_id)
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,220 @@
+"""
+Throughput of the async loader against a stand-in neo4j driver, on the
+input/*.graphml files plus the Mermaid architecture scaled up with renamed
+copies (--copies) and a synthetic hub-heavy graph on top (--edges).
+
+The stand-in driver records every statement and emulates a server with
+--cores processors: a transaction takes a fixed round trip plus a per-row
+cost, at most --cores of them make progress at once, and a transaction that
+touches a node another in-flight transaction has locked fails with a
+transient deadlock error after half its run time and is retried after a
+jittered backoff, the way execute_write retries DeadlockDetected. It compares
+
+  serial      one transaction at a time, what --bulk does
+  contiguous  --concurrency transactions over plain row chunks
+  disjoint    async_load: endpoint-disjoint edge rounds
+
+and checks that every run MERGEd exactly the input's nodes and edges.
+
+Usage: python bench/async_load.py [--copies N] [--edges M] [--cores C]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(REPO_DIR, "src"))
+
+import async_loader
+import main as kg
+from async_loader import async_load, disjoint_edge_rounds
+from bulk_loader import group_graph, group_mermaid, batches
+
+ROUND_TRIP = 0.002
+ROW_COST = 0.00002
+
+
+class DeadlockDetected(Exception):
+    pass
+
+
+class StandInDriver:
+    """Records statements and emulates lock conflicts and server cores."""
+
+    def __init__(self, cores):
+        self.cores = cores
+        self.cpu = None
+        self.locks = {}
+        self.nodes = set()
+        self.edges = set()
+        self.transactions = 0
+        self.retries = 0
+        self.rng = random.Random(3)
+
+    async def execute_query(self, query, **params):
+        if query == async_loader.SERVER_CORES_QUERY:
+            return [{"cores": self.cores}], None, None
+        return [], None, None
+
+    def session(self, database=None):
+        return StandInSession(self)
+
+
+class StandInSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute_write(self, work, query, rows):
+        driver = self.driver
+        if driver.cpu is None:
+            driver.cpu = asyncio.Semaphore(driver.cores)
+        attempt = 0
+        while True:
+            tx = StandInTransaction(driver)
+            try:
+                async with driver.cpu:
+                    return await work(tx, query, rows)
+            except DeadlockDetected:
+                driver.retries += 1
+            finally:
+                tx.release()
+            # Jittered exponential backoff like the driver's retry loop,
+            # scaled down to the emulated round trip
+            attempt += 1
+            await asyncio.sleep(ROUND_TRIP * min(2 ** attempt, 64) * driver.rng.uniform(0.8, 1.2))
+
+
+class StandInTransaction:
+    def __init__(self, driver):
+        self.driver = driver
+        self.held = []
+
+    async def run(self, query, rows):
+        driver = self.driver
+        driver.transactions += 1
+        duration = ROUND_TRIP + ROW_COST * len(rows)
+        isEdge = "MATCH" in query
+        nodes = [node for row in rows for node in ((row["source"], row["dest"]) if isEdge else (row["key"],))]
+        conflict = any(node in driver.locks for node in nodes)
+        for node in nodes:
+            if node not in driver.locks:
+                driver.locks[node] = self
+                self.held.append(node)
+        if conflict:
+            await asyncio.sleep(duration / 2)
+            raise DeadlockDetected()
+        await asyncio.sleep(duration)
+        if isEdge:
+            label = query.split("]->")[0].rsplit(":", 1)[1]
+            driver.edges.update((row["source"], label, row["dest"]) for row in rows)
+        else:
+            driver.nodes.update(row["key"] for row in rows)
+        return self
+
+    async def consume(self):
+        return None
+
+    def release(self):
+        for node in self.held:
+            del self.driver.locks[node]
+        self.held = []
+
+
+def contiguous_rounds(edgeGroups, batchSize, concurrency):
+    # Plain chunks of each group, concurrency of them at a time
+    chunks = [(group, batch) for group, rows in edgeGroups.items() for batch in batches(rows, batchSize)]
+    return [chunks[start:start + concurrency] for start in range(0, len(chunks), concurrency)]
+
+
+def scaled_groups(copies, edgeCount, seed=11):
+    nodeGroups, edgeGroups = {}, {}
+    for filename in sorted(os.listdir(os.path.join(REPO_DIR, "input"))):
+        group_graph(kg.loadGraph(filename), nodeGroups, edgeGroups)
+    mermaid = kg.parse_mermaid(1)
+    baseNodes, baseEdges = {}, {}
+    group_mermaid(mermaid, baseNodes, baseEdges)
+    for copy in range(copies):
+        suffix = "" if copy == 0 else "_%d" % copy
+        for label, rows in baseNodes.items():
+            nodeGroups.setdefault(label, []).extend(
+                {"key": row["key"] + suffix, "props": row["props"]} for row in rows)
+        for group, rows in baseEdges.items():
+            edgeGroups.setdefault(group, []).extend(
+                {"source": row["source"] + suffix, "dest": row["dest"] + suffix} for row in rows)
+
+    # A few hubs take a large share of the synthetic edges, like the
+    # controllers and APIs of the real graphs
+    rng = random.Random(seed)
+    nodeCount = max(1, edgeCount // 5)
+    nodeGroups.setdefault("Synthetic", []).extend(
+        {"key": "s%d" % i, "props": {"name": "s%d" % i}} for i in range(nodeCount))
+    hubs = ["s%d" % i for i in range(min(20, nodeCount))]
+    for _ in range(edgeCount):
+        source = rng.choice(hubs) if rng.random() < 0.3 else "s%d" % rng.randrange(nodeCount)
+        edgeGroups.setdefault((rng.choice(("USES", "WATCHES", "CREATES")), "Synthetic", "Synthetic"), []).append(
+            {"source": source, "dest": "s%d" % rng.randrange(nodeCount)})
+    return nodeGroups, edgeGroups
+
+
+def expected(nodeGroups, edgeGroups):
+    nodes = {row["key"] for rows in nodeGroups.values() for row in rows}
+    edges = {(row["source"], group[0], row["dest"]) for group, rows in edgeGroups.items() for row in rows}
+    return nodes, edges
+
+
+def run(nodeGroups, edgeGroups, cores, batchSize, concurrency, rounds):
+    driver = StandInDriver(cores)
+    async_loader.disjoint_edge_rounds = rounds
+    try:
+        started = time.perf_counter()
+        asyncio.run(async_load(driver, nodeGroups, edgeGroups, batchSize, concurrency))
+        elapsed = time.perf_counter() - started
+    finally:
+        async_loader.disjoint_edge_rounds = disjoint_edge_rounds
+    return driver, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="async loader benchmark with a stand-in driver")
+    parser.add_argument("--copies", type=int, default=20, help="Renamed copies of the Mermaid graph")
+    parser.add_argument("--edges", type=int, default=50000, help="Synthetic edges added on top")
+    parser.add_argument("--cores", type=int, default=8, help="Processors of the emulated server")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    nodeGroups, edgeGroups = scaled_groups(args.copies, args.edges)
+    nodes, edges = expected(nodeGroups, edgeGroups)
+    rowCount = sum(len(rows) for rows in edgeGroups.values())
+    print("%d nodes, %d edge rows (%d distinct) in %d groups, %d emulated cores, batches of %d"
+          % (len(nodes), rowCount, len(edges), len(edgeGroups), args.cores, args.batch_size))
+
+    started = time.perf_counter()
+    planned = disjoint_edge_rounds(edgeGroups, args.batch_size, args.cores)
+    print("disjoint_edge_rounds: %d rounds, %d batches in %.3fs"
+          % (len(planned), sum(len(r) for r in planned), time.perf_counter() - started))
+
+    baseline = None
+    for name, concurrency, rounds in (("serial", 1, disjoint_edge_rounds),
+                                      ("contiguous", args.cores, contiguous_rounds),
+                                      ("disjoint", None, disjoint_edge_rounds)):
+        driver, elapsed = run(nodeGroups, edgeGroups, args.cores, args.batch_size, concurrency, rounds)
+        if (driver.nodes, driver.edges) != (nodes, edges):
+            sys.exit("%s: the stand-in graph differs from the input" % name)
+        baseline = baseline or elapsed
+        print("%-10s %8.3fs %9.0f rows/s %6d transactions %6d deadlock retries  speedup %.1fx"
+              % (name, elapsed, (len(nodes) + rowCount) / elapsed, driver.transactions, driver.retries,
+                 baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
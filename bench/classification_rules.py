@@ -0,0 +1,290 @@
+"""
+Checks the rule-table classification (classification_rules.json compiled by
+ClassificationRules) against the hard-coded if/elif chains it replaced, and
+times a full conversion (parse and merge every diagram, generate the script)
+with each.
+
+* every node of the mermaid/*.mmd corpus and a few thousand synthetic labels
+  built from the rule keywords must get the same node type and deployment
+  model from both;
+* the script generated with the default options must be byte-identical to
+  knowledge-graph/rhacm_architecture_comprehensive_final.cypher.
+
+Exits non-zero on the first difference.
+
+Usage: python bench/classification_rules.py [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ANALYSIS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                            "acm", "agentic-docs", "dependency-analysis")
+sys.path.insert(0, ANALYSIS_DIR)
+
+from mermaid_to_cypher import (ClassificationRules, CypherGenerator, MermaidParser, DEFAULT_RULES_PATH,
+                               OVERVIEW_SUBSYSTEM, discover_diagrams, parse_diagrams)
+
+COMMITTED_SCRIPT = os.path.join(ANALYSIS_DIR, "knowledge-graph", "rhacm_architecture_comprehensive_final.cypher")
+SUBSYSTEMS = ("Overview", "Governance", "Application", "Observability", "Cluster", "Search", "Console")
+KEYWORDS = ("operator", "controller", "api", "cluster", "policy", "prometheus", "grafana", "thanos",
+            "application", "subscription", "search", "manager", "addon", "Cluster", "API", "x", "-", " ")
+
+
+class LegacyClassifier:
+    # MermaidParser's classification before the rule table
+
+    def _determine_node_type(self, label: str) -> str:
+        """Determine node type based on label content"""
+        label_lower = label.lower()
+
+        if 'operator' in label_lower:
+            return 'Operator'
+        elif 'controller' in label_lower:
+            return 'Controller'
+        elif 'api' in label_lower:
+            return 'API'
+        elif 'cluster' in label_lower:
+            return 'Cluster'
+        elif 'policy' in label_lower:
+            return 'Policy'
+        elif 'prometheus' in label_lower or 'grafana' in label_lower or 'thanos' in label_lower:
+            return 'Observability'
+        elif 'application' in label_lower or 'subscription' in label_lower:
+            return 'Application'
+        elif 'search' in label_lower:
+            return 'Search'
+        else:
+            return 'Component'
+
+    def _classify_deployment_model(self, node_id: str, label: str, subsystem: str) -> dict:
+        """Classify component's deployment model and patterns"""
+        label_lower = label.lower()
+        node_id_lower = node_id.lower()
+
+        # Subscription Model Components
+        if node_id in ['MULTICLOUD_OPS_SUBSCRIPTION', 'MULTICLOUD_OPS_CHANNEL', 'APPLICATION_MANAGER']:
+            return {
+                'model': 'subscription',
+                'pattern': 'hub_stream_sync',
+                'role': self._get_subscription_role(node_id)
+            }
+
+        # Channel Types (part of Subscription Model)
+        if node_id in ['GIT_CHANNEL', 'HELM_CHANNEL', 'OBJECTSTORAGE_CHANNEL']:
+            return {
+                'model': 'subscription',
+                'pattern': 'content_streaming',
+                'role': 'content_source'
+            }
+
+        # ArgoCD Push Model Components
+        if node_id in ['MULTICLOUD_INTEGRATIONS', 'GITOPS_CLUSTER_CTRL', 'GITOPS_SYNC_RESOURCE_CTRL',
+                       'STATUS_AGGREGATION_CTRL', 'PROPAGATION_CTRL', 'GITOPS_ADDON_CTRL']:
+            return {
+                'model': 'argocd_push',
+                'pattern': 'hub_orchestrated',
+                'role': self._get_push_role(node_id)
+            }
+
+        # ArgoCD Pull Model Components
+        if node_id in ['ARGOCD_PULL_INTEGRATION', 'APPLICATION_CTRL', 'APPLICATION_STATUS_CTRL', 'CLUSTER_CTRL']:
+            return {
+                'model': 'argocd_pull',
+                'pattern': 'spoke_autonomous',
+                'role': self._get_pull_role(node_id)
+            }
+
+        # GitOps Operator (serves both ArgoCD models)
+        if node_id == 'GITOPS_OPERATOR':
+            return {
+                'model': 'argocd_push,argocd_pull',
+                'pattern': 'gitops_reconciliation',
+                'role': 'application_deployer'
+            }
+
+        # Cross-cluster components
+        if 'cluster' in label_lower and subsystem == 'Cluster':
+            return {
+                'model': 'multi_model',
+                'pattern': 'cross_cluster',
+                'role': 'cluster_manager'
+            }
+
+        # Hub-centric components
+        if subsystem in ['Overview', 'Console'] or 'manager' in label_lower:
+            return {
+                'model': 'hub_centric',
+                'pattern': 'centralized_management',
+                'role': 'hub_service'
+            }
+
+        # Addon components (deployed to spokes)
+        if 'addon' in label_lower or node_id.endswith('_ADDON'):
+            return {
+                'model': 'addon_framework',
+                'pattern': 'hub_to_spoke_deployment',
+                'role': 'spoke_service'
+            }
+
+        # Default classification
+        return {
+            'model': '',
+            'pattern': '',
+            'role': ''
+        }
+
+    def _get_subscription_role(self, node_id: str) -> str:
+        """Get role for subscription model components"""
+        role_map = {
+            'MULTICLOUD_OPS_SUBSCRIPTION': 'content_consumer',
+            'MULTICLOUD_OPS_CHANNEL': 'content_router',
+            'APPLICATION_MANAGER': 'deployment_executor'
+        }
+        return role_map.get(node_id, 'subscription_component')
+
+    def _get_push_role(self, node_id: str) -> str:
+        """Get role for ArgoCD push model components"""
+        role_map = {
+            'MULTICLOUD_INTEGRATIONS': 'integration_orchestrator',
+            'GITOPS_CLUSTER_CTRL': 'cluster_onboarder',
+            'GITOPS_SYNC_RESOURCE_CTRL': 'sync_coordinator',
+            'STATUS_AGGREGATION_CTRL': 'status_collector',
+            'PROPAGATION_CTRL': 'deployment_propagator',
+            'GITOPS_ADDON_CTRL': 'addon_lifecycle_manager'
+        }
+        return role_map.get(node_id, 'push_component')
+
+    def _get_pull_role(self, node_id: str) -> str:
+        """Get role for ArgoCD pull model components"""
+        role_map = {
+            'ARGOCD_PULL_INTEGRATION': 'pull_orchestrator',
+            'APPLICATION_CTRL': 'application_watcher',
+            'APPLICATION_STATUS_CTRL': 'status_syncer',
+            'CLUSTER_CTRL': 'cluster_coordinator'
+        }
+        return role_map.get(node_id, 'pull_component')
+
+
+class LegacyRules(LegacyClassifier):
+    # The if/elif chains behind the interface MermaidParser uses
+
+    def classify(self, node_id, label, subsystem):
+        return legacy_classify(self, node_id, label, subsystem)
+
+    def node_type(self, label):
+        return self._determine_node_type(label)
+
+
+def load_table():
+    with open(DEFAULT_RULES_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def corpus_nodes():
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser = parse_diagrams(discover_diagrams(Path(ANALYSIS_DIR)))
+    return [(node.id, node.label, node.subsystem) for node in parser.nodes.values()]
+
+
+def synthetic_nodes(ids, count, seed=13):
+    # Labels glued together from the rule keywords, so several rules compete
+    rng = random.Random(seed)
+    nodes = []
+    for _ in range(count):
+        label = "".join(rng.choice(KEYWORDS) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            nodeId = rng.choice(ids)
+        else:
+            nodeId = rng.choice(("COMPONENT_", "EXTRA_ADDON", "ADDON_")) + str(rng.randrange(10))
+        nodes.append((nodeId, label, rng.choice(SUBSYSTEMS)))
+    return nodes
+
+
+def legacy_classify(legacy, nodeId, label, subsystem):
+    model = legacy._classify_deployment_model(nodeId, label, subsystem)
+    return (legacy._determine_node_type(label), model["model"], model["pattern"], model["role"])
+
+
+def check_classification(nodes, rules):
+    legacy = LegacyClassifier()
+    for nodeId, label, subsystem in nodes:
+        expected = legacy_classify(legacy, nodeId, label, subsystem)
+        actual = rules.classify(nodeId, label, subsystem)
+        if expected != actual:
+            print("MISMATCH %r: legacy %r, rules %r" % ((nodeId, label, subsystem), expected, actual))
+            return False
+    return True
+
+
+def check_script():
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "generated.cypher")
+        subprocess.run([sys.executable, os.path.join(ANALYSIS_DIR, "mermaid_to_cypher.py"),
+                        "--input-dir", ANALYSIS_DIR, "--output", output],
+                       check=True, stdout=subprocess.DEVNULL)
+        with open(output, "rb") as generated, open(COMMITTED_SCRIPT, "rb") as committed:
+            return generated.read() == committed.read()
+
+
+def convert(diagrams, rules):
+    # What mermaid_to_cypher.py does with the default options, in-process:
+    # every node is classified once, when its file is parsed
+    merged = MermaidParser(rules)
+    for diagram in diagrams:
+        partial = MermaidParser(rules)
+        partial.parse_mermaid_file(diagram.path, diagram.subsystem)
+        merged.merge(partial, overview=diagram.subsystem == OVERVIEW_SUBSYSTEM)
+    merged.add_referenced_nodes()
+    CypherGenerator(merged.nodes, list(merged.relationships.values()), merged.class_definitions).generate_cypher_script()
+    return len(merged.nodes)
+
+
+def time_conversions(diagrams, rule_sets, repeat):
+    """Best wall time of repeat full conversions with each of rule_sets,
+    taken in turns so drift hits all of them alike, and the node count."""
+    best = [None] * len(rule_sets)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            for i, rules in enumerate(rule_sets):
+                started = time.perf_counter()
+                nodes = convert(diagrams, rules)
+                elapsed = time.perf_counter() - started
+                best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    return best, nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classification rule table check and benchmark")
+    parser.add_argument("--repeat", type=int, default=50, help="Full conversions per timing (the best one counts)")
+    args = parser.parse_args()
+
+    nodes = corpus_nodes()
+    synthetic = synthetic_nodes([nodeId for nodeId, _, _ in nodes], 5000)
+    if not check_classification(nodes + synthetic, ClassificationRules(load_table())):
+        return 1
+    print("classification identical for %d corpus nodes and %d synthetic labels" % (len(nodes), len(synthetic)))
+    if not check_script():
+        print("MISMATCH: generated script differs from %s" % COMMITTED_SCRIPT)
+        return 1
+    print("generated script identical to the committed one")
+
+    diagrams = discover_diagrams(Path(ANALYSIS_DIR))
+    names = ("if/elif chains", "compiled rules")
+    best, count = time_conversions(diagrams, (LegacyRules(), ClassificationRules(load_table())), args.repeat)
+    print("full conversion of %d diagrams (%d nodes), best of %d" % (len(diagrams), count, args.repeat))
+    for name, seconds in zip(names, best):
+        print("%-15s %8.2f ms  %6.2f us/node  %5.2fx" % (name, seconds * 1e3, seconds / count * 1e6, best[0] / seconds))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
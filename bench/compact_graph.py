@@ -0,0 +1,158 @@
+"""
+Memory and traversal speed of the CSR graph (src/compact_graph.py) against
+a networkx MultiDiGraph holding the same nodes and relationships with the
+attributes loadGraph would give them, on a synthetic graph with a power-law
+degree distribution (bench/suite/generators.py).
+
+Memory is what tracemalloc sees allocated while each structure is built and
+still held; the node id and label strings are created beforehand and shared
+by both. Traversal is a breadth-first search from the biggest hub and a
+sweep over every node's out-neighbors one node at a time; the aggregations are out-degree per
+relationship type and relationships per (subsystem, subsystem, type).
+
+Usage: python bench/compact_graph.py [--edges M] [--nodes N] [--distribution uniform|powerlaw]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import networkx as nx
+import numpy as np
+
+from bench.suite import generators
+from compact_graph import CompactGraphBuilder
+
+SUBSYSTEMS = ("Overview", "Governance", "Observability", "Console", "Application", "Search", "Cluster")
+
+
+def synthetic(nodeCount, edgeCount, distribution, seed=1):
+    rng = random.Random(seed)
+    entities = generators.glossary_entities()
+    nodes = [("node-%d" % i, "component-%d" % i, rng.choice(entities), rng.choice(SUBSYSTEMS))
+             for i in range(nodeCount)]
+    edges = [(source, rng.choice(generators.VERBS), target)
+             for source, target in generators.endpoints(rng, nodeCount, edgeCount, distribution)]
+    return nodes, edges
+
+
+def build_networkx(nodes, edges):
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from((nodeId, {"name": label, "entity": entity, "subsystem": subsystem})
+                         for nodeId, label, entity, subsystem in nodes)
+    graph.add_edges_from((nodes[source][0], nodes[target][0], {"verb": verb}) for source, verb, target in edges)
+    return graph
+
+
+def build_compact(nodes, edges):
+    builder = CompactGraphBuilder()
+    for nodeId, label, entity, subsystem in nodes:
+        builder.add_node(nodeId, label, subsystem, entity)
+    for source, verb, target in edges:
+        builder.add_relationship(nodes[source][0], verb, nodes[target][0])
+    return builder.build()
+
+
+def held_bytes(build, *args):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(*args)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def bfs_networkx(graph, start):
+    return len(nx.descendants(graph, start)) + 1
+
+
+def bfs_compact(graph, start):
+    seen = np.zeros(graph.node_count, dtype=bool)
+    seen[start] = True
+    frontier = np.array([start])
+    while frontier.size:
+        neighbors = np.unique(graph.out_neighbors_of(frontier))
+        frontier = neighbors[~seen[neighbors]]
+        seen[frontier] = True
+    return int(seen.sum())
+
+
+def sweep_networkx(graph):
+    return sum(len(keys) for node in graph for keys in graph.succ[node].values())
+
+
+def sweep_compact(graph):
+    return sum(graph.out_neighbors(i).size for i in range(graph.node_count))
+
+
+def degrees_networkx(graph):
+    return Counter((node, verb) for node, _, verb in graph.edges(data="verb"))
+
+
+def degrees_compact(graph):
+    return graph.degrees_by_type()[0]
+
+
+def cross_networkx(graph):
+    subsystems = graph.nodes(data="subsystem")
+    return Counter((subsystems[source], subsystems[target], verb) for source, target, verb in graph.edges(data="verb")
+                   if subsystems[source] != subsystems[target])
+
+
+def cross_compact(graph):
+    return graph.cross_subsystem_counts()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSR graph against networkx")
+    parser.add_argument("--edges", type=int, default=1000000)
+    parser.add_argument("--nodes", type=int)
+    parser.add_argument("--distribution", choices=generators.DISTRIBUTIONS, default=generators.DEFAULT_DISTRIBUTION)
+    args = parser.parse_args()
+
+    nodeCount = args.nodes or generators.default_nodes(args.edges)
+    nodes, edges = synthetic(nodeCount, args.edges, args.distribution)
+    print("%d nodes, %d relationships (%s)" % (nodeCount, args.edges, args.distribution))
+
+    graph, graphBytes = held_bytes(build_networkx, nodes, edges)
+    compact, compactBytes = held_bytes(build_compact, nodes, edges)
+    print("%-24s %12s %12s" % ("", "networkx", "csr"))
+    print("%-24s %10.1fMB %10.1fMB  (%.0f vs %.0f bytes per relationship; csr arrays %.1fMB)"
+          % ("memory", graphBytes / 1e6, compactBytes / 1e6, graphBytes / args.edges, compactBytes / args.edges,
+             compact.nbytes() / 1e6))
+
+    hub = int(np.argmax(compact.out_degree()))
+    checks = (("bfs from hub", bfs_networkx, (graph, nodes[hub][0]), bfs_compact, (compact, hub)),
+              ("out-neighbor sweep", sweep_networkx, (graph,), sweep_compact, (compact,)),
+              ("degree per type", degrees_networkx, (graph,), degrees_compact, (compact,)),
+              ("cross-subsystem counts", cross_networkx, (graph,), cross_compact, (compact,)))
+    for name, graphFunction, graphArgs, compactFunction, compactArgs in checks:
+        graphResult, graphTime = timed(graphFunction, *graphArgs)
+        compactResult, compactTime = timed(compactFunction, *compactArgs)
+        if name == "degree per type":
+            # {(node id, type): count} for both
+            graphResult = dict(graphResult)
+            compactResult = {(compact.ids[i], compact.relTypeNames[code]): int(compactResult[code, i])
+                             for code, i in zip(*np.nonzero(compactResult))}
+        if graphResult != compactResult:
+            sys.exit("%s: networkx %r, csr %r" % (name, graphResult, compactResult))
+        print("%-24s %10.3fs  %10.3fs  %6.1fx" % (name, graphTime, compactTime, graphTime / compactTime))
+
+
+if __name__ == "__main__":
+    main()
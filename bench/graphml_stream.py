@@ -0,0 +1,104 @@
+"""
+Peak memory and time of loading one large synthetic GraphML file through
+nx.read_graphml + bulk_add_graph versus the streaming reader
+(graphml_stream.stream_groups + bulk_add_chunks), against a driver that
+only records the rows it is sent. Both must send the same rows.
+
+Peak memory is measured with tracemalloc, which also slows both runs down;
+the times are from separate runs without it.
+
+Usage: python bench/graphml_stream.py [--nodes N] [--edges M] [--chunk-size C]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import networkx as nx
+
+from bulk_loader import bulk_add_graph, bulk_add_chunks
+from graphml_stream import stream_groups
+from node_lookup import write_synthetic_graphml
+
+
+class RecordingDriver:
+    """Keeps an order independent checksum and count of the rows of every
+    statement, in constant memory; sessions run the work inline."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def execute_query(self, query, **params):
+        return [], None, None
+
+    def session(self, database=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work, query, rows):
+        checksum, count = self.rows.get(query, (0, 0))
+        for row in rows:
+            checksum = (checksum + hash(repr(sorted(row.items())))) % (1 << 64)
+        self.rows[query] = (checksum, count + len(rows))
+        return None
+
+
+def load_graph(path):
+    driver = RecordingDriver()
+    propGraph = nx.read_graphml(path)
+    propGraph.graph["source"] = os.path.basename(path)
+    bulk_add_graph(driver, [propGraph])
+    return driver
+
+
+def load_stream(path, chunkSize):
+    driver = RecordingDriver()
+    bulk_add_chunks(driver, stream_groups(path, chunkSize=chunkSize))
+    return driver
+
+
+def measure(load, *args):
+    started = time.perf_counter()
+    driver = load(*args)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    load(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return driver, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="streaming GraphML reader benchmark")
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--edges", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.graphml")
+        write_synthetic_graphml(path, args.nodes, args.edges)
+        print("%d nodes, %d edges, %.1f MB of GraphML" % (args.nodes, args.edges, os.path.getsize(path) / 1e6))
+
+        graphDriver, graphTime, graphPeak = measure(load_graph, path)
+        streamDriver, streamTime, streamPeak = measure(load_stream, path, args.chunk_size)
+
+    if graphDriver.rows != streamDriver.rows:
+        sys.exit("The streaming reader sent different rows")
+    print("read_graphml + bulk_add_graph %8.2fs  peak %7.1f MB" % (graphTime, graphPeak / 1e6))
+    print("stream_groups + bulk_add_chunks %6.2fs  peak %7.1f MB  (chunks of %d)"
+          % (streamTime, streamPeak / 1e6, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Single-pass MermaidTokenizer versus the three-pass parser it replaced, on the
+mermaid/*.mmd corpus of the dependency analysis scaled up (every file
+repeated 1000 times by default).
+
+Both parsers read the same generated files; the node and relationship counts
+and the memory the parsed model retains (tracemalloc, separate run) are
+printed next to the timings. The old parser keeps every repeated edge line,
+the current one a single relationship per (source, type, target).
+
+Usage: python bench/mermaid_parse.py [--scale N] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+ANALYSIS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                            "acm", "agentic-docs", "dependency-analysis")
+sys.path.insert(0, ANALYSIS_DIR)
+
+from mermaid_to_cypher import GraphNode, GraphRelationship, MermaidParser
+
+MERMAID_DIR = os.path.join(ANALYSIS_DIR, "mermaid")
+
+
+class LegacyMermaidParser(MermaidParser):
+    # The parser as it was: a regex pass for nodes, a line pass with split()
+    # and re.sub per arrow for edges and a regex pass for classes, keeping
+    # relationships in a plain list
+
+    def __init__(self):
+        super().__init__()
+        self.relationships = []
+
+    def parse_mermaid_file(self, file_path: Path, subsystem: str) -> None:
+        """Parse a single Mermaid file and extract nodes and relationships"""
+        with open(file_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+
+        # Extract node definitions
+        self._extract_nodes(content, subsystem)
+
+        # Extract relationships
+        self._extract_relationships(content, subsystem)
+
+        # Extract class definitions for styling
+        self._extract_class_definitions(content)
+
+    def _extract_nodes(self, content: str, subsystem: str) -> None:
+        """Extract node definitions from Mermaid content"""
+        # Pattern for node definitions: ID[Label] or ID[Label with spaces]
+        node_pattern = r'(\w+)\[(.*?)\]'
+
+        for match in re.finditer(node_pattern, content):
+            node_id = match.group(1)
+            node_label = match.group(2)
+
+            # Skip if already exists (avoid duplicates across files)
+            if node_id not in self.nodes:
+                model_info = self._classify_deployment_model(node_id, node_label, subsystem)
+                self.nodes[node_id] = GraphNode(
+                    id=node_id,
+                    label=node_label,
+                    subsystem=subsystem,
+                    node_type=self._determine_node_type(node_label),
+                    description=self._generate_description(node_label, subsystem),
+                    deployment_model=model_info['model'],
+                    deployment_pattern=model_info['pattern'],
+                    model_role=model_info['role']
+                )
+
+    def _extract_relationships(self, content: str, subsystem: str) -> None:
+        """Extract relationships from Mermaid content"""
+        lines = content.split('\n')
+
+        for line in lines:
+            line = line.strip()
+
+            # Skip comments and empty lines
+            if line.startswith('%%') or not line or line.startswith('graph') or line.startswith('class'):
+                continue
+
+            # Parse different relationship types
+            relationships = self._parse_relationship_line(line, subsystem)
+            self.relationships.extend(relationships)
+
+    def _parse_relationship_line(self, line: str, subsystem: str) -> List[GraphRelationship]:
+        """Parse a single line for relationships"""
+        relationships = []
+
+        # Solid arrows with semantic labels: -->|LABEL|
+        if '-->|' in line:
+            relationships.extend(self._extract_semantic_relationships(line, '-->|', subsystem))
+        # Regular solid arrows: -->
+        elif '-->' in line:
+            relationships.extend(self._extract_arrow_relationships(line, '-->', 'DEPENDS_ON', subsystem))
+
+        # Dotted arrows with semantic labels: -.->|LABEL|
+        if '-.->|' in line:
+            relationships.extend(self._extract_semantic_relationships(line, '-.->|', subsystem, True))
+        # Regular dotted arrows: -.->
+        elif '-.-> ' in line:
+            relationships.extend(self._extract_arrow_relationships(line, '-.-> ', 'COMMUNICATES_WITH', subsystem, True))
+
+        return relationships
+
+    def _extract_semantic_relationships(self, line: str, arrow_start: str, subsystem: str, cross_cluster: bool = False) -> List[GraphRelationship]:
+        """Extract relationships with semantic labels from arrow notation"""
+        relationships = []
+
+        if arrow_start in line:
+            # Split on the arrow start to get source and target parts
+            parts = line.split(arrow_start)
+            if len(parts) == 2:
+                source = parts[0].strip()
+                target_part = parts[1].strip()
+
+                # Extract the semantic label and target
+                if '|' in target_part:
+                    label_and_target = target_part.split('|', 1)
+                    if len(label_and_target) == 2:
+                        semantic_label = label_and_target[0].strip()
+                        target = label_and_target[1].strip()
+
+                        # Clean up node IDs (remove brackets and labels)
+                        source = re.sub(r'\[.*?\]', '', source).strip()
+                        target = re.sub(r'\[.*?\]', '', target).strip()
+
+                        if source and target and semantic_label:
+                            relationships.append(GraphRelationship(
+                                source=source,
+                                target=target,
+                                relationship_type=semantic_label,
+                                subsystem=subsystem,
+                                is_cross_cluster=cross_cluster
+                            ))
+
+        return relationships
+
+    def _extract_arrow_relationships(self, line: str, arrow: str, rel_type: str, subsystem: str, cross_cluster: bool = False) -> List[GraphRelationship]:
+        """Extract relationships from arrow notation"""
+        relationships = []
+
+        if arrow in line:
+            parts = line.split(arrow)
+            if len(parts) == 2:
+                source = parts[0].strip()
+                target = parts[1].strip()
+
+                # Clean up node IDs (remove brackets and labels)
+                source = re.sub(r'\[.*?\]', '', source).strip()
+                target = re.sub(r'\[.*?\]', '', target).strip()
+
+                if source and target:
+                    relationships.append(GraphRelationship(
+                        source=source,
+                        target=target,
+                        relationship_type=rel_type,
+                        subsystem=subsystem,
+                        is_cross_cluster=cross_cluster
+                    ))
+
+        return relationships
+
+    def _extract_class_definitions(self, content: str) -> None:
+        """Extract CSS class definitions for styling information"""
+        class_pattern = r'class\s+([\w,\s]+)\s+(\w+)'
+
+        for match in re.finditer(class_pattern, content):
+            nodes = [n.strip() for n in match.group(1).split(',')]
+            class_name = match.group(2)
+
+            for node in nodes:
+                if node:
+                    self.class_definitions[node] = class_name
+
+
+def write_scaled_corpus(outDir, scale):
+    paths = []
+    for name in sorted(os.listdir(MERMAID_DIR)):
+        if not name.endswith(".mmd"):
+            continue
+        with open(os.path.join(MERMAID_DIR, name), "r", encoding="utf-8") as f:
+            content = f.read().rstrip("\n") + "\n"
+        path = Path(outDir) / name
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(scale):
+                f.write(content)
+        paths.append((path, name[len("rhacm-"):-len(".mmd")].title()))
+    return paths
+
+
+def time_parser(parserClass, paths, repeat):
+    best = None
+    for _ in range(repeat):
+        parser = parserClass()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for path, subsystem in paths:
+                parser.parse_mermaid_file(path, subsystem)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, parser
+
+
+def retained_memory(parserClass, paths):
+    tracemalloc.start()
+    parser = parserClass()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for path, subsystem in paths:
+            parser.parse_mermaid_file(path, subsystem)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mermaid parser benchmark")
+    parser.add_argument("--scale", type=int, default=1000, help="Copies of every .mmd file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser, the best one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_scaled_corpus(tmp, args.scale)
+        size = sum(path.stat().st_size for path, _ in paths)
+        print("%d files, %.1f MB (x%d)" % (len(paths), size / 1e6, args.scale))
+        legacy, legacyParser = time_parser(LegacyMermaidParser, paths, args.repeat)
+        tokenizer, tokenizerParser = time_parser(MermaidParser, paths, args.repeat)
+        legacyMemory = retained_memory(LegacyMermaidParser, paths)
+        tokenizerMemory = retained_memory(MermaidParser, paths)
+
+    for name, elapsed, result, memory in (("three-pass", legacy, legacyParser, legacyMemory),
+                                          ("tokenizer", tokenizer, tokenizerParser, tokenizerMemory)):
+        print("%-10s %8.2fs %7.1f MB/s  nodes=%d relationships=%d retained=%.1f MB"
+              % (name, elapsed, size / 1e6 / elapsed, len(result.nodes), len(result.relationships), memory / 1e6))
+    print("speedup %.1fx" % (legacy / tokenizer))
+
+
+if __name__ == "__main__":
+    main()
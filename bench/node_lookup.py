@@ -0,0 +1,110 @@
+"""
+Endpoint lookup and logging overhead of add_graph on a synthetic GraphML file
+(100k edges by default).
+
+Compares the old get_node_name, which scanned every node for each edge, with
+the endpoint lookup add_graph does now (EntityIndex.resolve, index build
+included), and times add_graph against a driver that does nothing with
+per-record DEBUG logging on (sent to /dev/null) versus a quiet run.
+
+Usage: python bench/node_lookup.py [--nodes N] [--edges M]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import networkx as nx
+
+import main as kg
+from entity_index import EntityIndex
+
+ENTITIES = ("API", "Processor", "IntermediateResource", "Gateway", "Users")
+VERBS = ("CREATES", "WATCHES", "CONFIGURES", "REFERS", "FORWARDS")
+
+
+def write_synthetic_graphml(path, nodeCount, edgeCount, seed=7):
+    rng = random.Random(seed)
+    graph = nx.MultiDiGraph()
+    for i in range(nodeCount):
+        graph.add_node(str(i), entity=rng.choice(ENTITIES), name="component-%d" % i, type="Pod")
+    for _ in range(edgeCount):
+        graph.add_edge(str(rng.randrange(nodeCount)), str(rng.randrange(nodeCount)), relation=rng.choice(VERBS))
+    nx.write_graphml(graph, path)
+
+
+def scan_node_name(sourceNode, destNode, propGraph):
+    # get_node_name as it was: one pass over every node per edge
+    sourceNodeName = destNodeName = sourceEntityName = destEntityName = ""
+    for node in propGraph.nodes(data=True):
+        if node[0] == sourceNode:
+            sourceNodeName = node[1].get("name")
+            sourceEntityName = node[1].get("entity")
+        if node[0] == destNode:
+            destNodeName = node[1].get("name")
+            destEntityName = node[1].get("entity")
+    return sourceNodeName, destNodeName, sourceEntityName, destEntityName
+
+
+class NullDriver:
+    def execute_query(self, query, **params):
+        return [], None, None
+
+
+def time_add_graph(propGraph, level):
+    with open(os.devnull, "w") as sink:
+        handler = logging.StreamHandler(sink)
+        logging.basicConfig(level=level, handlers=[handler], force=True)
+        try:
+            started = time.perf_counter()
+            kg.add_graph(NullDriver(), [propGraph])
+            return time.perf_counter() - started
+        finally:
+            logging.getLogger().removeHandler(handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_node_name / logging benchmark")
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument("--sample", type=int, default=200, help="Edges timed with the O(V) scan")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.graphml")
+        write_synthetic_graphml(path, args.nodes, args.edges)
+        propGraph = nx.read_graphml(path)
+    edges = list(propGraph.edges())
+
+    started = time.perf_counter()
+    for source, dest in edges[:args.sample]:
+        scan_node_name(source, dest, propGraph)
+    scan = (time.perf_counter() - started) / args.sample * len(edges)
+
+    started = time.perf_counter()
+    index = EntityIndex()
+    index.add(propGraph)
+    source = propGraph.graph.get("source", "")
+    for sourceNode, destNode in edges:
+        index.resolve(source, sourceNode)
+        index.resolve(source, destNode)
+    indexed = time.perf_counter() - started
+
+    print("%d nodes, %d edges" % (propGraph.number_of_nodes(), len(edges)))
+    print("get_node_name scan     %10.2fs (extrapolated from %d edges)" % (scan, args.sample))
+    print("entity index           %10.3fs  speedup %.0fx" % (indexed, scan / indexed))
+
+    debug = time_add_graph(propGraph, logging.DEBUG)
+    quiet = time_add_graph(propGraph, logging.WARNING)
+    print("add_graph DEBUG logging %9.3fs" % debug)
+    print("add_graph quiet         %9.3fs  speedup %.1fx" % (quiet, debug / quiet))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Compares the literal-map statements add_graph used to send with the
+parameterized templates from cypher_builder on the input/*.graphml corpus.
+
+Offline it reports how many distinct query strings each approach produces
+(every distinct string is a plan-cache miss, i.e. a full planning pass in
+neo4j) and how long building them takes. With --neo4j it also runs both
+statement sets against the database from .env inside rolled-back
+transactions and sums result_available_after, which includes planning time.
+
+Usage: python bench/plan_cache.py [--neo4j] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import networkx as nx
+
+from bulk_loader import edge_type
+from cypher_builder import node_merge_template, edge_merge_template
+from node_keys import node_label, graph_keys
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "input")
+
+
+def literal_map(params):
+    # The string building add_graph used before the query builder existed
+    param_string = ""
+    for key, value in params.items():
+        if type(value) != str:
+            param_string += key + ": " + str(value) + ", "
+        else:
+            param_string += key + ": '" + value + "', "
+    return "{" + param_string[:-2] + "}"
+
+
+def literal_statements(graphs):
+    for propGraph in graphs:
+        for _, attrs in propGraph.nodes(data=True):
+            yield ("MERGE (n:" + node_label(attrs) + " " + literal_map(attrs) + ") RETURN n.name"), {}
+        for source, dest, attrs in propGraph.edges(data=True):
+            yield ("MATCH (sourceNode " + literal_map(propGraph.nodes[source]) + "), "
+                   "(destNode " + literal_map(propGraph.nodes[dest]) + ") "
+                   "MERGE (sourceNode)-[r:" + edge_type(attrs) + "]->(destNode) "
+                   "RETURN sourceNode.name, destNode.name,type(r)"), {}
+
+
+def template_statements(graphs):
+    for propGraph in graphs:
+        keys = graph_keys(propGraph)
+        for nodeId, attrs in propGraph.nodes(data=True):
+            label, key = keys[nodeId]
+            yield node_merge_template(label), {"key": key, "props": dict(attrs)}
+        for source, dest, attrs in propGraph.edges(data=True):
+            (sourceLabel, sourceKey), (destLabel, destKey) = keys[source], keys[dest]
+            yield (edge_merge_template(edge_type(attrs), sourceLabel, destLabel),
+                   {"source": sourceKey, "dest": destKey})
+
+
+def offline(graphs, repeat):
+    for name, build in (("literal", literal_statements), ("template", template_statements)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            statements = list(build(graphs))
+        elapsed = (time.perf_counter() - started) / repeat
+        distinct = len({query for query, _ in statements})
+        print("%-9s statements=%d distinct=%d (plan-cache hit ratio %.1f%%) build=%.2fms"
+              % (name, len(statements), distinct,
+                 100.0 * (1 - distinct / len(statements)), elapsed * 1000))
+
+
+def live(graphs):
+    from dotenv import load_dotenv, find_dotenv
+    from neo4j import GraphDatabase
+
+    load_dotenv(find_dotenv(raise_error_if_not_found=True))
+    auth = (os.getenv("NEO4J_DB"), os.getenv("NEO4J_PASSWORD"))
+    with GraphDatabase.driver(os.getenv("NEO4J_URL"), auth=auth) as driver:
+        for name, build in (("literal", literal_statements), ("template", template_statements)):
+            driver.execute_query("CALL db.clearQueryCaches()")
+            availableAfter = 0
+            started = time.perf_counter()
+            with driver.session() as session:
+                tx = session.begin_transaction()
+                try:
+                    for query, params in build(graphs):
+                        summary = tx.run(query, **params).consume()
+                        availableAfter += summary.result_available_after or 0
+                finally:
+                    tx.rollback()
+            print("%-9s neo4j wall=%.1fms sum(result_available_after)=%dms"
+                  % (name, (time.perf_counter() - started) * 1000, availableAfter))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan-cache benchmark for add_graph statements")
+    parser.add_argument("--neo4j", action="store_true", help="Also run the statements against neo4j")
+    parser.add_argument("--repeat", type=int, default=20, help="Offline build repetitions")
+    args = parser.parse_args()
+
+    graphs = [nx.read_graphml(os.path.join(INPUT_DIR, name))
+              for name in sorted(os.listdir(INPUT_DIR)) if name.endswith(".graphml")]
+    offline(graphs, args.repeat)
+    if args.neo4j:
+        live(graphs)
+
+
+if __name__ == "__main__":
+    main()
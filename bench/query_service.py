@@ -0,0 +1,127 @@
+"""
+Result cache of src/query_service.py under the repeated questions of an
+MCP / LLM client: a Zipf-distributed mix of the query templates (a few
+popular questions, a long tail of components), asked from several threads
+against a stand-in driver that sleeps a round trip per statement plus a
+server time per query.
+
+Times the mix run uncached (every question is a query) against the cache,
+reports hit rate, coalesced requests and statements sent, then bumps the
+graph version and checks the next question runs again.
+
+Usage: python bench/query_service.py [--requests N] [--threads T] [--components C] [--query-ms MS] [--rtt-ms MS]
+                                      [--version-interval S]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench.suite.fake_driver import RecordingDriver, fake_summary
+from cypher_builder import GRAPH_VERSION_BUMP, GRAPH_VERSION_QUERY, bump_graph_version
+from query_service import QueryService, ResultCache, TEMPLATES
+
+
+class FakeRecord(dict):
+
+    def data(self):
+        return dict(self)
+
+
+class VersionedDriver(RecordingDriver):
+    """Keeps the KGMeta stamp GRAPH_VERSION_BUMP sets and answers every
+    other read with one row after queryTime more seconds."""
+
+    def __init__(self, latency, queryTime):
+        super().__init__(latency, sleep=True)
+        self.queryTime = queryTime
+        self.version = 0
+
+    def execute_query(self, query, parameters_=None, **params):
+        super().execute_query(query, parameters_, **params)
+        if query == GRAPH_VERSION_BUMP:
+            self.version += 1
+            return [], fake_summary(), []
+        if query == GRAPH_VERSION_QUERY:
+            records = [FakeRecord(version=self.version, stamp="v%d" % self.version)] if self.version else []
+            return records, fake_summary(), []
+        time.sleep(self.queryTime)
+        return [FakeRecord(query=query, params=parameters_, version=self.version)], fake_summary(), []
+
+
+def questions(count, components, seed=1):
+    """(template, params) of count questions: Zipf over the components for
+    the per-component templates, the whole-graph ones in between."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(components)]
+    names = ["COMPONENT_%d" % i for i in range(components)]
+    perComponent = ("depends-on", "dependents", "neighborhood")
+    wholeGraph = ("subsystems", "most-connected", "cross-subsystem", "hub-spoke", "roots")
+    mix = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            mix.append((rng.choice(perComponent), {"component": rng.choices(names, weights)[0]}))
+        else:
+            mix.append((rng.choice(wholeGraph), {}))
+    return mix
+
+
+def run_mix(function, mix, threads):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(lambda question: function(question[0], question[1]), mix))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="query_service result cache against uncached queries")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--components", type=int, default=300)
+    parser.add_argument("--query-ms", type=float, default=5.0, help="Server time of a template query")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Round trip of every statement")
+    parser.add_argument("--version-interval", type=float, default=0.0,
+                        help="Seconds a graph version read is trusted (0: read before every question)")
+    args = parser.parse_args()
+
+    mix = questions(args.requests, args.components)
+    uncachedDriver = VersionedDriver(args.rtt_ms / 1000, args.query_ms / 1000)
+    uncached = QueryService(uncachedDriver)
+    uncachedTime = run_mix(lambda name, params: uncached.run(TEMPLATES[name], TEMPLATES[name].bind(params)),
+                           mix, args.threads)
+
+    driver = VersionedDriver(args.rtt_ms / 1000, args.query_ms / 1000)
+    bump_graph_version(driver)
+    service = QueryService(driver, ResultCache(), versionInterval=args.version_interval)
+    cachedTime = run_mix(lambda name, params: service.query(name, **params), mix, args.threads)
+    stats = service.stats()
+
+    print("%d questions, %d threads, %.1fms per query + %.1fms round trip" % (args.requests, args.threads,
+                                                                              args.query_ms, args.rtt_ms))
+    print("%-12s %10s %12s %12s" % ("", "seconds", "statements", "per question"))
+    print("%-12s %10.3f %12d %10.2fms" % ("uncached", uncachedTime, uncachedDriver.roundTrips,
+                                          uncachedTime / args.requests * 1e3))
+    print("%-12s %10.3f %12d %10.2fms  %.1fx" % ("cached", cachedTime, driver.roundTrips - 1,
+                                                 cachedTime / args.requests * 1e3, uncachedTime / cachedTime))
+    print("hit rate %.1f%% (%d hits, %d coalesced, %d misses), %d entries" % (
+        stats["hit_rate"] * 100, stats["hits"], stats["coalesced"], stats["misses"], stats["entries"]))
+
+    # A load bumps the version: the same question has to run again, once
+    name, params = mix[0]
+    before = service.query(name, **params)
+    bump_graph_version(driver)
+    # Seen once the version read is no longer trusted
+    time.sleep(args.version_interval)
+    after = service.query(name, **params)
+    if after is before or after[0]["version"] != driver.version or service.query(name, **params) is not after:
+        sys.exit("cached result survived a graph version bump")
+    print("version bump dropped %d cached results" % stats["entries"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Reachability index (acm/agentic-docs/dependency-analysis/reachability.py)
+on synthetic acyclic diagrams of bench/suite/generators.py (layered like
+the architecture, deep dependency chains) spread over several files that
+share their node ids.
+
+Times building the index, answering "depends on" / upstream / blast radius
+against the breadth-first searches a variable-length traversal does
+(networkx has_path, descendants, ancestors), and refreshing the index after
+one file changed against building it again. The refreshed index is checked
+against the rebuilt one.
+
+Usage: python bench/reachability.py [--edges M] [--nodes N] [--files F] [--queries Q] [--cyclic]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import networkx as nx
+
+from bench.suite import generators
+from mermaid_to_cypher import discover_diagrams
+from reachability import ReachabilityIndex
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def build(diagrams):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ReachabilityIndex.from_diagrams(diagrams)
+
+
+def refresh(index, diagrams):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return index.refresh(diagrams)
+
+
+def networkx_graph(index):
+    graph = nx.DiGraph()
+    graph.add_nodes_from(index.component)
+    graph.add_edges_from((source, target) for source, targets in index.successors.items() for target in targets)
+    return graph
+
+
+def per_query(function, arguments):
+    started = time.perf_counter()
+    for args in arguments:
+        function(*args)
+    return (time.perf_counter() - started) / len(arguments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reachability index against graph searches")
+    parser.add_argument("--edges", type=int, default=20000)
+    parser.add_argument("--nodes", type=int)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--cyclic", action="store_true", help="Random edge directions (a few big cycles)")
+    args = parser.parse_args()
+
+    nodeCount = args.nodes or generators.default_nodes(args.edges)
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(args.files):
+            generators.write_mermaid(Path(directory, "rhacm-part-%d.mmd" % i), args.edges // args.files,
+                                     nodeCount, seed=i + 1, acyclic=not args.cyclic)
+        diagrams = discover_diagrams(Path(directory), "*.mmd")
+        index, buildTime = timed(build, diagrams)
+        stats = index.stats()
+        print("%d files, %d nodes, %d relationships: %d components (%d on cycles), %d reachable pairs, "
+              "%.1fMB of bitsets" % (args.files, stats["nodes"], stats["relationships"], stats["components"],
+                                     stats["cyclic_components"], stats["reachable_pairs"], stats["bitset_bytes"] / 1e6))
+        print("%-28s %10.3fs" % ("parse + build index", buildTime))
+
+        graph = networkx_graph(index)
+        rng = random.Random(1)
+        nodes = list(index.component)
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(args.queries)]
+        singles = [(rng.choice(nodes),) for _ in range(args.queries)]
+        print("%-28s %12s %12s" % ("per query", "index", "search"))
+        checks = (("depends on", index.depends_on, lambda a, b: nx.has_path(graph, a, b), pairs),
+                  ("upstream", index.upstream, lambda node: nx.descendants(graph, node), singles),
+                  ("blast radius", index.blast_radius, lambda node: nx.ancestors(graph, node), singles))
+        for name, indexFunction, searchFunction, arguments in checks:
+            for args_ in arguments[:20]:
+                answer, expected = indexFunction(*args_), searchFunction(*args_)
+                if isinstance(answer, list):
+                    answer, expected = set(answer), expected - set(args_)
+                elif args_[0] == args_[1]:
+                    continue
+                if answer != expected:
+                    sys.exit("%s%r: index %r, search %r" % (name, args_, answer, expected))
+            indexTime = per_query(indexFunction, arguments)
+            searchTime = per_query(searchFunction, arguments)
+            print("%-28s %10.1fus %10.1fus  %6.0fx" % (name, indexTime * 1e6, searchTime * 1e6,
+                                                       searchTime / indexTime))
+
+        # Rewrite one file with other relationships
+        generators.write_mermaid(diagrams[0].path, args.edges // args.files, nodeCount, seed=args.files + 1,
+                                 acyclic=not args.cyclic)
+        changed, refreshTime = timed(refresh, index, diagrams)
+        rebuilt, rebuildTime = timed(build, diagrams)
+        if changed != [str(diagrams[0].path)] or index.stats()["reachable_pairs"] != rebuilt.stats()["reachable_pairs"] \
+                or any(index.upstream(node) != rebuilt.upstream(node) for node, in singles):
+            sys.exit("refreshed index differs from the rebuilt one")
+        print("%-28s %10.3fs" % ("refresh after 1 file", refreshTime))
+        print("%-28s %10.3fs" % ("parse + build again", rebuildTime))
+
+
+if __name__ == "__main__":
+    main()
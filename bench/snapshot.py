@@ -0,0 +1,86 @@
+"""
+Cold start with and without snapshots (src/snapshot.py) on synthetic inputs
+of bench/suite/generators.py:
+
+- GraphML: main.loadGraph (nx.read_graphml), main.loadSnapshot (memory-map
+  the snapshot and rebuild the same networkx graph) and opening the
+  snapshot as a CompactGraph only, which is what a query service needs;
+- Mermaid: parse_diagrams against load_diagrams from a snapshot.
+
+Every time is the first load in a fresh process, so nothing is reused from
+an earlier run apart from the operating system's page cache.
+
+Usage: python bench/snapshot.py [--edges M]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+
+from bench.suite import generators
+
+# Runs in a fresh interpreter: python -c CHILD kind directory
+CHILD = r"""
+import json, os, sys, time
+sys.path.insert(0, %r)
+import bench.suite
+from pathlib import Path
+kind, directory = sys.argv[1:3]
+started = time.perf_counter()
+if kind in ("graphml", "snapshot", "compact"):
+    import main
+    if kind == "graphml":
+        graph = main.loadGraph("synthetic.graphml", directory, os.path.join(directory, "snapshots"))
+    elif kind == "snapshot":
+        graph = main.loadSnapshot("synthetic.graphml", os.path.join(directory, "snapshots"), directory)
+    else:
+        from snapshot import load_snapshot, source_hashes
+        graph, _ = load_snapshot(os.path.join(directory, "snapshots", "synthetic.graphml.snapshot"),
+                                 source_hashes([os.path.join(directory, "synthetic.graphml")], directory))
+    size = graph.size() if hasattr(graph, "size") else graph.edge_count
+else:
+    import contextlib, io
+    from mermaid_to_cypher import DiagramFile, load_diagrams
+    diagrams = [DiagramFile(Path(directory, "rhacm-synthetic.mmd"), "Synthetic")]
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser, fromSnapshot = load_diagrams(diagrams, snapshot=os.path.join(directory, "mermaid.snapshot"),
+                                             input_dir=Path(directory))
+    size = len(parser.relationships)
+print(json.dumps({"seconds": time.perf_counter() - started, "size": size}))
+"""
+
+
+def run(kind, directory):
+    output = subprocess.run([sys.executable, "-c", CHILD % os.path.join(BENCH_DIR, ".."), kind, directory],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="snapshot cold start benchmark")
+    parser.add_argument("--edges", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        generators.write_graphml(os.path.join(directory, "synthetic.graphml"), args.edges)
+        generators.write_mermaid(os.path.join(directory, "rhacm-synthetic.mmd"), args.edges)
+        print("%d edges: %.1f MB of GraphML, %.1f MB of Mermaid"
+              % (args.edges, os.path.getsize(os.path.join(directory, "synthetic.graphml")) / 1e6,
+                 os.path.getsize(os.path.join(directory, "rhacm-synthetic.mmd")) / 1e6))
+        results = [("nx.read_graphml (+ write snapshot)", run("graphml", directory)),
+                   ("snapshot -> networkx graph", run("snapshot", directory)),
+                   ("snapshot -> CompactGraph (mmap)", run("compact", directory)),
+                   ("parse Mermaid (+ write snapshot)", run("mermaid", directory)),
+                   ("snapshot -> MermaidParser", run("mermaid", directory))]
+    for name, result in results:
+        print("%-36s %9.3fs  %d relationships" % (name, result["seconds"], result["size"]))
+
+
+if __name__ == "__main__":
+    main()
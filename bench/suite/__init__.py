@@ -0,0 +1,24 @@
+"""
+Reproducible ingestion benchmarks: synthetic GraphML / Mermaid generators
+(generators), a recording stand-in for the neo4j driver (fake_driver) and
+timed scenarios checked against JSON baselines (scenarios).
+
+Usage, from the repository root:
+
+  python -m bench.suite                      # compare against bench/suite/baselines/
+  python -m bench.suite --size medium --threshold 0.3
+  python -m bench.suite --update             # record new baselines
+  python -m bench.suite.generators graphml out.graphml --edges 100000 --distribution powerlaw
+"""
+
+import os
+import sys
+
+REPO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+SRC_DIR = os.path.join(REPO_DIR, "src")
+ANALYSIS_DIR = os.path.join(REPO_DIR, "acm", "agentic-docs", "dependency-analysis")
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+for path in (SRC_DIR, ANALYSIS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
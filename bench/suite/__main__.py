@@ -0,0 +1,107 @@
+"""
+Runs the scenarios on generated inputs of one size and compares them with
+bench/suite/baselines/<size>.json. A scenario fails when it is more than
+--threshold slower than its baseline, plus the spread of its own repeats
+(slowdowns within this run's jitter are ignored), or needs more round trips
+to the driver. The default size keeps every baseline well above timer
+jitter; the small one is for a quick smoke run. Baselines are timings of
+one machine: record them again with --update after moving to another one.
+
+Usage: python -m bench.suite [--size small|medium|large|huge] [--threshold T]
+       [--repeat N] [--scenario NAME ...] [--update]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+
+from . import BASELINE_DIR, generators
+from .fake_driver import DEFAULT_LATENCY
+from .scenarios import SCENARIOS, SIZES, DEFAULT_SIZE, DEFAULT_REPEAT, prepare, run_scenarios
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def baseline_path(size, distribution):
+    name = size if distribution == generators.DEFAULT_DISTRIBUTION else "%s-%s" % (size, distribution)
+    return os.path.join(BASELINE_DIR, name + ".json")
+
+
+def compare(results, baseline, threshold):
+    """(lines, failures) comparing every result with its baseline entry."""
+    lines = ["%-24s %10s %10s %7s %12s  %s" % ("scenario", "seconds", "baseline", "ratio", "round trips", "")]
+    failures = 0
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            lines.append("%-24s %10.4f %10s %7s %12s  no baseline"
+                         % (name, result["seconds"], "-", "-", result.get("round_trips", "-")))
+            continue
+        ratio = result["seconds"] / expected["seconds"] if expected["seconds"] else 1.0
+        problems = []
+        # A slower machine state shows up as spread between the repeats, a
+        # slower code path slows every repeat alike
+        if result["seconds"] > expected["seconds"] * (1 + threshold) + result.get("spread", 0.0):
+            problems.append("slower than baseline")
+        if result.get("round_trips", 0) > expected.get("round_trips", 0):
+            problems.append("%d round trips, baseline %d" % (result["round_trips"], expected.get("round_trips", 0)))
+        failures += bool(problems)
+        lines.append("%-24s %10.4f %10.4f %6.2fx %12s  %s"
+                     % (name, result["seconds"], expected["seconds"], ratio, result.get("round_trips", "-"),
+                        "FAIL: " + ", ".join(problems) if problems else "ok"))
+    return lines, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion benchmark suite")
+    parser.add_argument("--size", choices=SIZES, default=DEFAULT_SIZE)
+    parser.add_argument("--distribution", choices=generators.DISTRIBUTIONS, default=generators.DEFAULT_DISTRIBUTION)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline (default %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per scenario, the best one counts")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help="Simulated seconds per driver round trip (default %(default)s)")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Only run these scenarios")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workDir:
+        inputs = prepare(workDir, args.size, args.distribution)
+        print("%s: %d nodes, %d edges (%s)" % (args.size, inputs.nodes, inputs.edges, args.distribution))
+        results = run_scenarios(inputs, args.scenario, args.repeat, args.latency)
+
+    path = baseline_path(args.size, args.distribution)
+    if args.update:
+        baseline = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+        baseline.update(results)
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"size": args.size, "edges": inputs.edges, "nodes": inputs.nodes,
+                       "distribution": args.distribution, "latency": args.latency,
+                       "python": platform.python_version(), "machine": platform.machine(),
+                       "results": baseline}, f, indent=1, sort_keys=True)
+            f.write("\n")
+        for name, result in results.items():
+            print("%-24s %10.4fs %s" % (name, result["seconds"],
+                                        "%d round trips" % result["round_trips"] if "round_trips" in result else ""))
+        print("Wrote %s" % path)
+        return
+
+    if not os.path.exists(path):
+        sys.exit("No baseline %s, record one with --update" % path)
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    lines, failures = compare(results, baseline["results"], args.threshold)
+    print("\n".join(lines))
+    if failures:
+        sys.exit("%d scenario(s) regressed beyond %.0f%%" % (failures, args.threshold * 100))
+
+
+if __name__ == "__main__":
+    main()
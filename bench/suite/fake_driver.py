@@ -0,0 +1,80 @@
+"""
+A stand-in for neo4j.Driver that records what the loaders send instead of
+running it: statements per query template, rows per UNWIND batch and round
+trips, plus a simulated network latency per round trip. The latency is
+added to a virtual clock, not slept, so a scenario's result is its CPU time
+plus the latency it would have paid; pass sleep=True to really wait.
+"""
+
+import time
+from types import SimpleNamespace
+
+from metrics import SUMMARY_COUNTERS
+
+# A LAN round trip to a neo4j server
+DEFAULT_LATENCY = 0.0005
+
+
+def fake_summary():
+    return SimpleNamespace(counters=SimpleNamespace(**dict.fromkeys(SUMMARY_COUNTERS, 0)),
+                           result_available_after=0, result_consumed_after=0, profile=None)
+
+
+class RecordingDriver:
+    """Supports the parts of the driver API the loaders use: execute_query,
+    and session(database=...).execute_write(work, ...) with the work run
+    against a recording transaction."""
+
+    def __init__(self, latency=DEFAULT_LATENCY, sleep=False):
+        self.latency = latency
+        self.sleep = sleep
+        self.queries = {}
+        self.rows = 0
+        self.roundTrips = 0
+        self.latencySeconds = 0.0
+
+    def _round_trip(self, query, rows=0):
+        self.queries[query] = self.queries.get(query, 0) + 1
+        self.rows += rows
+        self.roundTrips += 1
+        self.latencySeconds += self.latency
+        if self.sleep:
+            time.sleep(self.latency)
+
+    def execute_query(self, query, parameters_=None, **params):
+        rows = params.get("rows")
+        self._round_trip(query, len(rows) if rows is not None else 1)
+        return [], fake_summary(), []
+
+    def session(self, database=None):
+        return RecordingSession(self)
+
+    def close(self):
+        pass
+
+    def stats(self):
+        return {"round_trips": self.roundTrips, "statements": sum(self.queries.values()),
+                "templates": len(self.queries), "rows": self.rows, "latency_seconds": self.latencySeconds}
+
+
+class RecordingSession:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, parameters=None, **params):
+        params.update(parameters or {})
+        rows = params.get("rows")
+        self.driver._round_trip(query, len(rows) if rows is not None else 1)
+        return SimpleNamespace(consume=fake_summary)
+
+    def execute_write(self, work, *args, **kwargs):
+        return work(self, *args, **kwargs)
+
+    execute_read = execute_write
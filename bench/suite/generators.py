@@ -0,0 +1,153 @@
+"""
+Synthetic inputs in the formats the two ingestion paths read: GraphML in the
+input/ schema (entity/name/type/group/kind node keys, a verb per edge, the
+entities of glossary.txt) and Mermaid flowcharts in the style of the
+mermaid/*.mmd diagrams (labelled nodes, |TYPE| links, classDef/class lines).
+
+The same arguments and seed always give the same file. Edge endpoints follow
+a degree distribution: uniform, or powerlaw, where the probability of the
+k-th node is proportional to 1 / k**alpha, so a few hubs carry many edges
+like the controllers and APIs of the real graphs. With acyclic every edge
+points from the lower to the higher node number (self loops are left out),
+layered dependencies like the architecture diagrams instead of one big
+cycle. Files are written line by line, 1e6 edges do not need a graph in
+memory.
+
+Usage: python -m bench.suite.generators graphml|mermaid PATH --edges N
+       [--nodes N] [--distribution uniform|powerlaw] [--alpha A] [--seed S] [--acyclic]
+"""
+
+import argparse
+import itertools
+import os
+import random
+from xml.sax.saxutils import escape
+
+from . import REPO_DIR
+
+DISTRIBUTIONS = ("uniform", "powerlaw")
+DEFAULT_DISTRIBUTION = "powerlaw"
+DEFAULT_ALPHA = 1.1
+# Average total degree when only the edge count is given
+DEFAULT_DEGREE = 10
+
+VERBS = ("CREATES", "WATCHES", "CONFIGURES", "REFERS", "FORWARDS", "DEPLOYS", "MANAGES", "USES")
+TYPES = ("Kubernetes", "Pipeline", "github", "Pod", "Deployment")
+GROUPS = ("cluster.open-cluster-management.io", "work.open-cluster-management.io", "policy", "apps")
+KINDS = ("ManagedCluster", "ManifestWork", "Placement", "Subscription", "integration")
+# Label words the Mermaid classification rules react to
+LABEL_WORDS = ("Operator", "Controller", "API", "Manager", "Addon", "Agent", "Cluster Proxy",
+               "Policy Engine", "Search Indexer", "Prometheus Adapter", "Subscription Hub", "Service")
+CLASSES = ("operator", "controller", "api", "internal", "spoke")
+
+
+def glossary_entities():
+    with open(os.path.join(REPO_DIR, "glossary.txt"), "r", encoding="utf-8") as f:
+        return sorted(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+
+def default_nodes(edgeCount):
+    return max(2, 2 * edgeCount // DEFAULT_DEGREE)
+
+
+def endpoints(rng, nodeCount, edgeCount, distribution=DEFAULT_DISTRIBUTION, alpha=DEFAULT_ALPHA, acyclic=False):
+    """edgeCount (source, target) node indexes drawn from distribution.
+    Sources and targets use differently shuffled node orders, so the nodes
+    with many outgoing edges are not the ones with many incoming ones."""
+    if acyclic:
+        return ((min(pair), max(pair)) for pair in endpoints(rng, nodeCount, edgeCount, distribution, alpha)
+                if pair[0] != pair[1])
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Unknown degree distribution: %r" % (distribution,))
+    if distribution == "uniform":
+        sources = [rng.randrange(nodeCount) for _ in range(edgeCount)]
+        targets = [rng.randrange(nodeCount) for _ in range(edgeCount)]
+        return zip(sources, targets)
+    cumWeights = list(itertools.accumulate(1.0 / (rank + 1) ** alpha for rank in range(nodeCount)))
+    ranks = range(nodeCount)
+    sourceOrder = list(ranks)
+    targetOrder = list(ranks)
+    rng.shuffle(sourceOrder)
+    rng.shuffle(targetOrder)
+    sources = rng.choices(sourceOrder, cum_weights=cumWeights, k=edgeCount)
+    targets = rng.choices(targetOrder, cum_weights=cumWeights, k=edgeCount)
+    return zip(sources, targets)
+
+
+def write_graphml(path, edgeCount, nodeCount=None, distribution=DEFAULT_DISTRIBUTION, alpha=DEFAULT_ALPHA,
+                  seed=1, acyclic=False):
+    """A GraphML file in the input/ schema that passes src/validate.py."""
+    nodeCount = nodeCount or default_nodes(edgeCount)
+    rng = random.Random(seed)
+    entities = glossary_entities()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<?xml version='1.0' encoding='utf-8'?>\n"
+                '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+                '  <key id="verb" for="edge" attr.name="verb" attr.type="string" />\n')
+        for key in ("name", "entity", "type", "group", "kind"):
+            f.write('  <key id="%s" for="node" attr.name="%s" attr.type="string" />\n' % (key, key))
+        f.write('  <graph edgedefault="directed">\n')
+        for i in range(nodeCount):
+            f.write('    <node id="%d">\n'
+                    '      <data key="entity">%s</data>\n'
+                    '      <data key="name">%s</data>\n' % (i, rng.choice(entities), escape("component-%d" % i)))
+            # About half of the nodes are Kubernetes resources with a group/kind
+            if rng.random() < 0.5:
+                f.write('      <data key="type">%s</data>\n'
+                        '      <data key="group">%s</data>\n'
+                        '      <data key="kind">%s</data>\n' % (rng.choice(TYPES), rng.choice(GROUPS), rng.choice(KINDS)))
+            f.write('    </node>\n')
+        for number, (source, target) in enumerate(endpoints(rng, nodeCount, edgeCount, distribution, alpha, acyclic)):
+            f.write('    <edge id="e%d" source="%d" target="%d">\n'
+                    '      <data key="verb">%s</data>\n'
+                    '    </edge>\n' % (number, source, target, rng.choice(VERBS)))
+        f.write("  </graph>\n</graphml>\n")
+    return nodeCount
+
+
+def write_mermaid(path, edgeCount, nodeCount=None, distribution=DEFAULT_DISTRIBUTION, alpha=DEFAULT_ALPHA,
+                  seed=1, title="Synthetic", acyclic=False):
+    """A flowchart in the style of mermaid/*.mmd: node definitions, labelled
+    (sometimes dotted) links, classDef and class assignment lines."""
+    nodeCount = nodeCount or default_nodes(edgeCount)
+    rng = random.Random(seed)
+    nodeId = "COMPONENT_%d".__mod__
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("graph TB\n    %%%% RHACM %s - generated architecture\n    \n" % title)
+        f.write("    %% Components\n")
+        for i in range(nodeCount):
+            f.write("    %s[%s %d]\n" % (nodeId(i), LABEL_WORDS[i % len(LABEL_WORDS)], i))
+        f.write("    \n    %% Dependencies\n")
+        for source, target in endpoints(rng, nodeCount, edgeCount, distribution, alpha, acyclic):
+            arrow = "-.->" if rng.random() < 0.1 else "-->"
+            f.write("    %s %s|%s| %s\n" % (nodeId(source), arrow, rng.choice(VERBS), nodeId(target)))
+        f.write("    \n    %% Styling\n")
+        for name in CLASSES:
+            f.write("    classDef %s fill:#e3f2fd\n" % name)
+        f.write("    \n")
+        for start in range(0, nodeCount, 20):
+            ids = ",".join(nodeId(i) for i in range(start, min(start + 20, nodeCount)))
+            f.write("    class %s %s\n" % (ids, CLASSES[(start // 20) % len(CLASSES)]))
+    return nodeCount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic GraphML or Mermaid file")
+    parser.add_argument("format", choices=("graphml", "mermaid"))
+    parser.add_argument("path")
+    parser.add_argument("--edges", type=int, default=1000)
+    parser.add_argument("--nodes", type=int, help="Default: edges / %d * 2" % DEFAULT_DEGREE)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default=DEFAULT_DISTRIBUTION)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Exponent of the powerlaw distribution")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--acyclic", action="store_true", help="Edges only from lower to higher node numbers")
+    args = parser.parse_args()
+
+    write = write_graphml if args.format == "graphml" else write_mermaid
+    nodeCount = write(args.path, args.edges, args.nodes, args.distribution, args.alpha, args.seed,
+                      acyclic=args.acyclic)
+    print("Wrote %s: %d nodes, %d edges" % (args.path, nodeCount, args.edges))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+The timed scenarios of the suite. Every scenario gets the generated inputs
+of one size and returns the RecordingDriver it loaded into (or None); its
+time is the best of several repeats so one slow run does not fail a check.
+"""
+
+import contextlib
+import gc
+import io
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from . import generators
+from .fake_driver import RecordingDriver, DEFAULT_LATENCY
+
+import main as kg
+from bulk_loader import bulk_add_graph
+from graph_store import GraphStore
+from mermaid_to_cypher import MermaidParser, CypherGenerator, load_classification_rules
+
+# Edges of the generated inputs
+SIZES = {"small": 1000, "medium": 10000, "large": 100000, "huge": 1000000}
+DEFAULT_SIZE = "medium"
+DEFAULT_REPEAT = 5
+
+
+def prepare(workDir, size, distribution=generators.DEFAULT_DISTRIBUTION, seed=1):
+    """Writes the GraphML and Mermaid inputs of size to workDir and builds the
+    objects the later scenarios start from."""
+    edgeCount = SIZES[size]
+    graphml = os.path.join(workDir, "synthetic-%s.graphml" % size)
+    mermaid = Path(workDir, "synthetic-%s.mmd" % size)
+    nodeCount = generators.write_graphml(graphml, edgeCount, distribution=distribution, seed=seed)
+    generators.write_mermaid(mermaid, edgeCount, distribution=distribution, seed=seed)
+    rules = load_classification_rules()
+    parser = MermaidParser(rules)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_mermaid_file(mermaid, "synthetic")
+    return SimpleNamespace(size=size, edges=edgeCount, nodes=nodeCount, workDir=workDir,
+                           graphml=os.path.basename(graphml), mermaid=mermaid, rules=rules,
+                           graph=kg.loadGraph(os.path.basename(graphml), workDir), parser=parser)
+
+
+def load_graph(inputs, latency):
+    kg.loadGraph(inputs.graphml, inputs.workDir)
+
+
+def add_graph(inputs, latency):
+    driver = RecordingDriver(latency)
+    kg.add_graph(driver, [inputs.graph])
+    return driver
+
+
+def bulk_load(inputs, latency):
+    driver = RecordingDriver(latency)
+    bulk_add_graph(driver, [inputs.graph])
+    return driver
+
+
+def parse_mermaid_file(inputs, latency):
+    parser = MermaidParser(inputs.rules)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_mermaid_file(inputs.mermaid, "synthetic")
+
+
+def generate_cypher_script(inputs, latency):
+    parser = inputs.parser
+    CypherGenerator(parser.nodes, list(parser.relationships.values()),
+                    parser.class_definitions).generate_cypher_script()
+
+
+def build_graph_store(inputs, latency):
+    GraphStore.from_parser(inputs.parser)
+
+
+def query_graph_store(inputs, latency):
+    # A fresh store, so the whole-graph aggregations are computed, not memoized
+    store = GraphStore.from_parser(inputs.parser)
+    store.component_count_by_subsystem()
+    store.most_connected()
+    store.cross_subsystem_dependencies()
+    store.hub_spoke_patterns()
+    store.root_components()
+    store.find_components("operator")
+
+
+SCENARIOS = {
+    "load_graph": load_graph,
+    "add_graph": add_graph,
+    "bulk_add_graph": bulk_load,
+    "parse_mermaid_file": parse_mermaid_file,
+    "generate_cypher_script": generate_cypher_script,
+    "build_graph_store": build_graph_store,
+    "query_graph_store": query_graph_store,
+}
+
+
+def measure(scenario, inputs, repeat=DEFAULT_REPEAT, latency=DEFAULT_LATENCY):
+    """Best wall time of repeat runs and their spread (median minus best, the
+    jitter of this machine right now); for loading scenarios also what the
+    driver recorded (identical in every run). Collections of garbage left by
+    earlier runs are kept out of the measurement."""
+    times = []
+    driver = None
+    for _ in range(repeat):
+        driver = None
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            driver = scenario(inputs, latency)
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        times.append(elapsed)
+    times.sort()
+    result = {"seconds": times[0], "spread": times[len(times) // 2] - times[0]}
+    if driver is not None:
+        result.update(driver.stats())
+    return result
+
+
+def run_scenarios(inputs, names=None, repeat=DEFAULT_REPEAT, latency=DEFAULT_LATENCY):
+    return {name: measure(SCENARIOS[name], inputs, repeat, latency)
+            for name in (names or SCENARIOS)}
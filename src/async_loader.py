@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import os
+import time
+
+from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import Neo4jError
+
+from bulk_loader import LoadStats, batches, DEFAULT_BATCH_SIZE
+from cypher_builder import (node_unwind_template, edge_unwind_template, key_constraint_template, property_index_template,
+                            GRAPH_VERSION_BUMP)
+
+
+log = logging.getLogger(__name__)
+
+# neo4j's own default, the pool only has to hold one connection per
+# concurrent transaction plus the odd metadata query
+DEFAULT_POOL_SIZE = 100
+
+SERVER_CORES_QUERY = ("CALL dbms.queryJmx('java.lang:type=OperatingSystem') YIELD attributes "
+                      "RETURN attributes.AvailableProcessors.value AS cores")
+
+
+class EdgeRound:
+    """Edge batches that may run at the same time: no node is an endpoint in
+    more than one of them, so concurrent MERGEs never wait on each other's
+    node locks (and cannot deadlock taking them in different orders)."""
+
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.batches = []
+        self.owner = {}
+        self.open = {}
+
+    def place(self, group, source, dest, batchSize):
+        """Batch of this round the edge source -> dest of group can join, or
+        None if it would connect two batches or its batch is full."""
+        sourceBatch = self.owner.get(source)
+        destBatch = self.owner.get(dest)
+        if sourceBatch is None and destBatch is None:
+            batch = self.open.get(group)
+            if batch is None:
+                if len(self.batches) == self.concurrency:
+                    return None
+                batch = (group, [])
+                self.batches.append(batch)
+                self.open[group] = batch
+        else:
+            batch = sourceBatch or destBatch
+            if destBatch is not None and sourceBatch is not None and destBatch is not sourceBatch:
+                return None
+            if batch[0] != group or len(batch[1]) >= batchSize:
+                return None
+        self.owner[source] = batch
+        self.owner[dest] = batch
+        return batch
+
+    def add(self, batch, row, batchSize):
+        batch[1].append(row)
+        if len(batch[1]) == batchSize and self.open.get(batch[0]) is batch:
+            del self.open[batch[0]]
+
+    def close(self):
+        # Called once a group has been placed: its unfilled batches will not
+        # get more rows
+        self.open.clear()
+
+    def is_full(self):
+        return len(self.batches) == self.concurrency and not self.open
+
+
+def disjoint_edge_rounds(edgeGroups, batchSize, concurrency):
+    """Splits the rows of edgeGroups (grouped the way group_graph does it)
+    into rounds of at most concurrency endpoint-disjoint batches of at most
+    batchSize rows. Rounds run one after the other; an edge goes into the
+    first round that has room for it without sharing a node with another
+    batch of that round."""
+    rounds = []
+    first = 0
+    for group, rows in edgeGroups.items():
+        _, sourceLabel, destLabel = group
+        for row in rows:
+            source = (sourceLabel, row["source"])
+            dest = (destLabel, row["dest"])
+            index = first
+            while True:
+                if index == len(rounds):
+                    rounds.append(EdgeRound(concurrency))
+                batch = rounds[index].place(group, source, dest, batchSize)
+                if batch is not None:
+                    rounds[index].add(batch, row, batchSize)
+                    break
+                index += 1
+            while first < len(rounds) and rounds[first].is_full():
+                first += 1
+        for edgeRound in rounds[first:]:
+            edgeRound.close()
+        while first < len(rounds) and rounds[first].is_full():
+            first += 1
+    return [[(group, rows) for group, rows in edgeRound.batches] for edgeRound in rounds]
+
+
+def unique_node_rows(nodeGroups):
+    """Node rows with one row per key and label. The same node may come from
+    several files; two concurrent MERGEs of one key would block on the
+    constraint, so their properties are merged here in file order, which is
+    what loading them one after the other would leave behind."""
+    unique = {}
+    for label, rows in nodeGroups.items():
+        byKey = {}
+        for row in rows:
+            byKey.setdefault(row["key"], {}).update(row["props"])
+        unique[label] = [{"key": key, "props": props} for key, props in byKey.items()]
+    return unique
+
+
+async def _run_batch(tx, query, rows):
+    result = await tx.run(query, rows=rows)
+    return await result.consume()
+
+
+async def server_cores(driver):
+    """Processors available to the neo4j server, None if it does not say."""
+    try:
+        records, _, _ = await driver.execute_query(SERVER_CORES_QUERY)
+        return int(records[0]["cores"])
+    except (Neo4jError, IndexError, KeyError, TypeError, ValueError) as e:
+        log.debug("Could not read the server's processor count: %s", e)
+        return None
+
+
+async def async_load(driver, nodeGroups, edgeGroups, batchSize=DEFAULT_BATCH_SIZE, concurrency=None,
+                     database=None, profile=None, indexedProperties=()):
+    """Async counterpart of bulk_add_graph for grouped rows.
+
+    Writes the same graph with the same UNWIND templates, but keeps up to
+    concurrency write transactions in flight, each in its own session and so
+    on its own pooled connection. Node batches never share a key; edges are
+    written in rounds of endpoint-disjoint batches (disjoint_edge_rounds)
+    once every node exists. concurrency defaults to the server's processor
+    count, or this machine's when the server does not report it. profile
+    is a statement recorder, as for bulk_add_graph. Every label gets an
+    index on each of indexedProperties. The graph version is bumped at the
+    end (cypher_builder.GRAPH_VERSION_BUMP).
+    """
+    if concurrency is None:
+        concurrency = await server_cores(driver) or os.cpu_count() or 1
+    for label in sorted(nodeGroups):
+        await driver.execute_query(key_constraint_template(label), database_=database)
+        for prop in indexedProperties:
+            await driver.execute_query(property_index_template(label, prop), database_=database)
+
+    stats = LoadStats()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def write(query, rows):
+        statement = "PROFILE " + query if profile is not None and profile.profiling else query
+        async with slots:
+            started = time.perf_counter()
+            async with driver.session(database=database) as session:
+                summary = await session.execute_write(_run_batch, statement, rows)
+            stats.record(len(rows), time.perf_counter() - started)
+        if profile is not None:
+            profile.add(query, summary)
+
+    await asyncio.gather(*(write(node_unwind_template(label), batch)
+                           for label, rows in unique_node_rows(nodeGroups).items()
+                           for batch in batches(rows, batchSize)))
+    rounds = disjoint_edge_rounds(edgeGroups, batchSize, concurrency)
+    for edgeRound in rounds:
+        await asyncio.gather(*(write(edge_unwind_template(*group), rows) for group, rows in edgeRound))
+    await driver.execute_query(GRAPH_VERSION_BUMP, database_=database)
+
+    log.info("%s (%d concurrent transactions, %d edge rounds)", stats.report(), concurrency, len(rounds))
+    return stats
+
+
+def load_groups(uri, auth, nodeGroups, edgeGroups, batchSize=DEFAULT_BATCH_SIZE, concurrency=None,
+                poolSize=DEFAULT_POOL_SIZE, database=None, profile=None, indexedProperties=()):
+    """Runs async_load on a driver of its own with a connection pool of
+    poolSize; concurrency is capped at poolSize."""
+    async def run():
+        async with AsyncGraphDatabase.driver(uri, auth=auth, max_connection_pool_size=poolSize) as driver:
+            await driver.verify_connectivity()
+            slots = concurrency
+            if slots is None:
+                slots = await server_cores(driver) or os.cpu_count() or 1
+            return await async_load(driver, nodeGroups, edgeGroups, batchSize, min(slots, poolSize), database,
+                                     profile, indexedProperties)
+    return asyncio.run(run())
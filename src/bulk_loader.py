@@ -0,0 +1,201 @@
+import logging
+import time
+
+from cypher_builder import (node_unwind_template, node_replace_template, edge_unwind_template,
+                            node_delete_template, edge_delete_template, ensure_key_constraints)
+from node_keys import graph_keys, DEFAULT_KEY_STRATEGY
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def edge_type(attrs):
+    # Edges carry a single property ("verb" or "relation") that names the
+    # relationship type
+    return list(attrs.values())[0]
+
+
+def group_graph(propGraph, nodeGroups, edgeGroups, keyStrategy=DEFAULT_KEY_STRATEGY, index=None):
+    """Buckets the nodes of propGraph by label and its edges by
+    (type, source label, dest label) so each bucket can be sent as a single
+    UNWIND statement. With an EntityIndex only the nodes and edges it has
+    not written yet are added, with their merged properties."""
+    if index is not None:
+        nodes, edges = index.add(propGraph)
+        for label, key, props in nodes:
+            nodeGroups.setdefault(label, []).append({"key": key, "props": dict(props)})
+        for edgeLabel, (sourceLabel, sourceKey), (destLabel, destKey) in edges:
+            edgeGroups.setdefault((edgeLabel, sourceLabel, destLabel), []).append(
+                {"source": sourceKey, "dest": destKey})
+        return
+
+    keys = graph_keys(propGraph, keyStrategy)
+    for nodeId, attrs in propGraph.nodes(data=True):
+        label, key = keys[nodeId]
+        nodeGroups.setdefault(label, []).append({"key": key, "props": dict(attrs)})
+
+    for sourceNode, destNode, attrs in propGraph.edges(data=True):
+        sourceLabel, sourceKey = keys[sourceNode]
+        destLabel, destKey = keys[destNode]
+        edgeGroups.setdefault((edge_type(attrs), sourceLabel, destLabel), []).append(
+            {"source": sourceKey, "dest": destKey})
+
+
+MERMAID_LABEL = "RHACMComponent"
+
+
+def group_mermaid(mermaidParser, nodeGroups, edgeGroups):
+    """Adds the components of a parsed Mermaid architecture (a
+    mermaid_to_cypher.MermaidParser) in the same row shape as group_graph,
+    keyed on their Mermaid id under one RHACMComponent label. Only the
+    relationship type is kept of an edge, like for the GraphML edges."""
+    rows = nodeGroups.setdefault(MERMAID_LABEL, [])
+    for node in mermaidParser.nodes.values():
+        props = {"id": node.id, "label": node.label, "subsystem": node.subsystem,
+                 "type": node.node_type, "description": node.description}
+        for name in ("deployment_model", "deployment_pattern", "model_role"):
+            if getattr(node, name):
+                props[name] = getattr(node, name)
+        rows.append({"key": node.id, "props": props})
+    for rel in mermaidParser.relationships.values():
+        edgeGroups.setdefault((rel.relationship_type, MERMAID_LABEL, MERMAID_LABEL), []).append(
+            {"source": rel.source, "dest": rel.target})
+
+
+def batches(rows, batchSize):
+    for start in range(0, len(rows), batchSize):
+        yield rows[start:start + batchSize]
+
+
+def _run_batch(tx, query, rows):
+    return tx.run(query, rows=rows).consume()
+
+
+class LoadStats:
+    """Collects per-batch latencies so a bulk load can report throughput."""
+
+    def __init__(self):
+        self.rows = 0
+        self.latencies = []
+        self.started = time.perf_counter()
+
+    def record(self, rowCount, latency):
+        self.rows += rowCount
+        self.latencies.append(latency)
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        if not self.latencies:
+            return "Bulk load: nothing to write"
+        ordered = sorted(self.latencies)
+        p50 = ordered[len(ordered) // 2]
+        mean = sum(ordered) / len(ordered)
+        rate = self.rows / elapsed if elapsed > 0 else float("inf")
+        return ("Bulk load: %d rows in %d batches, %.3fs total, %.0f rows/s, "
+                "batch latency mean %.1fms p50 %.1fms max %.1fms"
+                % (self.rows, len(ordered), elapsed, rate,
+                   mean * 1000, p50 * 1000, ordered[-1] * 1000))
+
+
+def _execute(session, work, batchSize, stats, profile=None):
+    for query, rows in work:
+        statement = "PROFILE " + query if profile is not None and profile.profiling else query
+        for batch in batches(rows, batchSize):
+            started = time.perf_counter()
+            summary = session.execute_write(_run_batch, statement, batch)
+            stats.record(len(batch), time.perf_counter() - started)
+            if profile is not None:
+                profile.add(query, summary)
+
+
+def _write_work(nodeGroups, edgeGroups, nodeTemplate=node_unwind_template):
+    work = [(nodeTemplate(label), rows) for label, rows in nodeGroups.items()]
+    work += [(edge_unwind_template(edgeType, sourceLabel, destLabel), rows)
+             for (edgeType, sourceLabel, destLabel), rows in edgeGroups.items()]
+    return work
+
+
+def bulk_add_graph(driver, graphList, batchSize=DEFAULT_BATCH_SIZE, database=None,
+                   keyStrategy=DEFAULT_KEY_STRATEGY, profile=None, index=None, constrained=None):
+    """Bulk counterpart of add_graph.
+
+    Produces the same graph as add_graph: nodes are MERGEd on their key and
+    edges are MERGEd between the endpoints found through the kg_key
+    constraints. Statements are parameterized `UNWIND $rows AS row MERGE ...`
+    batches of at most batchSize rows, each one committed in its own explicit
+    write transaction. All nodes are written before any edge so endpoints
+    always exist. The summary of every batch goes to profile, a statement
+    recorder (DbHitProfile runs the batches under PROFILE). index is the run's
+    EntityIndex, see group_graph, and constrained its set of labels that
+    already have their constraint (see ensure_key_constraints).
+    """
+    nodeGroups = {}
+    edgeGroups = {}
+    for propGraph in graphList:
+        group_graph(propGraph, nodeGroups, edgeGroups, keyStrategy, index)
+
+    ensure_key_constraints(driver, nodeGroups, constrained)
+
+    stats = LoadStats()
+    with driver.session(database=database) as session:
+        _execute(session, _write_work(nodeGroups, edgeGroups), batchSize, stats, profile)
+
+    log.info("%s", stats.report())
+    return stats
+
+
+def bulk_add_nodes(driver, nodeGroups, batchSize=DEFAULT_BATCH_SIZE, database=None, profile=None,
+                   constrained=None):
+    """Writes node rows grouped by label ({label: [{key, props}]}) only,
+    e.g. properties computed for nodes that are already loaded: each row is
+    MERGEd on its key and its props are added to the node."""
+    ensure_key_constraints(driver, nodeGroups, constrained)
+
+    stats = LoadStats()
+    with driver.session(database=database) as session:
+        _execute(session, _write_work(nodeGroups, {}), batchSize, stats, profile)
+
+    log.info("%s", stats.report())
+    return stats
+
+
+def bulk_add_chunks(driver, chunks, batchSize=DEFAULT_BATCH_SIZE, database=None, profile=None,
+                    constrained=None):
+    """bulk_add_graph for rows that arrive in chunks of (nodeGroups,
+    edgeGroups), e.g. from graphml_stream.stream_groups. Each chunk is
+    written, nodes first, before the next one is taken, so only one chunk
+    is held at a time. A chunk's edges may only point at nodes of that or
+    an earlier chunk. constrained is as for bulk_add_graph."""
+    constrained = set() if constrained is None else constrained
+    stats = LoadStats()
+    with driver.session(database=database) as session:
+        for nodeGroups, edgeGroups in chunks:
+            ensure_key_constraints(driver, nodeGroups, constrained)
+            _execute(session, _write_work(nodeGroups, edgeGroups), batchSize, stats, profile)
+
+    log.info("%s", stats.report())
+    return stats
+
+
+def apply_changes(driver, nodeGroups, edgeGroups, removedNodeGroups, removedEdgeGroups,
+                  batchSize=DEFAULT_BATCH_SIZE, database=None):
+    """Writes an incremental change set. nodeGroups/edgeGroups hold rows in the
+    same shape group_graph builds, the node rows carry the complete
+    properties, which replace the stored ones (properties removed from the
+    input are removed); removedNodeGroups maps a label to the keys to DETACH
+    DELETE and removedEdgeGroups maps (type, source label, dest label) to
+    {source, dest} key rows. Deletes run first so a node that moved to a new
+    key does not briefly exist twice."""
+    ensure_key_constraints(driver, nodeGroups)
+
+    work = [(edge_delete_template(edgeType, sourceLabel, destLabel), rows)
+            for (edgeType, sourceLabel, destLabel), rows in removedEdgeGroups.items()]
+    work += [(node_delete_template(label), rows) for label, rows in removedNodeGroups.items()]
+    work += _write_work(nodeGroups, edgeGroups, node_replace_template)
+
+    stats = LoadStats()
+    with driver.session(database=database) as session:
+        _execute(session, work, batchSize, stats)
+    return stats
@@ -0,0 +1,379 @@
+import json
+import os
+
+import networkx as nx
+import numpy as np
+
+from bulk_loader import edge_type
+from graph_store import add_graphs, add_index, add_parser
+from node_keys import DEFAULT_KEY_STRATEGY
+
+
+# Per-node categorical columns; entity is the Neo4j label
+COLUMNS = ("entity", "type", "subsystem")
+
+
+def code_dtype(count):
+    """The smallest unsigned integer type for count distinct codes."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if count <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+def index_dtype(count):
+    """Signed type for node and relationship numbers, so arithmetic on them
+    (i + 1, differences) cannot wrap around."""
+    return np.int32 if count < np.iinfo(np.int32).max else np.int64
+
+
+class Categories:
+    """Strings of one column as integer codes into a table of the distinct
+    values, in order of first appearance."""
+
+    def __init__(self):
+        self.names = []
+        self.codes = {}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.names)
+            self.names.append(value)
+        return code
+
+
+class CompactGraphBuilder:
+    """Collects nodes and relationships through the add_node /
+    add_relationship interface of graph_store.GraphStore (so add_parser and
+    add_graphs feed it) and builds a CompactGraph once at the end. With
+    keepProperties the property dicts are kept too, as JSON text per node
+    and relationship, so the graph can be restored (see snapshot.py)."""
+
+    def __init__(self, keepProperties=False):
+        self.ids = []
+        self.index = {}
+        self.labels = []
+        self.columns = {column: (Categories(), []) for column in COLUMNS}
+        self.relTypes = Categories()
+        self.sources = []
+        self.targets = []
+        self.types = []
+        self.crossCluster = []
+        self.properties = [] if keepProperties else None
+        self.edgeProperties = [] if keepProperties else None
+        self.edgeKeys = None
+
+    def add_node(self, nodeId, label, subsystem, nodeType, props=(), entity=None):
+        """entity is the Neo4j label of the node (see GraphStore.add_node);
+        without it the entity property is taken."""
+        self.index[nodeId] = len(self.ids)
+        self.ids.append(nodeId)
+        self.labels.append(label)
+        props = dict(props)
+        if entity is None:
+            entity = props.get("entity", nodeType)
+        values = {"entity": entity, "type": nodeType, "subsystem": subsystem}
+        for column, (categories, codes) in self.columns.items():
+            codes.append(categories.code(values[column]))
+        if self.properties is not None:
+            self.properties.append(json.dumps(props))
+
+    def merge_node(self, nodeId, props):
+        # The columns come from the first mention of a node, like the
+        # properties of GraphStore
+        if self.properties is not None:
+            i = self.index[nodeId]
+            merged = json.loads(self.properties[i])
+            merged.update((name, value) for name, value in props.items() if name not in merged)
+            self.properties[i] = json.dumps(merged)
+
+    def add_relationship(self, sourceId, relType, targetId, cross_cluster=False, **props):
+        self.add_edge(sourceId, relType, targetId, cross_cluster, props)
+
+    def add_edge(self, sourceId, relType, targetId, crossCluster=False, props=(), edgeKey=None):
+        """add_relationship with the properties as a dict (GraphML attribute
+        names may be anything) and the key of a multigraph edge."""
+        self.sources.append(self.index[sourceId])
+        self.targets.append(self.index[targetId])
+        self.types.append(self.relTypes.code(relType))
+        self.crossCluster.append(bool(crossCluster))
+        if self.edgeProperties is not None:
+            self.edgeProperties.append(json.dumps(dict(props)))
+        if edgeKey is not None:
+            if self.edgeKeys is None:
+                self.edgeKeys = [json.dumps(None)] * (len(self.sources) - 1)
+            self.edgeKeys.append(json.dumps(edgeKey))
+
+    def build(self):
+        count = len(self.ids)
+        indexType = index_dtype(count)
+        sources = np.array(self.sources, dtype=indexType)
+        targets = np.array(self.targets, dtype=indexType)
+        types = np.array(self.types, dtype=code_dtype(len(self.relTypes.names)))
+        # Relationships are numbered in CSR order of their source; a stable
+        # sort keeps the insertion order among the relationships of a node
+        order = np.argsort(sources, kind="stable").astype(indexType)
+        sources, targets, types = sources[order], targets[order], types[order]
+        crossCluster = np.array(self.crossCluster, dtype=bool)[order]
+        inEdges = np.argsort(targets, kind="stable").astype(index_dtype(len(targets)))
+        columns = {column: (np.array(codes, dtype=code_dtype(len(categories.names))), categories.names)
+                   for column, (categories, codes) in self.columns.items()}
+        tables = {"ids": self.ids, "labels": self.labels}
+        for name, table in (("properties", self.properties), ("edgeProperties", self.edgeProperties),
+                            ("edgeKeys", self.edgeKeys)):
+            if table is not None:
+                tables[name] = table if name == "properties" else [table[k] for k in order.tolist()]
+        return CompactGraph(columns, self.relTypes.names, _offsets(sources, count), targets, types, crossCluster,
+                            _offsets(targets[inEdges], count), sources[inEdges], inEdges, order, **tables)
+
+
+def _offsets(sortedEnds, count):
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sortedEnds, minlength=count), out=offsets[1:])
+    return offsets
+
+
+class CompactGraph:
+    """A read-only merged graph in compressed sparse row arrays.
+
+    Nodes are numbered 0..n-1 (ids and labels are lists indexed by number;
+    entity, type and subsystem are code arrays into per-column name
+    tables). Relationships are numbered in the order of outTargets: the ones
+    of node i are outOffsets[i]:outOffsets[i + 1], with their relationship
+    type code in outTypes and cross_cluster flag in crossCluster. The
+    incoming side has inOffsets / inSources, and inEdges maps an incoming
+    position to the relationship number. Neighbor accessors return views of
+    these arrays, not copies, so they must not be written to."""
+
+    ARRAYS = ("outOffsets", "outTargets", "outTypes", "crossCluster", "inOffsets", "inSources", "inEdges",
+              "edgeOrder")
+    TABLES = ("ids", "labels", "properties", "edgeProperties", "edgeKeys")
+
+    def __init__(self, columns, relTypeNames, outOffsets, outTargets, outTypes, crossCluster, inOffsets, inSources,
+                 inEdges, edgeOrder, ids, labels, properties=None, edgeProperties=None, edgeKeys=None, graph=None):
+        self.columns = columns
+        self.relTypeNames = relTypeNames
+        self.outOffsets = outOffsets
+        self.outTargets = outTargets
+        self.outTypes = outTypes
+        self.crossCluster = crossCluster
+        self.inOffsets = inOffsets
+        self.inSources = inSources
+        self.inEdges = inEdges
+        # Insertion number of every relationship
+        self.edgeOrder = edgeOrder
+        # Sequences of str indexed by node / relationship number; lists, or
+        # memory-mapped snapshot.StringTable. The property tables are JSON.
+        self.ids = ids
+        self.labels = labels
+        self.properties = properties
+        self.edgeProperties = edgeProperties
+        self.edgeKeys = edgeKeys
+        # Graph attributes of a graph built by from_graph
+        self.graph = graph or {}
+        self._index = None
+        self._sources = None
+
+    @classmethod
+    def from_parser(cls, parser, keepProperties=False):
+        builder = CompactGraphBuilder(keepProperties)
+        add_parser(builder, parser)
+        return builder.build()
+
+    @classmethod
+    def from_graphs(cls, graphList, keyStrategy=DEFAULT_KEY_STRATEGY, keepProperties=False):
+        builder = CompactGraphBuilder(keepProperties)
+        add_graphs(builder, graphList, keyStrategy)
+        return builder.build()
+
+    @classmethod
+    def from_index(cls, index, keepProperties=False):
+        """The merged graph of an EntityIndex, see graph_store.add_index."""
+        builder = CompactGraphBuilder(keepProperties)
+        add_index(builder, index)
+        return builder.build()
+
+    @classmethod
+    def from_graph(cls, propGraph):
+        """One GraphML graph as loadGraph returns it, without resolving its
+        nodes: ids are the GraphML ids, and every attribute (and the edge
+        keys of a multigraph) is kept so to_networkx gives the graph back."""
+        builder = CompactGraphBuilder(keepProperties=True)
+        subsystem = os.path.splitext(propGraph.graph.get("source", ""))[0]
+        for nodeId, attrs in propGraph.nodes(data=True):
+            builder.add_node(nodeId, attrs.get("name", nodeId), subsystem, attrs.get("entity", ""), attrs,
+                             attrs.get("label", attrs.get("entity", "")))
+        if propGraph.is_multigraph():
+            for source, target, key, attrs in propGraph.edges(keys=True, data=True):
+                builder.add_edge(source, edge_type(attrs) if attrs else "", target, props=attrs, edgeKey=key)
+        else:
+            for source, target, attrs in propGraph.edges(data=True):
+                builder.add_edge(source, edge_type(attrs) if attrs else "", target, props=attrs)
+        graph = builder.build()
+        graph.graph = dict(propGraph.graph, multigraph=propGraph.is_multigraph(), directed=propGraph.is_directed())
+        return graph
+
+    def to_networkx(self):
+        """The networkx graph a from_graph CompactGraph was built from, with
+        its nodes and edges in their original order."""
+        attrs = dict(self.graph)
+        graphClass = {(False, False): nx.Graph, (False, True): nx.DiGraph, (True, False): nx.MultiGraph,
+                      (True, True): nx.MultiDiGraph}[(attrs.pop("multigraph"), attrs.pop("directed"))]
+        propGraph = graphClass()
+        propGraph.graph.update(attrs)
+        ids = list(self.ids)
+        propGraph.add_nodes_from(zip(ids, map(json.loads, self.properties)))
+        sources = self.edge_sources().tolist()
+        targets = self.outTargets.tolist()
+        edgeProperties = list(self.edgeProperties)
+        edgeKeys = list(self.edgeKeys) if self.edgeKeys is not None else None
+        # Most edges carry one of a few property sets (the relationship type)
+        parsed = {}
+        for r in self.insertion_order().tolist():
+            text = edgeProperties[r]
+            attrs = parsed.get(text)
+            if attrs is None:
+                attrs = parsed[text] = json.loads(text)
+            if edgeKeys is not None:
+                propGraph.add_edge(ids[sources[r]], ids[targets[r]], json.loads(edgeKeys[r]), **attrs)
+            else:
+                propGraph.add_edge(ids[sources[r]], ids[targets[r]], **attrs)
+        return propGraph
+
+    def state(self):
+        """(arrays, tables, meta) to save this graph with; from_state
+        builds it again."""
+        arrays = {name: getattr(self, name) for name in self.ARRAYS}
+        arrays.update(("column." + column, codes) for column, (codes, _) in self.columns.items())
+        tables = {name: getattr(self, name) for name in self.TABLES if getattr(self, name) is not None}
+        meta = {"columns": {column: names for column, (_, names) in self.columns.items()},
+                "relTypeNames": self.relTypeNames, "graph": self.graph}
+        return arrays, tables, meta
+
+    @classmethod
+    def from_state(cls, arrays, tables, meta):
+        columns = {column: (arrays["column." + column], names) for column, names in meta["columns"].items()}
+        return cls(columns, meta["relTypeNames"], *(arrays[name] for name in cls.ARRAYS), graph=meta["graph"],
+                   **tables)
+
+    @property
+    def node_count(self):
+        return len(self.ids)
+
+    @property
+    def edge_count(self):
+        return len(self.outTargets)
+
+    def node(self, nodeId):
+        """The number of the node with this id."""
+        if self._index is None:
+            self._index = {nodeId: i for i, nodeId in enumerate(self.ids)}
+        return self._index[nodeId]
+
+    def codes(self, column):
+        return self.columns[column][0]
+
+    def names(self, column):
+        return self.columns[column][1]
+
+    def value(self, column, i):
+        codes, names = self.columns[column]
+        return names[codes[i]]
+
+    def node_properties(self, i):
+        return json.loads(self.properties[i]) if self.properties is not None else {}
+
+    def edge_properties(self, r):
+        return json.loads(self.edgeProperties[r]) if self.edgeProperties is not None else {}
+
+    def insertion_order(self):
+        """Relationship numbers in the order they were added."""
+        return np.argsort(self.edgeOrder, kind="stable")
+
+    def rel_type_code(self, relType):
+        """The code of relType, -1 if no relationship has it."""
+        try:
+            return self.relTypeNames.index(relType)
+        except ValueError:
+            return -1
+
+    def out_neighbors(self, i):
+        return self.outTargets[self.outOffsets[i]:self.outOffsets[i + 1]]
+
+    def out_types(self, i):
+        return self.outTypes[self.outOffsets[i]:self.outOffsets[i + 1]]
+
+    def in_neighbors(self, i):
+        return self.inSources[self.inOffsets[i]:self.inOffsets[i + 1]]
+
+    def in_types(self, i):
+        return self.outTypes[self.inEdges[self.inOffsets[i]:self.inOffsets[i + 1]]]
+
+    def out_neighbors_of(self, nodes):
+        """The out-neighbors of every node of the array nodes, concatenated
+        (with repeats), e.g. for one level of a breadth-first search."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        starts = self.outOffsets[nodes]
+        counts = self.outOffsets[nodes + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return self.outTargets[:0]
+        # Position j of the result is starts[k] + (j - first position of k)
+        shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self.outTargets[shifts + np.arange(total)]
+
+    def edge_sources(self):
+        """Source node of every relationship (the CSR rows expanded)."""
+        if self._sources is None:
+            self._sources = np.repeat(np.arange(self.node_count, dtype=self.outTargets.dtype),
+                                      np.diff(self.outOffsets))
+        return self._sources
+
+    def out_degree(self, relType=None):
+        if relType is None:
+            return np.diff(self.outOffsets)
+        return np.bincount(self.edge_sources()[self.outTypes == self.rel_type_code(relType)],
+                           minlength=self.node_count)
+
+    def in_degree(self, relType=None):
+        if relType is None:
+            return np.diff(self.inOffsets)
+        return np.bincount(self.outTargets[self.outTypes == self.rel_type_code(relType)],
+                           minlength=self.node_count)
+
+    def degrees_by_type(self):
+        """(out, in) arrays of shape (relationship types, nodes)."""
+        types = len(self.relTypeNames)
+        count = self.node_count
+        out = np.bincount(self.outTypes.astype(np.int64) * count + self.edge_sources(),
+                          minlength=types * count).reshape(types, count)
+        incoming = np.bincount(self.outTypes.astype(np.int64) * count + self.outTargets,
+                               minlength=types * count).reshape(types, count)
+        return out, incoming
+
+    def cross_subsystem_mask(self):
+        """True for the relationships between two subsystems."""
+        subsystems = self.codes("subsystem")
+        return subsystems[self.edge_sources()] != subsystems[self.outTargets]
+
+    def cross_subsystem_counts(self):
+        """{(source subsystem, target subsystem, relationship type): count}
+        over the relationships between two subsystems."""
+        subsystems = self.codes("subsystem").astype(np.int64)
+        names = self.names("subsystem")
+        mask = self.cross_subsystem_mask()
+        sourceCodes = subsystems[self.edge_sources()[mask]]
+        targetCodes = subsystems[self.outTargets[mask]]
+        types = len(self.relTypeNames)
+        keys = (sourceCodes * len(names) + targetCodes) * types + self.outTypes[mask]
+        unique, counts = np.unique(keys, return_counts=True)
+        return {(names[key // types // len(names)], names[key // types % len(names)],
+                 self.relTypeNames[key % types]): int(count)
+                for key, count in zip(unique.tolist(), counts.tolist())}
+
+    def nbytes(self):
+        """Bytes of the arrays; the id, label and name lists are not counted."""
+        arrays = [self.outOffsets, self.outTargets, self.outTypes, self.crossCluster, self.inOffsets,
+                  self.inSources, self.inEdges] + [codes for codes, _ in self.columns.values()]
+        return sum(array.nbytes for array in arrays)
@@ -0,0 +1,170 @@
+import re
+from functools import lru_cache
+
+from node_keys import KEY_PROPERTY
+
+
+# Labels, relationship types and property keys are the only things that end
+# up in the query text, everything else travels as a parameter. They come from
+# the GraphML files, so they are checked against this whitelist before being
+# spliced into a statement.
+NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+TEMPLATE_CACHE_SIZE = 256
+
+
+def check_name(name, kind="name"):
+    if not isinstance(name, str) or not NAME_PATTERN.match(name):
+        raise ValueError("Invalid %s for a cypher statement: %r" % (kind, name))
+    return name
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def key_constraint_template(label):
+    check_name(label, "label")
+    return ("CREATE CONSTRAINT kg_key_" + label + " IF NOT EXISTS "
+            "FOR (n:" + label + ") REQUIRE n." + KEY_PROPERTY + " IS UNIQUE")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def property_index_template(label, prop):
+    check_name(label, "label")
+    check_name(prop, "property key")
+    return ("CREATE INDEX kg_" + label + "_" + prop + " IF NOT EXISTS "
+            "FOR (n:" + label + ") ON (n." + prop + ")")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def node_merge_template(label):
+    """MERGE of a single node on its key ($key); the properties in $props are
+    set on it afterwards."""
+    return ("MERGE (n:" + check_name(label, "label") + " {" + KEY_PROPERTY + ": $key}) "
+            "SET n += $props "
+            "RETURN n.name")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def edge_merge_template(edgeType, sourceLabel, destLabel):
+    """MERGE of a single relationship between the nodes keyed $source and
+    $dest. Both endpoints are labelled so the lookup goes through the kg_key
+    uniqueness constraint."""
+    return ("MATCH (sourceNode:" + check_name(sourceLabel, "label") + " {" + KEY_PROPERTY + ": $source}) "
+            "MATCH (destNode:" + check_name(destLabel, "label") + " {" + KEY_PROPERTY + ": $dest}) "
+            "MERGE (sourceNode)-[r:" + check_name(edgeType, "relationship type") + "]->(destNode) "
+            "RETURN sourceNode.name, destNode.name,type(r)")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def node_unwind_template(label):
+    return ("UNWIND $rows AS row "
+            "MERGE (n:" + check_name(label, "label") + " {" + KEY_PROPERTY + ": row.key}) "
+            "SET n += row.props")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def node_replace_template(label):
+    """node_unwind_template that replaces the properties instead of adding
+    to them, so a property dropped from the input goes away; the kg_key
+    comes back from row.key."""
+    return ("UNWIND $rows AS row "
+            "MERGE (n:" + check_name(label, "label") + " {" + KEY_PROPERTY + ": row.key}) "
+            "SET n = row.props, n." + KEY_PROPERTY + " = row.key")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def edge_unwind_template(edgeType, sourceLabel, destLabel):
+    return ("UNWIND $rows AS row "
+            "MATCH (sourceNode:" + check_name(sourceLabel, "label") + " {" + KEY_PROPERTY + ": row.source}) "
+            "MATCH (destNode:" + check_name(destLabel, "label") + " {" + KEY_PROPERTY + ": row.dest}) "
+            "MERGE (sourceNode)-[r:" + check_name(edgeType, "relationship type") + "]->(destNode)")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def node_delete_template(label):
+    return ("UNWIND $rows AS row "
+            "MATCH (n:" + check_name(label, "label") + " {" + KEY_PROPERTY + ": row}) "
+            "DETACH DELETE n")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def edge_delete_template(edgeType, sourceLabel, destLabel):
+    return ("UNWIND $rows AS row "
+            "MATCH (sourceNode:" + check_name(sourceLabel, "label") + " {" + KEY_PROPERTY + ": row.source})"
+            "-[r:" + check_name(edgeType, "relationship type") + "]->"
+            "(destNode:" + check_name(destLabel, "label") + " {" + KEY_PROPERTY + ": row.dest}) "
+            "DELETE r")
+
+
+# The graph version: every load ends with GRAPH_VERSION_BUMP, so readers
+# that cache query results (query_service) see that the graph changed. The
+# stamp is random rather than a counter so that a database emptied and
+# loaded again never repeats a stamp an old cache entry was made under.
+GRAPH_META_LABEL = "KGMeta"
+GRAPH_VERSION_BUMP = ("MERGE (m:" + GRAPH_META_LABEL + " {id: 'graph'}) "
+                      "SET m.version = coalesce(m.version, 0) + 1, m.stamp = randomUUID(), m.updated_at = datetime()")
+GRAPH_VERSION_QUERY = ("MATCH (m:" + GRAPH_META_LABEL + " {id: 'graph'}) "
+                       "RETURN m.version AS version, m.stamp AS stamp")
+
+
+def bump_graph_version(driver, database=None):
+    """Gives the graph a new version stamp, after it has been written to."""
+    driver.execute_query(GRAPH_VERSION_BUMP, database_=database)
+
+
+def template_cache_info():
+    return {
+        "node_merge": node_merge_template.cache_info(),
+        "edge_merge": edge_merge_template.cache_info(),
+        "node_unwind": node_unwind_template.cache_info(),
+        "node_replace": node_replace_template.cache_info(),
+        "edge_unwind": edge_unwind_template.cache_info(),
+    }
+
+
+def ensure_key_constraints(driver, labels, constrained=None):
+    """Creates the kg_key uniqueness constraint (and with it the index) for
+    every label before anything is loaded. constrained is the set of labels
+    already done in this run; they are skipped and the new ones added."""
+    labels = set(labels)
+    if constrained is not None:
+        labels -= constrained
+        constrained |= labels
+    for label in sorted(labels):
+        driver.execute_query(key_constraint_template(label))
+
+
+def ensure_property_indexes(driver, labels, props):
+    """Creates an index on every property of props for every label."""
+    for label in sorted(set(labels)):
+        for prop in props:
+            driver.execute_query(property_index_template(label, prop))
+
+
+def plan_db_hits(plan):
+    if not plan:
+        return 0
+    return plan.get("dbHits", 0) + sum(plan_db_hits(child) for child in plan.get("children", []))
+
+
+class DbHitProfile:
+    """Sums the PROFILE db hits of every statement per template, so the cost
+    of a load can be compared between matching strategies. Statement
+    recorders (see metrics.StatementMetrics) say through profiling whether
+    the statements have to run under PROFILE."""
+
+    profiling = True
+
+    def __init__(self):
+        self.hits = {}
+        self.calls = {}
+
+    def add(self, query, summary):
+        self.hits[query] = self.hits.get(query, 0) + plan_db_hits(summary.profile)
+        self.calls[query] = self.calls.get(query, 0) + 1
+
+    def report(self):
+        lines = ["PROFILE db hits by statement template:"]
+        for query in sorted(self.hits, key=self.hits.get, reverse=True):
+            lines.append("  %8d hits %5d calls  %s" % (self.hits[query], self.calls[query], query))
+        lines.append("  %8d hits total" % sum(self.hits.values()))
+        return "\n".join(lines)
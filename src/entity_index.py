@@ -0,0 +1,90 @@
+import logging
+
+from bulk_loader import edge_type
+from node_keys import graph_keys, DEFAULT_KEY_STRATEGY
+
+
+log = logging.getLogger(__name__)
+
+
+class EntityIndex:
+    """Resolves the nodes of every graph of a run to one canonical entity.
+
+    GraphML ids are only unique within their file, so nodes are looked up by
+    (file, local id). The canonical (label, kg_key) comes from the key
+    strategy; with the default "entity" strategy the same component named in
+    several files resolves to one entity. Its properties are merged (the
+    first file to set a property wins, later conflicting values are logged),
+    and add() only hands back the nodes whose merged properties changed and
+    the edges not seen before, so repeats cost no writes."""
+
+    def __init__(self, keyStrategy=DEFAULT_KEY_STRATEGY):
+        self.keyStrategy = keyStrategy
+        self.ids = {}
+        self.entities = {}
+        # The file every entity was first seen in
+        self.sources = {}
+        self.edges = set()
+        self.mentions = 0
+        self.skippedNodes = 0
+        self.skippedEdges = 0
+
+    def resolve(self, source, nodeId):
+        """(label, kg_key) of node nodeId of the file source."""
+        return self.ids[(source, nodeId)]
+
+    def add(self, propGraph):
+        """Indexes propGraph. Returns (nodes, edges) still to be written:
+        (label, key, merged props) per node and (type, (label, key),
+        (label, key)) per edge."""
+        source = propGraph.graph.get("source", "")
+        keys = graph_keys(propGraph, self.keyStrategy)
+        nodes = {}
+        for nodeId, attrs in propGraph.nodes(data=True):
+            entity = keys[nodeId]
+            self.ids[(source, nodeId)] = entity
+            props = self.add_node(entity, attrs, source)
+            if props is not None:
+                nodes[entity] = props
+
+        edges = []
+        for sourceNode, destNode, attrs in propGraph.edges(data=True):
+            edge = (edge_type(attrs), self.ids[(source, sourceNode)], self.ids[(source, destNode)])
+            if self.add_edge(edge):
+                edges.append(edge)
+        return [(label, key, props) for (label, key), props in nodes.items()], edges
+
+    def add_node(self, entity, attrs, source=""):
+        """Merges one mention of entity (label, kg_key) with properties attrs
+        from the file source. Returns the merged properties when they changed,
+        None when the node needs no write."""
+        self.mentions += 1
+        props = self.entities.get(entity)
+        if props is None:
+            self.entities[entity] = props = dict(attrs)
+            self.sources[entity] = source
+            return props
+        changed = False
+        for prop, value in attrs.items():
+            if prop not in props:
+                props[prop] = value
+                changed = True
+            elif props[prop] != value:
+                log.debug("%s %s: keeping %s=%r, %s has %r", entity[0], entity[1], prop, props[prop],
+                          source, value)
+        if changed:
+            return props
+        self.skippedNodes += 1
+        return None
+
+    def add_edge(self, edge):
+        """True when edge (type, (label, key), (label, key)) was not seen yet."""
+        if edge in self.edges:
+            self.skippedEdges += 1
+            return False
+        self.edges.add(edge)
+        return True
+
+    def stats(self):
+        return {"node_mentions": self.mentions, "entities": len(self.entities), "edges": len(self.edges),
+                "skipped_node_writes": self.skippedNodes, "skipped_edge_writes": self.skippedEdges}
@@ -0,0 +1,119 @@
+import csv
+import logging
+import os
+
+from cypher_builder import check_name, key_constraint_template, GRAPH_VERSION_BUMP
+from entity_index import EntityIndex
+from node_keys import KEY_PROPERTY, DEFAULT_KEY_STRATEGY
+
+
+log = logging.getLogger(__name__)
+
+ID_COLUMN = KEY_PROPERTY + ":ID"
+START_LABEL_COLUMN = "startLabel:IGNORE"
+END_LABEL_COLUMN = "endLabel:IGNORE"
+IMPORT_SCRIPT = "neo4j-admin-import.sh"
+LOAD_CSV_SCRIPT = "load_csv.cypher"
+
+
+def node_file(label):
+    return "nodes_" + label + ".csv"
+
+
+def relationship_file(edgeType):
+    return "relationships_" + edgeType + ".csv"
+
+
+class CsvExporter:
+    """Collects graphs and writes them in the layout `neo4j-admin database
+    import` expects: one header-annotated node CSV per label (kg_key is the
+    :ID, so it ends up as the kg_key property) and one relationship CSV per
+    type. Nodes and relationships are resolved and merged through an
+    EntityIndex like on a live load (pass the run's index), so the offline
+    import yields the same graph."""
+
+    def __init__(self, keyStrategy=DEFAULT_KEY_STRATEGY, index=None):
+        self.keyStrategy = keyStrategy
+        self.index = index if index is not None else EntityIndex(keyStrategy)
+        self.nodes = {}
+        self.edges = {}
+
+    def add(self, propGraph):
+        nodes, edges = self.index.add(propGraph)
+        # props is the index's merged dict, it is only read by write()
+        for label, key, props in nodes:
+            self.nodes.setdefault(check_name(label, "label"), {})[key] = props
+        for edgeLabel, (sourceLabel, sourceKey), (destLabel, destKey) in edges:
+            edgeLabel = check_name(edgeLabel, "relationship type")
+            self.edges.setdefault(edgeLabel, {})[(sourceKey, destKey)] = (sourceLabel, destLabel)
+
+    def write(self, outDir, loadCsv=False, batchSize=1000):
+        os.makedirs(outDir, exist_ok=True)
+        columns = {}
+        for label, nodes in sorted(self.nodes.items()):
+            columns[label] = sorted({key for props in nodes.values() for key in props})
+            with open(os.path.join(outDir, node_file(label)), "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow([ID_COLUMN, ":LABEL"] + columns[label])
+                for key, props in nodes.items():
+                    # Missing properties stay empty (unquoted), which both
+                    # importers read as "not set"
+                    writer.writerow([key, label] + [props.get(column, "") for column in columns[label]])
+
+        for edgeLabel, pairs in sorted(self.edges.items()):
+            with open(os.path.join(outDir, relationship_file(edgeLabel)), "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                # The endpoint labels are skipped by neo4j-admin (:IGNORE) but
+                # let LOAD CSV match the endpoints through the kg_key index
+                writer.writerow([":START_ID", ":END_ID", ":TYPE", START_LABEL_COLUMN, END_LABEL_COLUMN])
+                for (sourceKey, destKey), (sourceLabel, destLabel) in pairs.items():
+                    writer.writerow([sourceKey, destKey, edgeLabel, sourceLabel, destLabel])
+
+        self._write_import_script(outDir)
+        if loadCsv:
+            self._write_load_csv(outDir, columns, batchSize)
+        log.info("Exported %d nodes in %d label files and %d relationships in %d type files to %s",
+                 sum(len(nodes) for nodes in self.nodes.values()), len(self.nodes),
+                 sum(len(pairs) for pairs in self.edges.values()), len(self.edges), outDir)
+
+    def _write_import_script(self, outDir):
+        lines = ["#!/bin/bash",
+                 "#",
+                 "# Offline initial load of the exported CSVs. Run from this directory on a",
+                 "# stopped server; the target database must not exist yet.",
+                 "#",
+                 "neo4j-admin database import full \\"]
+        lines += ["    --nodes=%s \\" % node_file(label) for label in sorted(self.nodes)]
+        lines += ["    --relationships=%s \\" % relationship_file(edgeLabel) for edgeLabel in sorted(self.edges)]
+        lines.append('    "${1:-neo4j}"')
+        path = os.path.join(outDir, IMPORT_SCRIPT)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.chmod(path, 0o755)
+
+    def _write_load_csv(self, outDir, columns, batchSize):
+        # For an existing database: copy the CSVs into the server's import/
+        # directory and run this through cypher-shell
+        lines = ["// Batched LOAD CSV of the exported files; copy them into the neo4j import/ directory first.", ""]
+        lines += [key_constraint_template(label) + ";" for label in sorted(self.nodes)]
+        lines.append("")
+        for label in sorted(self.nodes):
+            props = ", ".join("%s: row.%s" % (check_name(column, "property key"), column) for column in columns[label])
+            lines.append("LOAD CSV WITH HEADERS FROM 'file:///%s' AS row\n"
+                         "CALL { WITH row MERGE (n:%s {%s: row.`%s`}) SET n += {%s} }\n"
+                         "IN TRANSACTIONS OF %d ROWS;"
+                         % (node_file(label), label, KEY_PROPERTY, ID_COLUMN, props, batchSize))
+        lines.append("")
+        for edgeLabel, pairs in sorted(self.edges.items()):
+            for sourceLabel, destLabel in sorted(set(pairs.values())):
+                lines.append("LOAD CSV WITH HEADERS FROM 'file:///%s' AS row\n"
+                             "WITH row WHERE row.`%s` = '%s' AND row.`%s` = '%s'\n"
+                             "CALL { WITH row MATCH (sourceNode:%s {%s: row.`:START_ID`}) "
+                             "MATCH (destNode:%s {%s: row.`:END_ID`}) "
+                             "MERGE (sourceNode)-[:%s]->(destNode) }\n"
+                             "IN TRANSACTIONS OF %d ROWS;"
+                             % (relationship_file(edgeLabel), START_LABEL_COLUMN, sourceLabel, END_LABEL_COLUMN,
+                                destLabel, sourceLabel, KEY_PROPERTY, destLabel, KEY_PROPERTY, edgeLabel, batchSize))
+        lines += ["", GRAPH_VERSION_BUMP + ";"]
+        with open(os.path.join(outDir, LOAD_CSV_SCRIPT), "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
@@ -0,0 +1,182 @@
+import logging
+
+import numpy as np
+
+from bulk_loader import bulk_add_nodes, DEFAULT_BATCH_SIZE
+from cypher_builder import ensure_property_indexes
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DAMPING = 0.85
+# Convergence when the L1 change of the ranks is below node count * tolerance
+# (the criterion of networkx.pagerank)
+DEFAULT_TOLERANCE = 1e-6
+DEFAULT_MAX_ITERATIONS = 100
+
+# Node properties written by write_analytics / analytics_groups; the degree per
+# relationship type is written as out_degree_<TYPE> / in_degree_<TYPE> where
+# it is not 0, so a missing property means no such relationship
+ANALYTICS_PROPERTIES = ("out_degree", "in_degree", "cross_subsystem_degree", "subsystem_boundary", "root", "leaf",
+                        "pagerank", "scc_id", "scc_size")
+TYPE_DEGREE_PREFIXES = ("out_degree_", "in_degree_")
+# The ones dashboards filter and sort on get an index
+INDEXED_PROPERTIES = ("out_degree", "in_degree", "subsystem_boundary", "root", "leaf", "pagerank", "scc_id")
+
+
+def pagerank(graph, damping=DEFAULT_DAMPING, tolerance=DEFAULT_TOLERANCE, maxIterations=DEFAULT_MAX_ITERATIONS):
+    """PageRank of every node of a CompactGraph by power iteration, the same
+    values as networkx.pagerank on the multigraph: parallel relationships
+    count once each and nodes without relationships spread their rank over
+    every node."""
+    count = graph.node_count
+    if count == 0:
+        return np.zeros(0)
+    sources = graph.edge_sources()
+    targets = graph.outTargets
+    outDegree = np.diff(graph.outOffsets)
+    dangling = outDegree == 0
+    share = np.zeros(count)
+    np.divide(1.0, outDegree, out=share, where=~dangling)
+    edgeShare = share[sources]
+    rank = np.full(count, 1.0 / count)
+    for _ in range(maxIterations):
+        previous = rank
+        rank = damping * np.bincount(targets, weights=previous[sources] * edgeShare, minlength=count)
+        rank += (damping * previous[dangling].sum() + 1.0 - damping) / count
+        if np.abs(rank - previous).sum() < count * tolerance:
+            return rank
+    log.warning("PageRank did not converge in %d iterations", maxIterations)
+    return rank
+
+
+def strongly_connected_components(graph):
+    """Component number of every node of a CompactGraph (iterative Tarjan),
+    numbered in the order of their first node."""
+    count = graph.node_count
+    offsets = graph.outOffsets.tolist()
+    targets = graph.outTargets.tolist()
+    index = [-1] * count
+    low = [0] * count
+    onStack = [False] * count
+    stack = []
+    components = [0] * count
+    found = 0
+    counter = 0
+    for root in range(count):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        onStack[root] = True
+        work = [(root, offsets[root])]
+        while work:
+            node, position = work[-1]
+            end = offsets[node + 1]
+            while position < end:
+                successor = targets[position]
+                position += 1
+                if index[successor] < 0:
+                    work[-1] = (node, position)
+                    index[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    onStack[successor] = True
+                    work.append((successor, offsets[successor]))
+                    break
+                if onStack[successor] and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        onStack[member] = False
+                        components[member] = found
+                        if member == node:
+                            break
+                    found += 1
+    components = np.array(components, dtype=np.int64)
+    if count == 0:
+        return components
+    # Tarjan finds components in reverse topological order; renumber them
+    # by their first node so the numbers do not depend on the traversal
+    _, first = np.unique(components, return_index=True)
+    renumber = np.empty(found, dtype=np.int64)
+    renumber[np.argsort(first, kind="stable")] = np.arange(found)
+    return renumber[components]
+
+
+def node_analytics(graph, rootType=None, damping=DEFAULT_DAMPING):
+    """{property: array with a value per node} of a CompactGraph in one pass
+    over its arrays: total degrees and degrees per relationship type, the
+    relationships crossing subsystems and whether there are any, root (no
+    incoming rootType relationship, any type when None) and leaf (no
+    outgoing one), PageRank and the strongly connected component."""
+    count = graph.node_count
+    out, incoming = graph.degrees_by_type()
+    columns = {"out_degree": np.diff(graph.outOffsets), "in_degree": np.diff(graph.inOffsets)}
+    cross = graph.cross_subsystem_mask()
+    columns["cross_subsystem_degree"] = (np.bincount(graph.edge_sources()[cross], minlength=count)
+                                         + np.bincount(graph.outTargets[cross], minlength=count))
+    columns["subsystem_boundary"] = columns["cross_subsystem_degree"] > 0
+    if rootType is None:
+        rootIn, leafOut = columns["in_degree"], columns["out_degree"]
+    elif graph.rel_type_code(rootType) < 0:
+        rootIn = leafOut = np.zeros(count, dtype=np.int64)
+    else:
+        rootIn, leafOut = incoming[graph.rel_type_code(rootType)], out[graph.rel_type_code(rootType)]
+    columns["root"] = rootIn == 0
+    columns["leaf"] = leafOut == 0
+    columns["pagerank"] = pagerank(graph, damping)
+    components = strongly_connected_components(graph)
+    columns["scc_id"] = components
+    columns["scc_size"] = np.bincount(components, minlength=count)[components]
+    for code, relType in enumerate(graph.relTypeNames):
+        columns["out_degree_" + relType] = out[code]
+        columns["in_degree_" + relType] = incoming[code]
+    return columns
+
+
+def node_rows(graph, columns):
+    """[(node number, {property: value})] with Python values, for Cypher
+    parameters and literals. Degrees per relationship type of 0 are left
+    out."""
+    names = [name for name in columns if not name.startswith(TYPE_DEGREE_PREFIXES)]
+    typeNames = [name for name in columns if name.startswith(TYPE_DEGREE_PREFIXES)]
+    values = {name: columns[name].tolist() for name in columns}
+    rows = []
+    for i in range(graph.node_count):
+        props = {name: values[name][i] for name in names}
+        props.update((name, values[name][i]) for name in typeNames if values[name][i])
+        rows.append((i, props))
+    return rows
+
+
+def analytics_groups(graph, rootType=None, nodeGroups=None):
+    """The analytics of every node as node rows grouped by label, the shape
+    bulk_loader.group_graph builds ({label: [{key, props}]}); the node ids
+    of graph are the keys. Rows are appended to nodeGroups when given, where
+    the async loader merges them with the node's own row."""
+    nodeGroups = {} if nodeGroups is None else nodeGroups
+    labels = graph.names("entity")
+    codes = graph.codes("entity").tolist()
+    for i, props in node_rows(graph, node_analytics(graph, rootType)):
+        nodeGroups.setdefault(labels[codes[i]], []).append({"key": graph.ids[i], "props": props})
+    return nodeGroups
+
+
+def write_analytics(driver, graph, batchSize=DEFAULT_BATCH_SIZE, database=None, profile=None, rootType=None,
+                    constrained=None):
+    """Computes the analytics of the merged graph (see node_analytics) and
+    sets them on the nodes already loaded, with an index on
+    INDEXED_PROPERTIES per label."""
+    nodeGroups = analytics_groups(graph, rootType)
+    ensure_property_indexes(driver, nodeGroups, INDEXED_PROPERTIES)
+    log.info("Writing analytics of %d nodes", graph.node_count)
+    return bulk_add_nodes(driver, nodeGroups, batchSize, database, profile, constrained)
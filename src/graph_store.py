@@ -0,0 +1,392 @@
+"""
+Answers the analytics of knowledge-graph/sample_queries.cypher from an
+in-memory copy of the graph instead of Neo4j: the merged MermaidParser
+output of the architecture diagrams or the GraphML graphs of input/. Rows
+use the column names of the Cypher queries.
+
+Usage: python src/graph_store.py [--mermaid] QUERY [ARG ...] [--json]
+       python src/graph_store.py --list
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+
+from bulk_loader import MERMAID_LABEL
+from entity_index import EntityIndex
+from node_keys import DEFAULT_KEY_STRATEGY
+
+
+DEPENDS_ON = "DEPENDS_ON"
+OUTGOING = "OUTGOING"
+INCOMING = "INCOMING"
+
+
+class GraphStore:
+    """The nodes and relationships of one merged graph with the indexes the
+    sample queries need: adjacency per direction and relationship type, and
+    nodes by subsystem, type and (case-folded) label.
+
+    Nodes are numbered in insertion order; node(i) is the property dict with
+    at least id, label, subsystem and type. Relationships are (source, type,
+    target, props) with source and target node numbers. The store is not
+    changed after it is built, so whole-graph aggregations are computed once
+    and then served from memory; the rows handed out are shared and must not
+    be modified."""
+
+    def __init__(self):
+        self.nodes = []
+        self.ids = {}
+        self.relationships = []
+        self.outgoing = []
+        self.incoming = []
+        self.outByType = defaultdict(lambda: defaultdict(list))
+        self.inByType = defaultdict(lambda: defaultdict(list))
+        self.bySubsystem = defaultdict(list)
+        self.byType = defaultdict(list)
+        self.byLabel = defaultdict(list)
+        self.memo = {}
+
+    @classmethod
+    def from_parser(cls, parser):
+        """A store of a MermaidParser (or anything with its nodes and
+        relationships dicts), e.g. main.parse_mermaid()."""
+        store = cls()
+        add_parser(store, parser)
+        return store
+
+    @classmethod
+    def from_graphs(cls, graphList, keyStrategy=DEFAULT_KEY_STRATEGY):
+        """A store of GraphML graphs as loaded by main.loadGraph (see
+        add_graphs)."""
+        store = cls()
+        add_graphs(store, graphList, keyStrategy)
+        return store
+
+    def add_node(self, nodeId, label, subsystem, nodeType, props=(), entity=None):
+        """entity is the Neo4j label the node is written under, which the
+        feeders pass when it may differ from the entity property (a node
+        with a label attribute); the store keeps the properties as they are
+        and does not use it."""
+        i = len(self.nodes)
+        node = dict(props, id=nodeId, label=label, subsystem=subsystem, type=nodeType)
+        self.nodes.append(node)
+        self.ids[nodeId] = i
+        self.outgoing.append([])
+        self.incoming.append([])
+        self.bySubsystem[subsystem].append(i)
+        self.byType[nodeType].append(i)
+        self.byLabel[label.casefold()].append(i)
+        self.memo.clear()
+        return i
+
+    def merge_node(self, nodeId, props):
+        """Adds the properties of props the node does not have yet."""
+        node = self.nodes[self.ids[nodeId]]
+        node.update((name, value) for name, value in props.items() if name not in node)
+
+    def add_relationship(self, sourceId, relType, targetId, **props):
+        source, target = self.ids[sourceId], self.ids[targetId]
+        r = len(self.relationships)
+        self.relationships.append((source, relType, target, props))
+        self.outgoing[source].append(r)
+        self.incoming[target].append(r)
+        self.outByType[relType][source].append(target)
+        self.inByType[relType][target].append(source)
+        self.memo.clear()
+        return r
+
+    def _memo(self, name, compute):
+        result = self.memo.get(name)
+        if result is None:
+            result = self.memo[name] = compute()
+        return result
+
+    # Lookups
+
+    def node(self, i):
+        return self.nodes[i]
+
+    def lookup(self, nodeId=None, label=None):
+        """Node numbers with this id, or with this label (case-insensitive)."""
+        if nodeId is not None:
+            return [self.ids[nodeId]] if nodeId in self.ids else []
+        return list(self.byLabel.get(label.casefold(), ()))
+
+    def targets(self, i, relType):
+        return self.outByType[relType].get(i, ()) if relType in self.outByType else ()
+
+    def sources(self, i, relType):
+        return self.inByType[relType].get(i, ()) if relType in self.inByType else ()
+
+    def relationship_types(self):
+        return sorted(self.outByType)
+
+    # The sample queries, by number in sample_queries.cypher
+
+    def component_count_by_subsystem(self):
+        """1. Component Count by Subsystem"""
+        return self._memo("subsystems", lambda: _ordered_counts(
+            {subsystem: len(nodes) for subsystem, nodes in self.bySubsystem.items()}, "Subsystem", "ComponentCount"))
+
+    def graph_statistics(self):
+        """2. Total Graph Statistics"""
+        return [{"TotalComponents": len(self.nodes), "TotalRelationships": len(self.relationships),
+                 "TotalSubsystems": len(self.bySubsystem)}]
+
+    def component_types(self):
+        """3. Component Types Distribution"""
+        return self._memo("types", lambda: _ordered_counts(
+            {nodeType: len(nodes) for nodeType, nodes in self.byType.items()}, "ComponentType", "Count"))
+
+    def _connections(self):
+        return self._memo("connections", lambda: [
+            {"Component": node["label"], "Subsystem": node["subsystem"],
+             "OutgoingDependencies": len(self.outgoing[i]), "IncomingDependencies": len(self.incoming[i]),
+             "TotalConnections": len(self.outgoing[i]) + len(self.incoming[i])}
+            for i, node in enumerate(self.nodes)])
+
+    def most_connected(self, limit=20):
+        """4. Most Connected Components"""
+        ranked = self._memo("most_connected", lambda: sorted(
+            self._connections(), key=lambda row: -row["TotalConnections"]))
+        return ranked[:limit]
+
+    def least_connected(self, maxConnections=2):
+        """5. Least Connected Components"""
+        ranked = self._memo("least_connected", lambda: sorted(
+            self._connections(), key=lambda row: (row["TotalConnections"], row["Subsystem"])))
+        rows = []
+        for row in ranked:
+            if row["TotalConnections"] > maxConnections:
+                break
+            rows.append({"Component": row["Component"], "Subsystem": row["Subsystem"],
+                         "connections": row["TotalConnections"]})
+        return rows
+
+    def relationship_type_counts(self):
+        """6. Relationship Types Analysis"""
+        return self._memo("relationship_types", lambda: _ordered_counts(
+            Counter(relType for _, relType, _, _ in self.relationships), "RelationshipType", "Count"))
+
+    def _cross_subsystem(self):
+        def compute():
+            counts = Counter()
+            for source, relType, target, _ in self.relationships:
+                sourceSubsystem = self.nodes[source]["subsystem"]
+                targetSubsystem = self.nodes[target]["subsystem"]
+                if sourceSubsystem != targetSubsystem:
+                    counts[(sourceSubsystem, targetSubsystem, relType)] += 1
+            return counts
+        return self._memo("cross_subsystem", compute)
+
+    def cross_subsystem_dependencies(self):
+        """7. Cross-Subsystem Dependencies"""
+        return self._memo("cross_subsystem_rows", lambda: [
+            {"SourceSubsystem": source, "TargetSubsystem": target, "RelationshipType": relType,
+             "Dependencies": count}
+            for (source, target, relType), count in sorted(self._cross_subsystem().items(),
+                                                           key=lambda item: -item[1])])
+
+    def subsystem_integration(self):
+        """9. Most Integrated Subsystems"""
+        def compute():
+            targets = defaultdict(set)
+            totals = Counter()
+            for (source, target, _), count in self._cross_subsystem().items():
+                targets[source].add(target)
+                totals[source] += count
+            return [{"Subsystem": subsystem, "ConnectedSubsystems": len(targets[subsystem]),
+                     "TotalCrossConnections": total}
+                    for subsystem, total in sorted(totals.items(), key=lambda item: -item[1])]
+        return self._memo("subsystem_integration", compute)
+
+    def hub_spoke_patterns(self, spokes=5):
+        """10. Hub-Spoke Communication Patterns"""
+        def compute():
+            groups = defaultdict(list)
+            for source, relType, target, props in self.relationships:
+                if props.get("cross_cluster"):
+                    groups[(source, relType)].append(target)
+            rows = []
+            for (source, relType), targets in groups.items():
+                labels = list(dict.fromkeys(self.nodes[target]["label"] for target in targets))
+                rows.append({"HubComponent": self.nodes[source]["label"], "HubSubsystem": self.nodes[source]["subsystem"],
+                             "CommunicationType": relType, "SpokeComponents": labels, "SpokeCount": len(targets)})
+            rows.sort(key=lambda row: -row["SpokeCount"])
+            return rows
+        return [dict(row, SpokeComponents=row["SpokeComponents"][:spokes]) for row in self._memo("hub_spoke", compute)]
+
+    def root_components(self, relType=DEPENDS_ON):
+        """13. Root Components: nothing has a relType relationship to them"""
+        return self._memo(("roots", relType), lambda: self._without(self.inByType.get(relType, {}), "RootComponent"))
+
+    def leaf_components(self, relType=DEPENDS_ON):
+        """14. Leaf Components: they have no relType relationship"""
+        return self._memo(("leaves", relType), lambda: self._without(self.outByType.get(relType, {}), "LeafComponent"))
+
+    def _without(self, adjacency, column):
+        rows = [{"Subsystem": node["subsystem"], column: node["label"], "Type": node["type"]}
+                for i, node in enumerate(self.nodes) if i not in adjacency]
+        rows.sort(key=lambda row: (row["Subsystem"], row[column]))
+        return rows
+
+    def find_components(self, pattern):
+        """25. Find Component by Name Pattern (case-insensitive)"""
+        pattern = pattern.casefold()
+        rows = [self._component_row(i) for label, nodes in self.byLabel.items() if pattern in label for i in nodes]
+        rows.sort(key=lambda row: (row["Subsystem"], row["Component"]))
+        return rows
+
+    def neighborhood(self, label):
+        """26. Component Neighborhood"""
+        rows = []
+        for center in self.lookup(label=label) or self.lookup(nodeId=label):
+            for direction, relationships, end in ((INCOMING, self.incoming[center], 0),
+                                                  (OUTGOING, self.outgoing[center], 2)):
+                for r in relationships:
+                    relationship = self.relationships[r]
+                    other = self.nodes[relationship[end]]
+                    rows.append({"CenterComponent": self.nodes[center]["label"], "Direction": direction,
+                                 "RelationType": relationship[1], "ConnectedComponent": other["label"],
+                                 "ConnectedSubsystem": other["subsystem"]})
+        rows.sort(key=lambda row: (row["Direction"], row["RelationType"]))
+        return rows
+
+    def subsystem_components(self, subsystem):
+        """27. Subsystem Component List"""
+        rows = [self._component_row(i) for i in self.bySubsystem.get(subsystem, ())]
+        rows.sort(key=lambda row: (row["Type"], row["Component"]))
+        return rows
+
+    def components_of_type(self, nodeType):
+        """22.-24. Operator, Controller and API Components (by type only)"""
+        rows = [self._component_row(i) for i in self.byType.get(nodeType, ())]
+        rows.sort(key=lambda row: (row["Subsystem"], row["Component"]))
+        return rows
+
+    def _component_row(self, i):
+        node = self.nodes[i]
+        return {"Component": node["label"], "Subsystem": node["subsystem"], "Type": node["type"],
+                "Description": node.get("description", "")}
+
+
+def add_parser(target, parser):
+    """Adds the nodes and relationships of a MermaidParser to target, a
+    GraphStore or anything else with add_node and add_relationship. Nodes
+    get the entity (Neo4j label) the Mermaid load gives them."""
+    for node in parser.nodes.values():
+        target.add_node(node.id, node.label, node.subsystem, node.node_type,
+                        {"entity": MERMAID_LABEL, "description": node.description,
+                         "deployment_model": node.deployment_model, "deployment_pattern": node.deployment_pattern,
+                         "model_role": node.model_role}, MERMAID_LABEL)
+    for rel in parser.relationships.values():
+        target.add_relationship(rel.source, rel.relationship_type, rel.target, subsystem=rel.subsystem,
+                                cross_cluster=rel.is_cross_cluster)
+
+
+def add_graphs(target, graphList, keyStrategy=DEFAULT_KEY_STRATEGY):
+    """Adds GraphML graphs as loaded by main.loadGraph to target. Nodes are
+    resolved through an EntityIndex like the Neo4j load, so a component of
+    several files is one node; its id is its kg_key, its type the entity
+    (the Neo4j label) and its subsystem the file it first appeared in.
+    Properties a later file adds are handed to target.merge_node."""
+    index = EntityIndex(keyStrategy)
+    added = set()
+    for propGraph in graphList:
+        subsystem = os.path.splitext(propGraph.graph.get("source", ""))[0]
+        nodes, edges = index.add(propGraph)
+        for label, key, props in nodes:
+            if key in added:
+                target.merge_node(key, props)
+                continue
+            added.add(key)
+            target.add_node(key, props.get("name", key), subsystem, label, props, label)
+        for relType, (_, sourceKey), (_, destKey) in edges:
+            target.add_relationship(sourceKey, relType, destKey, subsystem=subsystem, cross_cluster=False)
+
+
+def add_index(target, index):
+    """Adds the merged graph an EntityIndex has collected over a run (every
+    entity and edge of the files it indexed) to target, in the shape
+    add_graphs gives it: ids are kg_keys, the subsystem is the file an
+    entity was first seen in."""
+    subsystems = {entity: os.path.splitext(source)[0] for entity, source in index.sources.items()}
+    for entity, props in index.entities.items():
+        label, key = entity
+        target.add_node(key, props.get("name", key), subsystems.get(entity, ""), label, props, label)
+    # The edges are a set; sorted, the result does not depend on its order
+    for relType, sourceEntity, destEntity in sorted(index.edges):
+        target.add_relationship(sourceEntity[1], relType, destEntity[1], subsystem=subsystems.get(sourceEntity, ""),
+                                cross_cluster=False)
+
+
+def _ordered_counts(counts, keyColumn, countColumn):
+    return [{keyColumn: key, countColumn: count}
+            for key, count in sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))]
+
+
+# Query name -> GraphStore method, for the command line and callers that
+# get the query as text
+QUERIES = {
+    "subsystems": GraphStore.component_count_by_subsystem,
+    "statistics": GraphStore.graph_statistics,
+    "types": GraphStore.component_types,
+    "most-connected": GraphStore.most_connected,
+    "least-connected": GraphStore.least_connected,
+    "relationship-types": GraphStore.relationship_type_counts,
+    "cross-subsystem": GraphStore.cross_subsystem_dependencies,
+    "integration": GraphStore.subsystem_integration,
+    "hub-spoke": GraphStore.hub_spoke_patterns,
+    "roots": GraphStore.root_components,
+    "leaves": GraphStore.leaf_components,
+    "find": GraphStore.find_components,
+    "neighborhood": GraphStore.neighborhood,
+    "subsystem": GraphStore.subsystem_components,
+    "type": GraphStore.components_of_type,
+}
+
+
+def load_store(mermaid=False, inputDir=None, workers=1):
+    """The store of the architecture diagrams or of the GraphML in input/."""
+    import main
+    if mermaid:
+        # The parser reports its progress on stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            return GraphStore.from_parser(main.parse_mermaid(workers))
+    inputDir = inputDir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "input")
+    filenames = sorted(f for f in os.listdir(inputDir) if f.endswith(".graphml"))
+    return GraphStore.from_graphs([main.loadGraph(filename, inputDir) for filename in filenames])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a sample query against the graph without Neo4j")
+    parser.add_argument("query", nargs="?", choices=sorted(QUERIES))
+    parser.add_argument("args", nargs="*", help="Arguments of the query, e.g. the pattern of find")
+    parser.add_argument("--mermaid", action="store_true", help="Query the Mermaid architecture diagrams instead of input/")
+    parser.add_argument("--input-dir", help="Directory of the GraphML files (default: input/)")
+    parser.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    parser.add_argument("--list", action="store_true", help="List the queries")
+    args = parser.parse_args(argv)
+
+    if args.list or args.query is None:
+        for name in sorted(QUERIES):
+            print("%-20s %s" % (name, QUERIES[name].__doc__))
+        return 0
+    store = load_store(args.mermaid, args.input_dir)
+    queryArgs = [int(arg) if arg.isdigit() else arg for arg in args.args]
+    rows = QUERIES[args.query](store, *queryArgs)
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+    else:
+        for row in rows:
+            print("  ".join("%s=%s" % item for item in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import os
+from xml.etree.ElementTree import iterparse
+
+from bulk_loader import edge_type
+from node_keys import node_label, record_key, file_hash, DEFAULT_KEY_STRATEGY
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# attr.type -> python type, the conversions nx.read_graphml applies
+GRAPHML_TYPES = {"string": str, "int": int, "long": int, "integer": int,
+                 "float": float, "double": float, "boolean": bool}
+GRAPHML_BOOLEANS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _convert(text, pythonType):
+    if pythonType is bool:
+        return GRAPHML_BOOLEANS[text.lower()]
+    return pythonType(text)
+
+
+def iter_graphml(path, chunkSize=DEFAULT_CHUNK_SIZE):
+    """Reads a GraphML file with iterparse and yields lists of at most
+    chunkSize records, ("node", id, attrs) or ("edge", source, target,
+    attrs), with the data values converted to their declared attr.type like
+    nx.read_graphml does. The <key> declarations are resolved once and every
+    node and edge element is dropped as soon as it has been turned into a
+    record, so memory does not grow with the file."""
+    keys = {}
+    chunk = []
+    parents = []
+    for event, elem in iterparse(path, events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag in ("graph", "graphml"):
+                parents.append(elem)
+            continue
+        if tag == "key":
+            keys[elem.get("id")] = (elem.get("attr.name"), GRAPHML_TYPES.get(elem.get("attr.type", "string"), str))
+        elif tag == "node" or tag == "edge":
+            attrs = {}
+            for data in elem:
+                if _local(data.tag) != "data" or data.text is None or len(data):
+                    continue
+                name, pythonType = keys[data.get("key")]
+                attrs[name] = _convert(data.text, pythonType)
+            if tag == "node":
+                chunk.append(("node", elem.get("id"), attrs))
+            else:
+                chunk.append(("edge", elem.get("source"), elem.get("target"), attrs))
+            # The finished element is still the last child of its <graph>
+            elem.clear()
+            if parents and len(parents[-1]) and parents[-1][-1] is elem:
+                del parents[-1][-1]
+            if len(chunk) >= chunkSize:
+                yield chunk
+                chunk = []
+        elif tag in ("graph", "graphml"):
+            parents.pop()
+    if chunk:
+        yield chunk
+
+
+def stream_groups(path, keyStrategy=DEFAULT_KEY_STRATEGY, chunkSize=DEFAULT_CHUNK_SIZE, index=None):
+    """Yields (nodeGroups, edgeGroups) per chunk of path, in the row shape
+    group_graph builds, without a networkx graph in between. Only the
+    (label, key) of every node id seen so far is kept, to resolve the edge
+    endpoints; an edge that comes before one of its nodes waits until that
+    node has been read. With an EntityIndex, as in group_graph, only the
+    nodes and edges it has not written yet are yielded, with their merged
+    properties."""
+    source = file_hash(path)
+    keys = {}
+    waiting = []
+    for chunk in iter_graphml(path, chunkSize):
+        nodeRows = {}
+        edgeGroups = {}
+        for record in chunk:
+            if record[0] == "node":
+                _, nodeId, attrs = record
+                label = node_label(attrs)
+                key = record_key(keyStrategy, source, nodeId, label, attrs)
+                keys[nodeId] = (label, key)
+                if index is not None:
+                    attrs = index.add_node((label, key), attrs, os.path.basename(path))
+                    if attrs is None:
+                        continue
+                # One row per key and chunk, as SET n += would leave it
+                nodeRows.setdefault((label, key), {}).update(attrs)
+            elif record[1] in keys and record[2] in keys:
+                _add_edge(edgeGroups, keys, record, index)
+            else:
+                waiting.append(record)
+        if waiting:
+            ready = [record for record in waiting if record[1] in keys and record[2] in keys]
+            if ready:
+                waiting = [record for record in waiting if not (record[1] in keys and record[2] in keys)]
+                for record in ready:
+                    _add_edge(edgeGroups, keys, record, index)
+        nodeGroups = {}
+        for (label, key), props in nodeRows.items():
+            nodeGroups.setdefault(label, []).append({"key": key, "props": props})
+        yield nodeGroups, edgeGroups
+    if waiting:
+        raise ValueError("%s: edge %s -> %s references an undeclared node" % (path, waiting[0][1], waiting[0][2]))
+
+
+def _add_edge(edgeGroups, keys, record, index=None):
+    _, sourceNode, destNode, attrs = record
+    sourceLabel, sourceKey = keys[sourceNode]
+    destLabel, destKey = keys[destNode]
+    edgeLabel = edge_type(attrs)
+    if index is not None and not index.add_edge((edgeLabel, keys[sourceNode], keys[destNode])):
+        return
+    edgeGroups.setdefault((edgeLabel, sourceLabel, destLabel), []).append(
+        {"source": sourceKey, "dest": destKey})
@@ -0,0 +1,15 @@
+import logging
+
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+DEFAULT_LOG_LEVEL = "INFO"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+
+def configure_logging(level=DEFAULT_LOG_LEVEL):
+    """Sets up the "kg" loggers for a run. Per-node/edge messages are logged at
+    DEBUG behind isEnabledFor checks, so anything above DEBUG does no
+    per-record formatting or I/O."""
+    if isinstance(level, str):
+        level = getattr(logging, level.upper())
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
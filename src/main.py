@@ -1,8 +1,9 @@
     
 
 import sys
+import argparse
+import logging
 from datetime import datetime
-import matplotlib.pyplot as plt
 import networkx as nx
 import os
 from neo4j import GraphDatabase, RoutingControl
@@ -10,48 +11,378 @@ from neo4j import GraphDatabase, RoutingControl
 
 from dotenv import load_dotenv, find_dotenv
 
+from bulk_loader import bulk_add_graph, bulk_add_chunks, group_graph, group_mermaid, DEFAULT_BATCH_SIZE
+from async_loader import load_groups, DEFAULT_POOL_SIZE
+from cypher_builder import node_merge_template, edge_merge_template, ensure_key_constraints, bump_graph_version, DbHitProfile
+from node_keys import KEY_STRATEGIES, DEFAULT_KEY_STRATEGY
+from pipeline import run_pipeline, STAGES
+from manifest import Manifest, IncrementalRun, MANIFEST_NAME
+from logconfig import configure_logging, LOG_LEVELS, DEFAULT_LOG_LEVEL
+from export import CsvExporter
+from entity_index import EntityIndex
+from metrics import RunMetrics, StageTimer, statement_recorder, profiled
+from graphml_stream import stream_groups, DEFAULT_CHUNK_SIZE
+from validate import validate_file, load_glossary, format_problem
+from compact_graph import CompactGraph
+from graph_analytics import write_analytics, analytics_groups, INDEXED_PROPERTIES
+from graph_store import DEPENDS_ON
+from snapshot import load_snapshot, source_hashes, write_snapshot
+from render import LAYOUTS, DEFAULT_LAYOUT, DEFAULT_ITERATIONS, DEFAULT_SEED, DEFAULT_LABEL_CUTOFF
+
+# mermaid_to_cypher.py and the diagrams it converts
+MERMAID_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "acm", "agentic-docs", "dependency-analysis")
+
+
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load the ACM knowledge graphs in input/ into neo4j")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Load with batched UNWIND statements instead of one statement per node/edge")
+    parser.add_argument("--async", dest="async_load", action="store_true",
+                        help="Load with concurrent UNWIND transactions over an asyncio driver once every "
+                             "file is parsed; edges go in batches that share no endpoint")
+    parser.add_argument("--concurrency", type=int,
+                        help="Write transactions in flight with --async (default: the server's processor count)")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                        help="Connection pool size of the --async driver (default: %(default)s)")
+    parser.add_argument("--mermaid", action="store_true",
+                        help="With --async, also load the components of the Mermaid architecture diagrams "
+                             "in acm/agentic-docs/dependency-analysis/mermaid")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Rows per UNWIND batch in --bulk and --async mode (default: %(default)s)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read the files with the streaming GraphML reader and bulk-load them chunk by chunk, "
+                             "one file at a time, without building networkx graphs (no rendering)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Nodes and edges read per chunk with --stream (default: %(default)s)")
+    parser.add_argument("--key-strategy", choices=KEY_STRATEGIES, default=DEFAULT_KEY_STRATEGY,
+                        help="How the kg_key that identifies a node is built (default: %(default)s)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Run the load statements under PROFILE and print their db hits")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only process files whose content changed since the last run and only write "
+                             "the node/edge differences (tracked in output/" + MANIFEST_NAME + ")")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the diff an incremental run would apply without writing anything")
+    parser.add_argument("--analytics", action="store_true",
+                        help="After the load, store degrees per relationship type, PageRank, subsystem boundary, "
+                             "root/leaf and strongly connected component of every node of the merged graph as "
+                             "indexed node properties")
+    parser.add_argument("--render", action=argparse.BooleanOptionalAction, default=False,
+                        help="Draw every graph to output/<file>.png (default: off)")
+    parser.add_argument("--layout", choices=LAYOUTS, default=DEFAULT_LAYOUT,
+                        help="spring: networkx spring layout; force: NumPy force layout; "
+                             "cached: reuse the positions of the previous run (default: %(default)s)")
+    parser.add_argument("--layout-iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="Iteration budget of the spring/force layouts (default: %(default)s)")
+    parser.add_argument("--layout-seed", type=int, default=DEFAULT_SEED,
+                        help="Random seed of the spring/force layouts (default: %(default)s)")
+    parser.add_argument("--label-cutoff", type=int, default=DEFAULT_LABEL_CUTOFF,
+                        help="Graphs with more nodes than this are drawn without labels (default: %(default)s)")
+    parser.add_argument("--export", metavar="DIR",
+                        help="Write node/relationship CSVs for neo4j-admin database import to DIR "
+                             "instead of connecting to neo4j")
+    parser.add_argument("--load-csv", action="store_true",
+                        help="With --export, also write a batched LOAD CSV script (uses --batch-size)")
+    parser.add_argument("--metrics", metavar="DIR",
+                        help="Write the run's stage timings, statement counters and server timings per template "
+                             "and peak RSS to DIR/kg_load.json and DIR/kg_load.prom (Prometheus text format)")
+    parser.add_argument("--cprofile", metavar="FILE",
+                        help="Run under cProfile and write the stats to FILE (read them with pstats)")
+    parser.add_argument("--snapshot-dir", metavar="DIR",
+                        help="Keep a memory-mapped snapshot of every parsed file (and of the Mermaid diagrams) in DIR "
+                             "and read it instead of validating and parsing the file while it is unchanged")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default=DEFAULT_LOG_LEVEL,
+                        help="DEBUG logs every node, edge and returned record (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Processes used to validate, parse and render the input files; "
+                             "1 runs everything in-process (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.async_load and (args.incremental or args.dry_run or args.export or args.profile):
+        parser.error("--async cannot be combined with --incremental, --dry-run, --export or --profile")
+    if args.stream and (args.async_load or args.incremental or args.dry_run or args.export or args.render):
+        parser.error("--stream cannot be combined with --async, --incremental, --dry-run, --export or --render")
+    if args.mermaid and not args.async_load:
+        parser.error("--mermaid needs --async")
+    if args.analytics and (args.stream or args.incremental or args.dry_run or args.export):
+        parser.error("--analytics needs every file loaded and cannot be combined with --stream, --incremental, "
+                     "--dry-run or --export")
+    return args
+
+
+log = logging.getLogger("kg")
+
+
+def main(argv=None):
+
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    metrics = RunMetrics("kg_load", StageTimer(STAGES))
+    with profiled(args.cprofile):
+        run(args, metrics)
+    if args.metrics:
+        metrics.write(args.metrics)
+
+
+def run(args, metrics):
 
-
-
-def main():
-
-    print("************************************************************************************************")
     now = datetime.now()
-    print("Hello, welcome to the world of ACM Knowledge Graph: ", now)
-    print("************************************************************************************************")
+    log.info("Hello, welcome to the world of ACM Knowledge Graph: %s", now)
 
     #current_dir = os.getcwd()
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    print("Processing files: ")
 
-    graphList=  []
-    for filename in os.listdir(os.path.join(current_dir,"..","input")):
-          
-          # TODO: VALIDATE XML AND MAKE SURE IT FOLLOWS OUR GUIDELINES
-          propGraph = loadGraph(filename)
-          graphList.append(propGraph)
-          saveGraph(propGraph,filename)
+    # One index for the whole run resolves nodes per file and writes every
+    # component once, however many files describe it, on every load path
+    entityIndex = EntityIndex(args.key_strategy)
+    # Labels whose kg_key constraint has been created in this run
+    constrained = set()
+    # Connect first so every graph can be written as soon as it has been
+    # validated, parsed and rendered instead of keeping all of them in memory.
+    # An export never talks to the database.
+    exporter = CsvExporter(args.key_strategy, entityIndex) if args.export else None
+    # The async loader writes everything at the end, on a driver of its own
+    nodeGroups = edgeGroups = None
+    if args.async_load:
+        nodeGroups, edgeGroups = {}, {}
+    driver = connect() if exporter is None and nodeGroups is None else None
+    profile = DbHitProfile() if args.profile and driver is not None else None
+    # Everything that wants the summary of each statement
+    recorder = statement_recorder(profile, metrics.statements if args.metrics else None)
+
+    incremental = None
+    if args.incremental or args.dry_run:
+        manifest = Manifest(os.path.join(current_dir,"..","output",MANIFEST_NAME), args.key_strategy)
+        incremental = IncrementalRun(manifest, driver, args.batch_size, dryRun=args.dry_run, index=entityIndex)
+
+    # Whether anything was sent to the database; only then is the graph
+    # version bumped at the end
+    wrote = False
+
+    def load(filename, propGraph):
+        nonlocal driver, wrote
+        if exporter is not None:
+            exporter.add(propGraph)
+            return
+        if nodeGroups is not None:
+            group_graph(propGraph, nodeGroups, edgeGroups, args.key_strategy, entityIndex)
+            return
+        if incremental is not None and incremental.dryRun:
+            incremental.load(filename, propGraph)
+            return
+        if driver is None:
+            return
+        try:
+            if incremental is not None:
+                incremental.load(filename, propGraph)
+            elif args.bulk:
+                wrote = True
+                bulk_add_graph(driver,[propGraph],batchSize=args.batch_size,
+                               keyStrategy=args.key_strategy,profile=recorder,index=entityIndex,
+                               constrained=constrained)
+            else:
+                wrote = True
+                add_graph(driver,[propGraph],keyStrategy=args.key_strategy,profile=recorder,index=entityIndex,
+                          constrained=constrained)
+        except Exception as e :
+            log.error("Exception encountered: %s", e)
+            log.error("Loading into neo4j stopped at %s - the remaining files will still be processed.", filename)
+            mark_graph_changed(driver)
+            driver.close()
+            driver = None
+            if incremental is not None:
+                incremental.failed = True
+
+    inputDir = os.path.join(current_dir,"..","input")
+    allFilenames = sorted(os.listdir(inputDir))
+    filenames = allFilenames
+    render = None
+    if args.render and not args.dry_run:
+        render = {"layout": args.layout, "iterations": args.layout_iterations,
+                  "seed": args.layout_seed, "labelCutoff": args.label_cutoff}
+    if incremental is not None:
+        filenames = incremental.select(inputDir, os.path.join(current_dir,"..","output"), allFilenames, render is not None)
+    metrics.set("files", len(filenames))
+    if args.stream:
+        try:
+            failed = stream_files(driver, inputDir, filenames, args, recorder, metrics.timer, entityIndex)
+        finally:
+            if driver is not None:
+                driver.close()
+        if profile is not None:
+            log.info("%s", profile.report())
+        report_entity_index(entityIndex, metrics)
+        log.info("%s", metrics.timer.report())
+        metrics.set("failed_files", len(failed))
+        if failed:
+            log.error("Files that failed validation: %s", ", ".join(sorted(failed)))
+        return
+
+    try:
+        timer, failed = run_pipeline(filenames, load if driver is not None or args.dry_run or exporter or args.async_load else None,
+                                     workers=args.workers, render=render, timer=metrics.timer,
+                                     snapshotDir=args.snapshot_dir)
+        if exporter is not None:
+            exporter.write(args.export, loadCsv=args.load_csv, batchSize=args.batch_size)
+        if args.analytics and driver is not None:
+            # Computed on the merged graph of every file the entity index
+            # resolved, and set on the nodes just written
+            try:
+                with metrics.timer.stage("analytics"):
+                    wrote = True
+                    write_analytics(driver, CompactGraph.from_index(entityIndex), args.batch_size, profile=recorder,
+                                    constrained=constrained)
+            except Exception as e :
+                log.error("Exception encountered: %s", e)
+        if nodeGroups is not None:
+            mermaidParser = parse_mermaid(args.workers, args.snapshot_dir) if args.mermaid else None
+            if mermaidParser is not None:
+                group_mermaid(mermaidParser, nodeGroups, edgeGroups)
+            indexedProperties = ()
+            if args.analytics:
+                # Rows of the same keys, merged into the nodes' own rows
+                with metrics.timer.stage("analytics"):
+                    analytics_groups(CompactGraph.from_index(entityIndex), nodeGroups=nodeGroups)
+                    if mermaidParser is not None:
+                        analytics_groups(CompactGraph.from_parser(mermaidParser), DEPENDS_ON, nodeGroups)
+                indexedProperties = INDEXED_PROPERTIES
+            settings = connection_settings()
+            if settings is not None:
+                try:
+                    with metrics.timer.stage("load"):
+                        load_groups(*settings, nodeGroups, edgeGroups, batchSize=args.batch_size,
+                                    concurrency=args.concurrency, poolSize=args.pool_size, profile=recorder,
+                                    indexedProperties=indexedProperties)
+                except Exception as e :
+                    log.error("Exception encountered: %s", e)
+        if incremental is not None:
+            try:
+                incremental.finish(allFilenames)
+            except Exception as e :
+                log.error("Exception encountered: %s", e)
+    finally:
+        if driver is not None:
+            if wrote or (incremental is not None and incremental.wrote):
+                mark_graph_changed(driver)
+            driver.close()
+
+    if profile is not None:
+        log.info("%s", profile.report())
+    report_entity_index(entityIndex, metrics)
+    log.info("%s", timer.report())
+    metrics.set("failed_files", len(failed))
+    if failed:
+        log.error("Files that failed validation: %s", ", ".join(sorted(failed)))
+
+
+def report_entity_index(entityIndex, metrics):
+    if entityIndex.mentions:
+        log.info("Entity index: %s", ", ".join("%s=%d" % item for item in entityIndex.stats().items()))
+        for name, value in entityIndex.stats().items():
+            metrics.set(name, value)
+
+
+def stream_files(driver, inputDir, filenames, args, profile=None, timer=None, index=None):
+    """--stream: validates and bulk-loads one file after the other straight
+    from the streaming reader, merged through index (an EntityIndex) when
+    given. Returns {filename: problems} of the files that failed validation.
+    Reading and loading are interleaved, both are timed as the load stage."""
+    failed = {}
+    constrained = set()
+    wrote = False
+    glossary = load_glossary()
+    timer = timer or StageTimer(STAGES)
+    for filename in filenames:
+        path = os.path.join(inputDir, filename)
+        with timer.stage("validate"):
+            problems = validate_file(path, glossary)
+        if problems:
+            failed[filename] = problems
+            for problem in problems:
+                log.error("Validation error: %s", format_problem(problem))
+            continue
+        chunks = stream_groups(path, args.key_strategy, args.chunk_size, index)
+        if driver is None:
+            # Nothing to write to, the files are still read through
+            with timer.stage("parse"):
+                for _ in chunks:
+                    pass
+            continue
+        try:
+            log.info("Streaming %s", filename)
+            with timer.stage("load"):
+                wrote = True
+                bulk_add_chunks(driver, chunks, batchSize=args.batch_size, profile=profile, constrained=constrained)
+        except Exception as e :
+            log.error("Exception encountered: %s", e)
+            log.error("Loading into neo4j stopped at %s - the remaining files will still be validated.", filename)
+            mark_graph_changed(driver)
+            driver.close()
+            driver = None
+    if driver is not None and wrote:
+        mark_graph_changed(driver)
+    return failed
+
+
+def mark_graph_changed(driver):
+    """Bumps the graph version after a load (even one that failed half way),
+    which drops the results query_service has cached."""
+    try:
+        bump_graph_version(driver)
+    except Exception as e :
+        log.error("Exception encountered: %s", e)
 
+
+def connection_settings():
+    """(uri, auth) from the .env file, None when there is none."""
     try:
         _ = load_dotenv(find_dotenv(raise_error_if_not_found=True)) 
-        PWD  = os.getenv('NEO4J_PASSWORD')
-        URI = os.getenv('NEO4J_URL')
-        DB= os.getenv('NEO4J_DB')
-        AUTH= (DB, PWD) 
-
-        with GraphDatabase.driver(URI, auth=AUTH) as driver:
-              driver.verify_connectivity()
-              #print_graph(driver)
-              add_graph(driver,graphList)
-              driver.close()
     except IOError as e :
-        print("Exception encountered: ",e)
-        print("Error: No .env file found - Therefore cannot connect to neo4j. However, we will continue to process the graph.")
-       
+        log.warning("Exception encountered: %s", e)
+        log.warning("No .env file found - Therefore cannot connect to neo4j. However, we will continue to process the graph.")
+        return None
+    PWD  = os.getenv('NEO4J_PASSWORD')
+    URI = os.getenv('NEO4J_URL')
+    DB= os.getenv('NEO4J_DB')
+    AUTH= (DB, PWD) 
+    return URI, AUTH
+
+
+def parse_mermaid(workers, snapshotDir=None):
+    """The merged MermaidParser of the architecture diagrams, from the
+    mermaid.snapshot in snapshotDir while the diagrams are unchanged."""
+    if MERMAID_DIR not in sys.path:
+        sys.path.insert(0, MERMAID_DIR)
+    from mermaid_to_cypher import discover_diagrams, load_diagrams
+    from pathlib import Path
+    diagrams = discover_diagrams(Path(MERMAID_DIR))
+    log.info("Parsing %d Mermaid diagrams", len(diagrams))
+    snapshot = os.path.join(snapshotDir, "mermaid.snapshot") if snapshotDir is not None else None
+    return load_diagrams(diagrams, workers or 1, snapshot=snapshot, input_dir=Path(MERMAID_DIR))[0]
+
+
+def connect():
+    try:
+        settings = connection_settings()
+        if settings is None:
+            return None
+        URI, AUTH = settings
+
+        driver = GraphDatabase.driver(URI, auth=AUTH)
+        try:
+            driver.verify_connectivity()
+        except Exception:
+            driver.close()
+            raise
+        #print_graph(driver)
+        return driver
     except Exception as e :
-        print("Exception encountered: ",e)
+        log.error("Exception encountered: %s", e)
         #print("Error: No .env file found - Therefore cannot connect to neo4j. However, we will continue to process the graph.")
         #sys.exit(1)   
+    return None
          
 
 # Refer: https://github.com/neo4j/neo4j-python-driver#quick-example
@@ -62,177 +393,128 @@ def print_graph(driver):
     #age=42,
     database_="neo4j",routing_=RoutingControl.READ,
     )
-    print("Printing Graph from neo4j: ###########################################")
+    log.info("Printing Graph from neo4j:")
     for record in records:
-        print(record["p"])
-    print("######################################################################")
-
-def regenrate_param_string(params):
-     # Creating a new string-dictionary with unquoted keys
-    param_string = ""
-    for key,value in params.items():
-        if type(value) != str:
-            value = str(value)
-            param_string += key + ": " + value + ", "
-        else:
-            param_string += key + ": '" + value + "', "
-    #to remove the last comma and space
-    return param_string[:-2]
-
-def create_node_tx(driver, entityName, name,id,params):
-
-    #params["id"] = id
-    # Creating all inclusive properties that also has the id
-    # Cypher will take it
-    # CREATE (n:Person $props) RETURN n
-    # The above query will work and that is what we emulate here
-    props = {"props": params}
-
-    paramString = regenrate_param_string(params)
-    #print('######',paramString)
-
-    #query = ("CREATE (n:"+entityName+" {name: $name, id: $id}) "
-    # Exception encountered:  {code: Neo.ClientError.Statement.SyntaxError} 
-    # {message: Parameter maps cannot be used in `MERGE` patterns (use a literal map instead, e.g. `{id: $props.id}`)
-    
-    #query = ("CREATE (n:"+entityName+" $props) "                              
-    #        "RETURN n.id AS node_id")
-    #records = driver.execute_query(query, name=name,id=id,props=props["props"])
+        log.info("%s", record["p"])
+
+def run_query(driver, query, profile, **params):
+    # profile is a statement recorder: DbHitProfile, metrics.StatementMetrics
+    # or both
+    if profile is None:
+        return driver.execute_query(query, **params)
+    statement = "PROFILE " + query if profile.profiling else query
+    records, summary, keys = driver.execute_query(statement, **params)
+    profile.add(query, summary)
+    return records, summary, keys
+
 
-    query = ("MERGE (n:"+entityName+" {"+paramString+"}) "                              
-            "RETURN n.name")
-    records,summary, key = driver.execute_query(query, name=name,id=id)
+def create_node_tx(driver, entityName, name,id,params,nodeKey,profile=None):
+
+    # The node is MERGEd on its kg_key only (backed by a uniqueness
+    # constraint); the label is the only name in the query text and the
+    # property values are sent as $props, so every node with the same label
+    # shares one cached plan.
+    query = node_merge_template(entityName)
+    records,summary, key = run_query(driver, query, profile, key=nodeKey, props=dict(params))
 
     #record = result.single()
-    for record in records:
-            print(record)
-    #print(summary)
-    #print(key)
+    if log.isEnabledFor(logging.DEBUG):
+        for record in records:
+            log.debug("%s", record)
     #return records
 
 
 
-def create_edge_tx(driver, sourceProp, destProp,edgeLabel):
-    
-    query = ("MATCH (sourceNode "+sourceProp+"), (destNode "+destProp+") "      
-                "MERGE (sourceNode)-[r:" + edgeLabel + "]->(destNode) "
-                "RETURN sourceNode.name, destNode.name,type(r)")
-    #records,summary, key = driver.execute_query(query, sourceNode=sourceNode,destNode=destNode)
-    records,summary, key = driver.execute_query(query)
-    
-    for record in records:
-            print(record)
-    #print(summary)
-    #print(key)
-     
+def create_edge_tx(driver, source, dest,edgeLabel,profile=None):
 
-def get_node_name(sourceNode, destNode, propGraph):
-    sourceNodeName = ""
-    destNodeName = ""
-    sourceEntityName = ""
-    destEntityName = ""
-    for node in propGraph.nodes(data=True):
-        #print(node)
-        #if node[0].get("id") == sourceNode:
-        if node[0] == sourceNode:    
-            #print(node[1].get("name"))
-            sourceNodeName = node[1].get("name")
-            sourceEntityName = node[1].get("entity")
-            #print(sourceNode,sourceNodeName, sourceEntityName)
-        #if node[0].get("id") == destNode:
-        if node[0] == destNode:
-            #print(node[1].get("name"))
-            destNodeName = node[1].get("name")
-            destEntityName = node[1].get("entity")
-            #print(destNode,destNodeName,destEntityName)
-         
-         
-    #print("-------",sourceNodeName,destNodeName,sourceEntityName, destEntityName)
-    return sourceNodeName, destNodeName, sourceEntityName, destEntityName
+    # source and dest are (label, kg_key) pairs; matching on both lets neo4j
+    # use the constraint index instead of scanning every node
+    sourceLabel, sourceKey = source
+    destLabel, destKey = dest
+    query = edge_merge_template(edgeLabel, sourceLabel, destLabel)
+    records,summary, key = run_query(driver, query, profile, source=sourceKey, dest=destKey)
 
-          
+    if log.isEnabledFor(logging.DEBUG):
+        for record in records:
+            log.debug("%s", record)
+     
 
-def add_graph(driver,graphList):
-    lookupDict = {}
+def add_graph(driver,graphList,keyStrategy=DEFAULT_KEY_STRATEGY,profile=None,index=None,constrained=None):
+    # GraphML ids only mean something within their file, every node is
+    # resolved through the entity index instead; pass the same index for
+    # every call of a run so components repeated across files are one node,
+    # and the same constrained set so each label's constraint is created once
+    if index is None:
+        index = EntityIndex(keyStrategy)
+    debug = log.isEnabledFor(logging.DEBUG)
     for propGraph in graphList:
-        print("Adding Graph to neo4j: ###########################################")
-        #print(type(propGraph))
-        for node in propGraph.nodes(data=True):
-            print(node)
-            #print(type(node))
-            #print(node[1])
-            #print(node[0])
-            ename = ""
-            if "label" in node[1]:
-                #print(node[1]['label'])
-                ename = node[1]['label']
-            else:
-                #print(node[1]['entity']) 
-                ename = node[1]['entity']
-            print(ename,"-",node[1]['name'])
-            create_node_tx(driver, ename,node[1]['name'],node[0],node[1])
-            lookupDict[node[0]] = "{"+regenrate_param_string(node[1])+"}"
-
-        for edge in propGraph.edges(data=True):
-            #print(edge)
-            #print(type(edge))
-            sourceNode=edge[0]
-            destNode=edge[1]
-            print(sourceNode,"->",destNode)
-            edgeLabel = list(edge[2].values())[0]
-            #print(edgeLabel)
-            #sourceNodeName, destNodeName,sourceEntityName, destEntityName = get_node_name(sourceNode, destNode, propGraph)
-            create_edge_tx(driver, lookupDict[sourceNode],lookupDict[destNode],edgeLabel)
-            #print("")
-        print("######################################################################")
+        log.info("Adding graph %s to neo4j: %d nodes, %d edges", propGraph.graph.get("source", ""),
+                 propGraph.number_of_nodes(), propGraph.number_of_edges())
+        nodes, edges = index.add(propGraph)
+        ensure_key_constraints(driver, [label for label, _, _ in nodes], constrained)
+        for ename, nodeKey, attrs in nodes:
+            if debug:
+                log.debug("node %s - %s", ename, attrs.get('name'))
+            create_node_tx(driver, ename,attrs.get('name'),nodeKey,attrs,nodeKey,profile)
+
+        for edgeLabel, sourceEntity, destEntity in edges:
+            if debug:
+                log.debug("edge %s -[%s]-> %s", sourceEntity[1], edgeLabel, destEntity[1])
+            create_edge_tx(driver, sourceEntity,destEntity,edgeLabel,profile)
             
 
 
-def loadGraph(filename):
+def inputPath(filename, inputDir=None):
+        if inputDir is None:
+                current_dir = os.path.dirname(os.path.abspath(__file__))
+                inputDir = os.path.join(current_dir,"..","input")
+        return os.path.join(inputDir,filename)
+
+
+def snapshotPath(filename, snapshotDir):
+        return os.path.join(snapshotDir, filename + ".snapshot")
+
+
+def loadSnapshot(filename, snapshotDir, inputDir=None):
+        """The graph of filename from its snapshot in snapshotDir, None when
+        there is none or the file changed since it was written."""
+        file_path = inputPath(filename, inputDir)
+        loaded = load_snapshot(snapshotPath(filename, snapshotDir), source_hashes([file_path], os.path.dirname(file_path)))
+        if loaded is None:
+                return None
+        propGraph = loaded[0].to_networkx()
+        log.info("Loaded %s from its snapshot: %d nodes, %d edges", filename, propGraph.number_of_nodes(), propGraph.size())
+        return propGraph
+
+
+def loadGraph(filename, inputDir=None, snapshotDir=None):
         
-        #current_dir = os.getcwd()
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        print(current_dir)
-        file_path = os.path.join(current_dir,"..","input",filename)
-        print(file_path)
+        file_path = inputPath(filename, inputDir)
+        log.debug("Reading %s", file_path)
         
         # Importing graphs from the file
         propGraph = nx.read_graphml(file_path)
-
-        # Print the graph info
-        print(list(propGraph.nodes(data=True)))
-        print("Number of Nodes: ",propGraph.number_of_nodes())
-        print("Size of Graph: ",propGraph.size())
-        # param_string += key + ": '" + value + "', "print("")
+        # Remember where the graph came from; the "source" node key strategy
+        # is derived from it
+        sources = source_hashes([file_path], os.path.dirname(file_path))
+        propGraph.graph["source"] = filename
+        propGraph.graph["source_hash"] = sources[filename]
+        if snapshotDir is not None:
+                # Later runs read the snapshot instead of parsing the XML
+                os.makedirs(snapshotDir, exist_ok=True)
+                write_snapshot(snapshotPath(filename, snapshotDir), CompactGraph.from_graph(propGraph), sources)
+
+        log.info("Loaded %s: %d nodes, %d edges", filename, propGraph.number_of_nodes(), propGraph.size())
         return propGraph
 
-def saveGraph(propGraph,filename):
-        
+def saveGraph(propGraph,filename,**options):
+
         #current_dir = os.getcwd()
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        #pos = nx.spectral_layout(propGraph) 
-        #pos = nx.shell_layout(propGraph)
-        pos = nx.spring_layout(propGraph)
-        #pos = nx.planar_layout(propGraph)
-
-        plt.figure(1, figsize=(12,10), dpi=100)
-        nx.draw(
-            propGraph, pos, node_size=800,arrows=True,node_color="skyblue"
-        )  
-
-        # Draw node labels
-        node_labels = nx.get_node_attributes(propGraph, "name")
-        nx.draw_networkx_labels(propGraph, pos,labels=node_labels,  font_size=16)
-
-        # Draw edge labels
-        nx.draw_networkx_edge_labels(propGraph, pos)
-
-        fname=filename+".png"
-        fqfname=os.path.join(current_dir,"..","output",fname)
-
-        plt.savefig(fqfname)
-        #plt.show()
-        plt.close('all')
+        # Rendering lives in its own module so matplotlib is only imported
+        # when a picture is actually drawn
+        from render import render_graph
+        render_graph(propGraph, filename, os.path.join(current_dir,"..","output"), **options)
 
 
 
@@ -0,0 +1,302 @@
+import hashlib
+import json
+import logging
+import os
+
+from bulk_loader import edge_type, apply_changes
+from entity_index import EntityIndex
+from node_keys import graph_keys, file_hash
+
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+
+def props_hash(attrs):
+    digest = hashlib.sha1()
+    for key in sorted(attrs):
+        digest.update((key + "=" + str(attrs[key])).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def edge_id(edgeType, sourceKey, destKey):
+    # MERGE collapses parallel edges of the same type, so this is the identity
+    # of a relationship in neo4j
+    return sourceKey + "|" + edgeType + "|" + destKey
+
+
+def graph_entry(propGraph, keyStrategy):
+    """What the manifest remembers about one parsed file: its content hash,
+    every node (label, properties and their hash) and every edge by key.
+    The properties let a later run merge an unchanged file's nodes without
+    parsing it again."""
+    keys = graph_keys(propGraph, keyStrategy)
+    nodes = {}
+    for nodeId, attrs in propGraph.nodes(data=True):
+        label, key = keys[nodeId]
+        nodes[key] = {"label": label, "hash": props_hash(attrs), "props": dict(attrs)}
+    edges = {}
+    for sourceNode, destNode, attrs in propGraph.edges(data=True):
+        (sourceLabel, sourceKey), (destLabel, destKey) = keys[sourceNode], keys[destNode]
+        edgeType = edge_type(attrs)
+        edges[edge_id(edgeType, sourceKey, destKey)] = [edgeType, sourceLabel, sourceKey, destLabel, destKey]
+    return {"hash": propGraph.graph.get("source_hash"), "nodes": nodes, "edges": edges}
+
+
+class GraphDiff:
+    """Node and edge level difference between two manifest entries of a file.
+    Rows are grouped the way bulk_loader.apply_changes expects them."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.nodeGroups = {}
+        self.edgeGroups = {}
+        self.removedNodes = {}
+        self.removedEdges = {}
+        self.added = 0
+        self.changed = 0
+
+    def is_empty(self):
+        return not (self.nodeGroups or self.edgeGroups or self.removedNodes or self.removedEdges)
+
+    def describe(self):
+        nodeRows = sum(len(rows) for rows in self.nodeGroups.values())
+        edgeRows = sum(len(rows) for rows in self.edgeGroups.values())
+        lines = ["%s: %d nodes added, %d changed, %d removed; %d edges added, %d removed"
+                 % (self.filename, self.added, self.changed,
+                    sum(len(keys) for keys in self.removedNodes.values()),
+                    edgeRows, sum(len(rows) for rows in self.removedEdges.values()))]
+        for label, rows in sorted(self.nodeGroups.items()):
+            for row in rows:
+                lines.append("  + (%s {name: %r})" % (label, row["props"].get("name")))
+        for (edgeType, _, _), rows in sorted(self.edgeGroups.items()):
+            for row in rows:
+                lines.append("  + [%s] %s -> %s" % (edgeType, row["source"], row["dest"]))
+        for (edgeType, _, _), rows in sorted(self.removedEdges.items()):
+            for row in rows:
+                lines.append("  - [%s] %s -> %s" % (edgeType, row["source"], row["dest"]))
+        for label, keys in sorted(self.removedNodes.items()):
+            for key in keys:
+                lines.append("  - (%s {kg_key: %r})" % (label, key))
+        if self.is_empty():
+            lines[0] = "%s: no changes" % self.filename
+        return "\n".join(lines)
+
+
+class Manifest:
+    """Content hashes of everything the last successful run loaded, stored as
+    JSON in output/. Files whose hash did not change are skipped; for the
+    others only the node and edge differences are written."""
+
+    def __init__(self, path, keyStrategy):
+        self.path = path
+        self.keyStrategy = keyStrategy
+        self.files = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # A different key strategy means different kg_keys, nothing in
+            # the old manifest can be trusted then
+            if data.get("version") == MANIFEST_VERSION and data.get("key_strategy") == keyStrategy:
+                self.files = data.get("files", {})
+
+    def is_unchanged(self, filename, fileHash):
+        entry = self.files.get(filename)
+        return entry is not None and entry["hash"] == fileHash
+
+    def diff(self, filename, propGraph, entry):
+        """Difference between what is recorded for filename and entry, the
+        freshly parsed propGraph."""
+        old = self.files.get(filename, {"nodes": {}, "edges": {}})
+        diff = GraphDiff(filename)
+
+        keys = graph_keys(propGraph, self.keyStrategy)
+        for nodeId, attrs in propGraph.nodes(data=True):
+            label, key = keys[nodeId]
+            previous = old["nodes"].get(key)
+            if previous is not None and previous["hash"] == entry["nodes"][key]["hash"]:
+                continue
+            if previous is None:
+                diff.added += 1
+            else:
+                diff.changed += 1
+            diff.nodeGroups.setdefault(label, []).append({"key": key, "props": dict(attrs)})
+        for key, node in old["nodes"].items():
+            if key not in entry["nodes"]:
+                diff.removedNodes.setdefault(node["label"], []).append(key)
+
+        for edgeKey, (edgeType, sourceLabel, sourceKey, destLabel, destKey) in entry["edges"].items():
+            if edgeKey not in old["edges"]:
+                diff.edgeGroups.setdefault((edgeType, sourceLabel, destLabel), []).append(
+                    {"source": sourceKey, "dest": destKey})
+        for edgeKey, (edgeType, sourceLabel, sourceKey, destLabel, destKey) in old["edges"].items():
+            if edgeKey not in entry["edges"]:
+                diff.removedEdges.setdefault((edgeType, sourceLabel, destLabel), []).append(
+                    {"source": sourceKey, "dest": destKey})
+        return diff
+
+    def removal(self, filename):
+        """Diff that removes everything a deleted input file contributed."""
+        diff = GraphDiff(filename)
+        old = self.files.get(filename, {"nodes": {}, "edges": {}})
+        for key, node in old["nodes"].items():
+            diff.removedNodes.setdefault(node["label"], []).append(key)
+        for edgeType, sourceLabel, sourceKey, destLabel, destKey in old["edges"].values():
+            diff.removedEdges.setdefault((edgeType, sourceLabel, destLabel), []).append(
+                {"source": sourceKey, "dest": destKey})
+        return diff
+
+    def update(self, filename, entry):
+        self.files[filename] = entry
+
+    def forget(self, filename):
+        self.files.pop(filename, None)
+
+    def unreferenced(self, diffs):
+        """Merges the removals of diffs, dropping every node and edge that is
+        still part of some file in the manifest (several files may contribute
+        the same node)."""
+        liveNodes = set()
+        liveEdges = set()
+        for entry in self.files.values():
+            liveNodes.update(entry["nodes"])
+            liveEdges.update(entry["edges"])
+
+        removedNodes = {}
+        removedEdges = {}
+        for diff in diffs:
+            for label, keys in diff.removedNodes.items():
+                for key in keys:
+                    if key not in liveNodes:
+                        removedNodes.setdefault(label, set()).add(key)
+            for group, rows in diff.removedEdges.items():
+                for row in rows:
+                    if edge_id(group[0], row["source"], row["dest"]) not in liveEdges:
+                        removedEdges.setdefault(group, {})[(row["source"], row["dest"])] = row
+        return ({label: sorted(keys) for label, keys in removedNodes.items()},
+                {group: list(rows.values()) for group, rows in removedEdges.items()})
+
+    def save(self):
+        data = {"version": MANIFEST_VERSION, "key_strategy": self.keyStrategy, "files": self.files}
+        tmpPath = self.path + ".tmp"
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmpPath, self.path)
+
+
+class IncrementalRun:
+    """Drives one incremental run of main(): picks the files that need work,
+    diffs every changed file against the manifest as it is parsed and, once
+    every file is done, writes the changed nodes and added edges and deletes
+    whatever no file references any more. The manifest is only saved when
+    everything was applied, so an interrupted run is simply redone next time.
+
+    Written nodes get their properties replaced by the ones merged through
+    an EntityIndex (the first file to set a property wins, as on a full
+    load), so a property removed from every file is removed from the node.
+    Files must be loaded in name order; the unchanged files are merged from
+    their manifest entries in the same order."""
+
+    def __init__(self, manifest, driver, batchSize, dryRun=False, index=None):
+        self.manifest = manifest
+        self.driver = driver
+        self.batchSize = batchSize
+        self.dryRun = dryRun
+        self.index = index if index is not None else EntityIndex(manifest.keyStrategy)
+        self.unchanged = []
+        self.diffs = []
+        self.failed = False
+        # Whether finish() wrote anything
+        self.wrote = False
+
+    def select(self, inputDir, outputDir, filenames, render):
+        todo = []
+        for filename in filenames:
+            try:
+                fileHash = file_hash(os.path.join(inputDir, filename))
+            except OSError:
+                # Not readable (e.g. a directory): validation reports it
+                todo.append(filename)
+                continue
+            unchanged = self.manifest.is_unchanged(filename, fileHash)
+            # An unchanged file is still re-processed when its PNG is missing
+            if unchanged and (not render or os.path.exists(os.path.join(outputDir, filename + ".png"))):
+                self.unchanged.append(filename)
+                continue
+            todo.append(filename)
+        log.info("Incremental: %d of %d files changed", len(todo), len(filenames))
+        return todo
+
+    def merge_unchanged(self, before=None):
+        """Adds the manifest entries of the unchanged files sorting before the
+        file before (all of them when None) to the entity index."""
+        while self.unchanged and (before is None or self.unchanged[0] < before):
+            filename = self.unchanged.pop(0)
+            for key, node in self.manifest.files[filename]["nodes"].items():
+                self.index.add_node((node["label"], key), node["props"], filename)
+
+    def load(self, filename, propGraph):
+        entry = graph_entry(propGraph, self.manifest.keyStrategy)
+        diff = self.manifest.diff(filename, propGraph, entry)
+        self.merge_unchanged(filename)
+        self.index.add(propGraph)
+        if self.dryRun:
+            log.info("%s", diff.describe())
+        self.diffs.append(diff)
+        self.manifest.update(filename, entry)
+
+    def finish(self, filenames):
+        present = set(filenames)
+        for filename in sorted(self.manifest.files):
+            if filename not in present:
+                diff = self.manifest.removal(filename)
+                if self.dryRun:
+                    log.info("%s: removed from input/", filename)
+                self.diffs.append(diff)
+                self.manifest.forget(filename)
+
+        removedNodes, removedEdges = self.manifest.unreferenced(self.diffs)
+        if self.dryRun:
+            lines = ["Planned deletes: %d nodes, %d edges"
+                     % (sum(len(keys) for keys in removedNodes.values()),
+                        sum(len(rows) for rows in removedEdges.values()))]
+            for label, keys in sorted(removedNodes.items()):
+                for key in keys:
+                    lines.append("  - (%s {kg_key: %r})" % (label, key))
+            for (edgeType, _, _), rows in sorted(removedEdges.items()):
+                for row in rows:
+                    lines.append("  - [%s] %s -> %s" % (edgeType, row["source"], row["dest"]))
+            log.info("%s", "\n".join(lines))
+            return
+
+        if self.failed or self.driver is None:
+            return
+        nodeGroups, edgeGroups = self.writes()
+        if nodeGroups or edgeGroups or removedNodes or removedEdges:
+            self.wrote = True
+            apply_changes(self.driver, nodeGroups, edgeGroups, removedNodes, removedEdges,
+                          batchSize=self.batchSize)
+        self.manifest.save()
+
+    def writes(self):
+        """(nodeGroups, edgeGroups) of the run: every added or changed node
+        with its complete merged properties, plus the nodes a file dropped
+        that another file still has (their properties now come from that
+        one), and every added edge."""
+        self.merge_unchanged()
+        keys = {}
+        edgeGroups = {}
+        for diff in self.diffs:
+            for label, rows in diff.nodeGroups.items():
+                keys.setdefault(label, set()).update(row["key"] for row in rows)
+            for label, removed in diff.removedNodes.items():
+                keys.setdefault(label, set()).update(key for key in removed if (label, key) in self.index.entities)
+            for group, rows in diff.edgeGroups.items():
+                for row in rows:
+                    edgeGroups.setdefault(group, {})[(row["source"], row["dest"])] = row
+        nodeGroups = {label: [{"key": key, "props": dict(self.index.entities[(label, key)])} for key in sorted(labelKeys)]
+                      for label, labelKeys in keys.items() if labelKeys}
+        return nodeGroups, {group: list(rows.values()) for group, rows in edgeGroups.items()}
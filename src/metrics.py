@@ -0,0 +1,234 @@
+import cProfile
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+
+log = logging.getLogger(__name__)
+
+SUMMARY_COUNTERS = ("nodes_created", "nodes_deleted", "relationships_created", "relationships_deleted",
+                    "properties_set", "labels_added", "labels_removed", "indexes_added", "constraints_added")
+
+
+class StageTimer:
+    """Accumulates wall time, CPU time and item counts per stage. CPU time
+    is the process time of whichever process ran the stage, so stages run
+    in pipeline workers report their own CPU, not the parent's."""
+
+    def __init__(self, stages=()):
+        self.seconds = dict.fromkeys(stages, 0.0)
+        self.cpu = dict.fromkeys(stages, 0.0)
+        self.counts = dict.fromkeys(stages, 0)
+        self.started = time.perf_counter()
+
+    def add(self, stage, seconds, cpu=0.0):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.cpu[stage] = self.cpu.get(stage, 0.0) + cpu
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def merge(self, timings):
+        """Adds a {stage: (wall, cpu)} dict as measured by stage_timings."""
+        for stage, (seconds, cpu) in timings.items():
+            self.add(stage, seconds, cpu)
+
+    @contextmanager
+    def stage(self, name):
+        started, cpuStarted = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started, time.process_time() - cpuStarted)
+
+    def wall(self):
+        return time.perf_counter() - self.started
+
+    def report(self):
+        lines = ["Stage timings:"]
+        for stage in self.seconds:
+            count = self.counts[stage]
+            total = self.seconds[stage]
+            mean = total / count if count else 0.0
+            lines.append("  %-9s %5d files %9.3fs total %8.1fms/file %9.3fs cpu"
+                         % (stage, count, total, mean * 1000, self.cpu[stage]))
+        lines.append("  %-9s %9.3fs wall" % ("pipeline", self.wall()))
+        return "\n".join(lines)
+
+
+@contextmanager
+def stage_timings(timings, name):
+    """Times a block into timings[name] = (wall, cpu), for work done in a
+    process that has no StageTimer of its own."""
+    started, cpuStarted = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        timings[name] = (time.perf_counter() - started, time.process_time() - cpuStarted)
+
+
+class StatementMetrics:
+    """Sums summary.counters and the server's result_available_after /
+    result_consumed_after of every statement per template. It is a statement
+    recorder like cypher_builder.DbHitProfile (add(query, summary)) but does
+    not need the statements to run under PROFILE."""
+
+    profiling = False
+
+    def __init__(self):
+        self.templates = {}
+
+    def add(self, query, summary):
+        entry = self.templates.get(query)
+        if entry is None:
+            entry = self.templates[query] = {"calls": 0, "available_ms": 0, "consumed_ms": 0,
+                                             "counters": dict.fromkeys(SUMMARY_COUNTERS, 0)}
+        entry["calls"] += 1
+        if summary is None:
+            return
+        entry["available_ms"] += summary.result_available_after or 0
+        entry["consumed_ms"] += summary.result_consumed_after or 0
+        counters = summary.counters
+        for name in SUMMARY_COUNTERS:
+            entry["counters"][name] += getattr(counters, name, 0)
+
+
+class StatementRecorders:
+    """Hands every statement summary to several recorders; statements run
+    under PROFILE when any of them needs it."""
+
+    def __init__(self, recorders):
+        self.recorders = recorders
+        self.profiling = any(recorder.profiling for recorder in recorders)
+
+    def add(self, query, summary):
+        for recorder in self.recorders:
+            recorder.add(query, summary)
+
+
+def statement_recorder(*recorders):
+    """One recorder for the ones that are not None, None if there are none."""
+    recorders = [recorder for recorder in recorders if recorder is not None]
+    if len(recorders) <= 1:
+        return recorders[0] if recorders else None
+    return StatementRecorders(recorders)
+
+
+def peak_rss():
+    """Peak resident set size in bytes of this process and of its (waited
+    for) children, e.g. pipeline workers. None where it cannot be read."""
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux
+    return {"self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024}
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class RunMetrics:
+    """Everything measured during one run of an ingestion entry point,
+    written as JSON and in the Prometheus text format (for the node
+    exporter's textfile collector) so nightly loads can be compared."""
+
+    def __init__(self, job, timer=None):
+        self.job = job
+        self.timer = timer or StageTimer()
+        self.statements = StatementMetrics()
+        self.values = {}
+        self.startedAt = time.time()
+
+    def set(self, name, value):
+        """An extra gauge, e.g. the number of files or nodes of the run."""
+        self.values[name] = value
+
+    def to_dict(self):
+        return {
+            "job": self.job,
+            "started_at": self.startedAt,
+            "wall_seconds": self.timer.wall(),
+            "stages": {stage: {"count": self.timer.counts[stage], "wall_seconds": self.timer.seconds[stage],
+                               "cpu_seconds": self.timer.cpu[stage]}
+                       for stage in self.timer.seconds if self.timer.counts[stage]},
+            "statements": self.statements.templates,
+            "peak_rss_bytes": peak_rss(),
+            "values": self.values,
+        }
+
+    def prometheus(self):
+        data = self.to_dict()
+        lines = []
+
+        def metric(name, kind, description, samples):
+            lines.append("# HELP %s %s" % (name, description))
+            lines.append("# TYPE %s %s" % (name, kind))
+            for labels, value in samples:
+                labelText = ",".join('%s="%s"' % (key, _label_value(v)) for key, v in [("job", self.job)] + labels)
+                lines.append("%s{%s} %s" % (name, labelText, repr(float(value))))
+
+        metric("kg_run_start_timestamp_seconds", "gauge", "Unix time the run started.",
+               [([], data["started_at"])])
+        metric("kg_run_wall_seconds", "gauge", "Wall time of the whole run.", [([], data["wall_seconds"])])
+        stages = data["stages"]
+        metric("kg_stage_wall_seconds", "gauge", "Wall time summed over every item of a stage.",
+               [([("stage", stage)], entry["wall_seconds"]) for stage, entry in stages.items()])
+        metric("kg_stage_cpu_seconds", "gauge", "CPU time summed over every item of a stage.",
+               [([("stage", stage)], entry["cpu_seconds"]) for stage, entry in stages.items()])
+        metric("kg_stage_items", "gauge", "Items (files, batches) a stage processed.",
+               [([("stage", stage)], entry["count"]) for stage, entry in stages.items()])
+        templates = data["statements"]
+        metric("kg_statement_calls", "gauge", "Statements run per template.",
+               [([("template", query)], entry["calls"]) for query, entry in templates.items()])
+        metric("kg_statement_result_available_seconds", "gauge",
+               "Server time until the first record was available, summed per template.",
+               [([("template", query)], entry["available_ms"] / 1000.0) for query, entry in templates.items()])
+        metric("kg_statement_result_consumed_seconds", "gauge",
+               "Server time until all records were consumed, summed per template.",
+               [([("template", query)], entry["consumed_ms"] / 1000.0) for query, entry in templates.items()])
+        metric("kg_statement_updates", "gauge", "summary.counters summed per template.",
+               [([("template", query), ("counter", name)], value)
+                for query, entry in templates.items() for name, value in entry["counters"].items() if value])
+        if data["peak_rss_bytes"] is not None:
+            metric("kg_peak_rss_bytes", "gauge", "Peak resident set size.",
+                   [([("process", process)], value) for process, value in data["peak_rss_bytes"].items()])
+        if data["values"]:
+            metric("kg_run_value", "gauge", "Sizes and counts of the run.",
+                   [([("name", name)], value) for name, value in data["values"].items()])
+        return "\n".join(lines) + "\n"
+
+    def write(self, outDir):
+        """Writes <job>.json and <job>.prom to outDir; both are replaced
+        atomically so a collector never reads half a file."""
+        os.makedirs(outDir, exist_ok=True)
+        for suffix, text in ((".json", json.dumps(self.to_dict(), indent=1, sort_keys=True) + "\n"),
+                             (".prom", self.prometheus())):
+            path = os.path.join(outDir, self.job + suffix)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(path + ".tmp", path)
+        log.info("Wrote run metrics to %s", os.path.join(outDir, self.job + ".{json,prom}"))
+
+
+@contextmanager
+def profiled(path):
+    """Runs the block under cProfile and dumps the stats to path (load them
+    with pstats or snakeviz). Does nothing when path is None."""
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        profiler.dump_stats(path)
+        log.info("Wrote cProfile stats to %s", path)
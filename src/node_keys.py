@@ -0,0 +1,86 @@
+import hashlib
+
+
+# Every node written by the loader gets this property; it is backed by a
+# uniqueness constraint per label so edges can find their endpoints through
+# the index instead of comparing every property of every node.
+KEY_PROPERTY = "kg_key"
+
+# props:  label + hash of the full property map. Same identity the loader has
+#         always used (MERGE on every property), so it produces the same graph.
+# name:   label + name. Nodes with the same name collapse into one, even when
+#         their other properties differ (e.g. the {cluster-name} placeholders).
+# source: hash of the GraphML file contents + the node id in that file. Every
+#         file gets its own copy of a node.
+# entity: label + Kubernetes group/kind (when given) + normalized name. The
+#         same component described in several files (ManifestWork, WorkAgent,
+#         ...) becomes one node, while {cluster-name} placeholders of
+#         different kinds stay apart.
+KEY_STRATEGIES = ("entity", "props", "name", "source")
+DEFAULT_KEY_STRATEGY = "entity"
+
+# Properties that, next to the label, tell two components of the same name
+# apart
+IDENTITY_PROPERTIES = ("group", "kind")
+
+
+def node_label(attrs):
+    # A node may carry an explicit "label" property, otherwise the entity
+    # doubles as the neo4j label (same rule add_graph has always used)
+    if "label" in attrs:
+        return attrs["label"]
+    return attrs["entity"]
+
+
+def normalize_name(name):
+    # Case and spacing differences between files do not make a new component
+    return " ".join(str(name).split()).casefold()
+
+
+def file_hash(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _digest(*parts):
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def record_key(strategy, source, nodeId, label, attrs):
+    """Key of a node read without building a graph; source is the hash of
+    the file it came from."""
+    if strategy == "props":
+        return label + ":" + _digest(*(key + "=" + str(attrs[key]) for key in sorted(attrs)))
+    if strategy == "name":
+        return label + ":" + str(attrs.get("name", nodeId))
+    if strategy == "source":
+        return label + ":" + _digest(source, str(nodeId))
+    if strategy == "entity":
+        if "name" not in attrs:
+            return label + ":" + _digest(source, str(nodeId))
+        identity = "/".join(str(attrs[prop]) for prop in IDENTITY_PROPERTIES if attrs.get(prop))
+        return label + ":" + (identity + ":" if identity else "") + normalize_name(attrs["name"])
+    raise ValueError("Unknown node key strategy: %r" % (strategy,))
+
+
+def node_key(strategy, propGraph, nodeId, label, attrs):
+    # loadGraph records the file hash on the graph; fall back to the graph
+    # name for graphs that were built in memory
+    source = propGraph.graph.get("source_hash") or propGraph.graph.get("source", "")
+    return record_key(strategy, source, nodeId, label, attrs)
+
+
+def graph_keys(propGraph, strategy=DEFAULT_KEY_STRATEGY):
+    """Maps every node id of propGraph to its (label, key)."""
+    keys = {}
+    for nodeId, attrs in propGraph.nodes(data=True):
+        label = node_label(attrs)
+        keys[nodeId] = (label, node_key(strategy, propGraph, nodeId, label, attrs))
+    return keys
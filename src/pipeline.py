@@ -0,0 +1,116 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from logconfig import configure_logging
+from validate import validate_file, load_glossary, format_problem, io_problem
+from metrics import StageTimer, stage_timings
+
+
+log = logging.getLogger(__name__)
+
+STAGES = ("validate", "parse", "render", "load")
+
+
+def process_file(filename, render=None, snapshotDir=None):
+    """Validate, parse and (when render holds saveGraph options) render one
+    input file; files that fail validation are not parsed. With a
+    snapshotDir an unchanged file is read from its snapshot instead (it was
+    valid when the snapshot was written). A file that cannot be read is
+    reported as an io-error problem like a validation failure, so the
+    other files still go through. Runs in a worker process, the parsed
+    graph is shipped back to the parent for loading."""
+    # Imported here so worker processes pick up main's helpers without the
+    # parent and main importing each other at module load
+    from main import loadGraph, loadSnapshot, saveGraph, inputPath
+
+    timings = {}
+    propGraph = None
+    problems = []
+    try:
+        if snapshotDir is not None:
+            with stage_timings(timings, "parse"):
+                propGraph = loadSnapshot(filename, snapshotDir)
+
+        if propGraph is None:
+            with stage_timings(timings, "validate"):
+                problems = validate_file(inputPath(filename), load_glossary())
+            if problems:
+                return filename, None, problems, timings
+
+            with stage_timings(timings, "parse"):
+                propGraph = loadGraph(filename, snapshotDir=snapshotDir)
+    except OSError as e:
+        return filename, None, [io_problem(filename, e)], timings
+
+    if render is not None:
+        with stage_timings(timings, "render"):
+            saveGraph(propGraph, filename, **render)
+
+    return filename, propGraph, problems, timings
+
+
+def run_pipeline(filenames, load, workers=None, render=None, maxPending=None, timer=None, snapshotDir=None):
+    """Runs validate/parse/render for filenames in a process pool and hands
+    every valid graph to load(filename, propGraph) in filenames order, so
+    the first file to set a node property keeps winning. load may be None
+    when there is nowhere to write the graphs; render is None to skip
+    drawing or a dict of saveGraph options.
+
+    At most maxPending files (default: twice the worker count) are in flight
+    or parsed but waiting for an earlier file at once, which bounds how many
+    parsed graphs are held in memory. With
+    workers <= 1 everything runs in this process, one file at a time. The
+    stages are timed into timer (a metrics.StageTimer, a new one if None).
+    snapshotDir is handed to process_file.
+    """
+    if timer is None:
+        timer = StageTimer(STAGES)
+    failed = {}
+
+    def finish(filename, propGraph, problems, timings):
+        timer.merge(timings)
+        if problems:
+            failed[filename] = problems
+            for problem in problems:
+                log.error("Validation error: %s", format_problem(problem))
+            return
+        if load is None:
+            return
+        with timer.stage("load"):
+            load(filename, propGraph)
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for filename in filenames:
+            finish(*process_file(filename, render, snapshotDir))
+        return timer, failed
+
+    maxPending = maxPending or workers * 2
+    pending = {}
+    # Results that finished before an earlier file, by position
+    ready = {}
+    submitted = finished = 0
+    filenames = iter(filenames)
+    # Workers log at the parent's level even when they are spawned rather
+    # than forked
+    with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging,
+                             initargs=(logging.getLogger().getEffectiveLevel(),)) as pool:
+        while True:
+            # The file at position finished is always pending while ready
+            # holds anything, so waiting below never stalls
+            while len(pending) + len(ready) < maxPending:
+                filename = next(filenames, None)
+                if filename is None:
+                    break
+                pending[pool.submit(process_file, filename, render, snapshotDir)] = submitted
+                submitted += 1
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ready[pending.pop(future)] = future.result()
+            while finished in ready:
+                finish(*ready.pop(finished))
+                finished += 1
+    return timer, failed
@@ -0,0 +1,445 @@
+"""
+Read side of the graph for the MCP / LLM question answering layer: the
+sample queries of knowledge-graph/sample_queries.cypher as named,
+parameterized Cypher templates, run through a result cache.
+
+A result is cached per template and parameters for as long as the graph
+version is unchanged (the stamp every load gives the KGMeta node, see
+cypher_builder.GRAPH_VERSION_BUMP), for at most ttl seconds and only for
+the maxEntries most recently used queries. A query that arrives while the
+same one is running waits for that result instead of running again.
+
+Usage: python src/query_service.py QUERY [NAME=VALUE ...] [--json] [--repeat N] [--metrics DIR]
+       python src/query_service.py --list
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from neo4j import RoutingControl
+
+from cypher_builder import GRAPH_VERSION_QUERY
+from graph_store import DEPENDS_ON
+from metrics import RunMetrics, StageTimer
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+# An upper bound for writes that do not bump the graph version
+DEFAULT_TTL = 300.0
+# Longest dependency chain the chain query follows
+MAX_CHAIN_LENGTH = 15
+
+REQUIRED = object()
+
+
+class QueryTemplate:
+    """A named read query: Cypher text with $parameters, and the parameters
+    it takes with their defaults (REQUIRED when there is none)."""
+
+    def __init__(self, name, doc, cypher, **params):
+        self.name = name
+        self.doc = doc
+        self.cypher = cypher
+        self.params = params
+
+    def bind(self, params):
+        """The parameters of one run: params over the defaults. Raises
+        ValueError for unknown or missing parameters."""
+        unknown = set(params) - set(self.params)
+        if unknown:
+            raise ValueError("Unknown parameters of %s: %s" % (self.name, ", ".join(sorted(unknown))))
+        bound = dict(self.params, **params)
+        missing = [name for name, value in bound.items() if value is REQUIRED]
+        if missing:
+            raise ValueError("Missing parameters of %s: %s" % (self.name, ", ".join(sorted(missing))))
+        return bound
+
+
+# A component is named by its id or its label
+COMPONENT = "(n.id = $component OR n.label = $component)"
+
+# The sample queries (numbered as in sample_queries.cypher) with their
+# constants as parameters, plus the direct and transitive dependencies the
+# MCP questions ask for most. Names and columns match graph_store.QUERIES.
+TEMPLATES = {template.name: template for template in (
+    QueryTemplate("subsystems", "1. Component Count by Subsystem",
+                  "MATCH (n:RHACMComponent) "
+                  "RETURN n.subsystem AS Subsystem, count(n) AS ComponentCount "
+                  "ORDER BY ComponentCount DESC"),
+    QueryTemplate("statistics", "2. Total Graph Statistics",
+                  "MATCH (n:RHACMComponent) "
+                  "WITH count(n) AS TotalComponents, count(DISTINCT n.subsystem) AS TotalSubsystems "
+                  "CALL { MATCH (:RHACMComponent)-[r]->() RETURN count(r) AS TotalRelationships } "
+                  "RETURN TotalComponents, TotalRelationships, TotalSubsystems"),
+    QueryTemplate("types", "3. Component Types Distribution",
+                  "MATCH (n:RHACMComponent) "
+                  "RETURN n.type AS ComponentType, count(n) AS Count "
+                  "ORDER BY Count DESC"),
+    QueryTemplate("most-connected", "4. Most Connected Components",
+                  "MATCH (n:RHACMComponent) "
+                  "WITH n, COUNT { (n)-->() } AS out, COUNT { (n)<--() } AS incoming "
+                  "RETURN n.label AS Component, n.subsystem AS Subsystem, out AS OutgoingDependencies, "
+                  "incoming AS IncomingDependencies, out + incoming AS TotalConnections "
+                  "ORDER BY TotalConnections DESC LIMIT $limit",
+                  limit=20),
+    QueryTemplate("least-connected", "5. Least Connected Components",
+                  "MATCH (n:RHACMComponent) "
+                  "WITH n, COUNT { (n)-->() } + COUNT { (n)<--() } AS connections "
+                  "WHERE connections <= $maxConnections "
+                  "RETURN n.label AS Component, n.subsystem AS Subsystem, connections "
+                  "ORDER BY connections ASC, n.subsystem",
+                  maxConnections=2),
+    QueryTemplate("relationship-types", "6. Relationship Types Analysis",
+                  "MATCH (:RHACMComponent)-[r]->() "
+                  "RETURN type(r) AS RelationshipType, count(r) AS Count "
+                  "ORDER BY Count DESC"),
+    QueryTemplate("cross-subsystem", "7. Cross-Subsystem Dependencies",
+                  "MATCH (source:RHACMComponent)-[r]->(target:RHACMComponent) "
+                  "WHERE source.subsystem <> target.subsystem "
+                  "RETURN source.subsystem AS SourceSubsystem, target.subsystem AS TargetSubsystem, "
+                  "type(r) AS RelationshipType, count(r) AS Dependencies "
+                  "ORDER BY Dependencies DESC"),
+    QueryTemplate("integration", "9. Most Integrated Subsystems",
+                  "MATCH (source:RHACMComponent)-[r]->(target:RHACMComponent) "
+                  "WHERE source.subsystem <> target.subsystem "
+                  "RETURN source.subsystem AS Subsystem, count(DISTINCT target.subsystem) AS ConnectedSubsystems, "
+                  "count(r) AS TotalCrossConnections "
+                  "ORDER BY TotalCrossConnections DESC"),
+    QueryTemplate("hub-spoke", "10. Hub-Spoke Communication Patterns",
+                  "MATCH (hub:RHACMComponent)-[r {cross_cluster: true}]->(spoke:RHACMComponent) "
+                  "RETURN hub.label AS HubComponent, hub.subsystem AS HubSubsystem, type(r) AS CommunicationType, "
+                  "collect(DISTINCT spoke.label)[0..$spokes] AS SpokeComponents, count(spoke) AS SpokeCount "
+                  "ORDER BY SpokeCount DESC",
+                  spokes=5),
+    QueryTemplate("cross-cluster", "11. Cross-Cluster Relationship Analysis",
+                  "MATCH (:RHACMComponent)-[r {cross_cluster: true}]->() "
+                  "RETURN type(r) AS CrossClusterRelationType, count(r) AS Count "
+                  "ORDER BY Count DESC"),
+    QueryTemplate("roots", "13. Root Components: nothing has a relType relationship to them",
+                  "MATCH (n:RHACMComponent) "
+                  "WHERE NOT EXISTS { MATCH ()-[r]->(n) WHERE type(r) = $relType } "
+                  "RETURN n.subsystem AS Subsystem, n.label AS RootComponent, n.type AS Type "
+                  "ORDER BY Subsystem, RootComponent",
+                  relType=DEPENDS_ON),
+    QueryTemplate("leaves", "14. Leaf Components: they have no relType relationship",
+                  "MATCH (n:RHACMComponent) "
+                  "WHERE NOT EXISTS { MATCH (n)-[r]->() WHERE type(r) = $relType } "
+                  "RETURN n.subsystem AS Subsystem, n.label AS LeafComponent, n.type AS Type "
+                  "ORDER BY Subsystem, LeafComponent",
+                  relType=DEPENDS_ON),
+    QueryTemplate("find", "25. Find Component by Name Pattern (case-insensitive)",
+                  "MATCH (n:RHACMComponent) "
+                  "WHERE toLower(n.label) CONTAINS toLower($pattern) "
+                  "RETURN n.label AS Component, n.subsystem AS Subsystem, n.type AS Type, "
+                  "n.description AS Description "
+                  "ORDER BY Subsystem, Component",
+                  pattern=REQUIRED),
+    QueryTemplate("neighborhood", "26. Component Neighborhood",
+                  "MATCH (n:RHACMComponent) WHERE " + COMPONENT + " "
+                  "CALL { WITH n MATCH (n)-[r]->(other) RETURN 'OUTGOING' AS Direction, r, other "
+                  "UNION WITH n MATCH (other)-[r]->(n) RETURN 'INCOMING' AS Direction, r, other } "
+                  "RETURN n.label AS CenterComponent, Direction, type(r) AS RelationType, "
+                  "other.label AS ConnectedComponent, other.subsystem AS ConnectedSubsystem "
+                  "ORDER BY Direction, RelationType",
+                  component=REQUIRED),
+    QueryTemplate("subsystem", "27. Subsystem Component List",
+                  "MATCH (n:RHACMComponent {subsystem: $subsystem}) "
+                  "RETURN n.label AS Component, n.subsystem AS Subsystem, n.type AS Type, "
+                  "n.description AS Description "
+                  "ORDER BY Type, Component",
+                  subsystem=REQUIRED),
+    QueryTemplate("type", "22.-24. Operator, Controller and API Components (by type only)",
+                  "MATCH (n:RHACMComponent {type: $type}) "
+                  "RETURN n.label AS Component, n.subsystem AS Subsystem, n.type AS Type, "
+                  "n.description AS Description "
+                  "ORDER BY Subsystem, Component",
+                  type=REQUIRED),
+    QueryTemplate("depends-on", "What a component depends on (relType relationships, any type when null)",
+                  "MATCH (n:RHACMComponent)-[r]->(other) WHERE " + COMPONENT + " "
+                  "AND ($relType IS NULL OR type(r) = $relType) "
+                  "RETURN n.label AS Component, type(r) AS RelationType, other.label AS Dependency, "
+                  "other.subsystem AS DependencySubsystem "
+                  "ORDER BY RelationType, Dependency",
+                  component=REQUIRED, relType=None),
+    QueryTemplate("dependents", "What depends on a component (relType relationships, any type when null)",
+                  "MATCH (other)-[r]->(n:RHACMComponent) WHERE " + COMPONENT + " "
+                  "AND ($relType IS NULL OR type(r) = $relType) "
+                  "RETURN n.label AS Component, type(r) AS RelationType, other.label AS Dependent, "
+                  "other.subsystem AS DependentSubsystem "
+                  "ORDER BY RelationType, Dependent",
+                  component=REQUIRED, relType=None),
+    QueryTemplate("chain", "15. A shortest DEPENDS_ON chain from source to target",
+                  "MATCH (n:RHACMComponent) WHERE (n.id = $source OR n.label = $source) "
+                  "MATCH (m:RHACMComponent) WHERE (m.id = $target OR m.label = $target) "
+                  "MATCH path = shortestPath((n)-[:DEPENDS_ON*..%d]->(m)) "
+                  "RETURN n.label AS StartComponent, m.label AS EndComponent, length(path) AS ChainLength, "
+                  "[node IN nodes(path) | node.label] AS DependencyChain" % MAX_CHAIN_LENGTH,
+                  source=REQUIRED, target=REQUIRED),
+)}
+
+
+def cache_key(name, params):
+    """A hashable key of a template and its bound parameters."""
+    return (name, tuple(sorted((key, _frozen(value)) for key, value in params.items())))
+
+
+def _frozen(value):
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _frozen(item)) for key, item in value.items()))
+    return value
+
+
+class _Flight:
+    """A query being run; identical queries wait on it for its rows."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.rows = None
+        self.error = None
+
+    def finish(self, rows=None, error=None):
+        self.rows = rows
+        self.error = error
+        self.done.set()
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.rows
+
+
+class ResultCache:
+    """Rows by key, bounded to the maxEntries most recently used keys, each
+    kept for at most ttl seconds (None: until evicted or cleared). get
+    computes a missing entry once however many threads ask for it at the
+    same time. The rows handed out are shared and must not be modified."""
+
+    def __init__(self, maxEntries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, clock=time.monotonic):
+        if maxEntries < 1:
+            raise ValueError("The cache needs room for an entry: %r" % maxEntries)
+        self.maxEntries = maxEntries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.flights = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, compute):
+        """The rows of key, from the cache or from compute() (run by one
+        caller, the others wait for it)."""
+        leader = False
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, rows = entry
+                if expires is None or self.clock() < expires:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return rows
+                del self.entries[key]
+                self.expired += 1
+            flight = self.flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+            else:
+                flight = self.flights[key] = _Flight()
+                generation = self.generation
+                self.misses += 1
+                leader = True
+        if not leader:
+            return flight.wait()
+
+        try:
+            rows = compute()
+        except Exception as e:
+            with self.lock:
+                self.errors += 1
+                if self.flights.get(key) is flight:
+                    del self.flights[key]
+            flight.finish(error=e)
+            raise
+        with self.lock:
+            if self.flights.get(key) is flight:
+                del self.flights[key]
+            # Not kept when the cache was cleared while it ran
+            if generation == self.generation:
+                self._put(key, rows)
+        flight.finish(rows)
+        return rows
+
+    def _put(self, key, rows):
+        self.entries[key] = (None if self.ttl is None else self.clock() + self.ttl, rows)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drops every entry; queries running now are not cached either."""
+        with self.lock:
+            self.entries.clear()
+            self.flights.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self):
+        with self.lock:
+            requests = self.hits + self.misses + self.coalesced
+            return {"requests": requests, "hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+                    # Answered without running the query
+                    "hit_rate": (self.hits + self.coalesced) / requests if requests else 0.0,
+                    "entries": len(self.entries), "expired": self.expired, "evictions": self.evictions,
+                    "invalidations": self.invalidations, "errors": self.errors}
+
+
+class QueryService:
+    """Runs TEMPLATES on a neo4j driver (read transactions) through a
+    ResultCache. The graph version is read before every query, or at most
+    every versionInterval seconds, trading freshness for the round trip;
+    when it changed the whole cache is dropped. The time of every query
+    that ran is added to timer, per template."""
+
+    def __init__(self, driver, cache=None, database=None, versionInterval=0.0, templates=TEMPLATES, timer=None):
+        self.driver = driver
+        self.cache = cache or ResultCache()
+        self.database = database
+        self.versionInterval = versionInterval
+        self.templates = templates
+        self.timer = timer or StageTimer()
+        self.stamp = None
+        self.versionReadAt = None
+        self.versionLock = threading.Lock()
+
+    def query(self, name, **params):
+        """The rows (dicts by column) of template name with params."""
+        template = self.templates.get(name)
+        if template is None:
+            raise ValueError("Unknown query: %s" % name)
+        params = template.bind(params)
+        stamp = self.version()
+        return self.cache.get((stamp,) + cache_key(name, params), lambda: self.run(template, params))
+
+    def run(self, template, params):
+        """Runs template uncached."""
+        started, cpuStarted = time.perf_counter(), time.process_time()
+        records, _, _ = self.driver.execute_query(template.cypher, params, routing_=RoutingControl.READ,
+                                                  database_=self.database)
+        self.timer.add(template.name, time.perf_counter() - started, time.process_time() - cpuStarted)
+        return [record.data() for record in records]
+
+    def version(self):
+        """The stamp of the graph version, None before the first load.
+        Clears the cache when it changed."""
+        started = time.monotonic()
+        readAt = self.versionReadAt
+        if readAt is not None and started - readAt < self.versionInterval:
+            return self.stamp
+        records, _, _ = self.driver.execute_query(GRAPH_VERSION_QUERY, routing_=RoutingControl.READ,
+                                                  database_=self.database)
+        stamp = records[0]["stamp"] if records else None
+        with self.versionLock:
+            # A read that started before the last one applied is older news
+            if self.versionReadAt is not None and started < self.versionReadAt:
+                return stamp
+            self.versionReadAt = started
+            if stamp != self.stamp:
+                log.info("Graph version changed to %s, dropping %d cached results", stamp, len(self.cache))
+                self.cache.clear()
+                self.stamp = stamp
+        return stamp
+
+    def invalidate(self):
+        """Drops the cache, e.g. after writing to the graph in this process."""
+        with self.versionLock:
+            self.versionReadAt = None
+        self.cache.clear()
+
+    def stats(self):
+        return dict(self.cache.stats(), graph_version=self.stamp)
+
+    def write_metrics(self, directory):
+        """The cache counters and the query times per template as
+        DIR/query_service.json and .prom (see metrics.RunMetrics)."""
+        metrics = RunMetrics("query_service", self.timer)
+        for name, value in self.stats().items():
+            if name != "graph_version":
+                metrics.set(name, value)
+        metrics.write(directory)
+
+
+def parse_params(pairs):
+    """NAME=VALUE arguments as parameters; numbers become ints, null None."""
+    params = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError("Expected NAME=VALUE: %s" % pair)
+        params[name] = int(value) if value.isdigit() else None if value == "null" else value
+    return params
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a named query against neo4j through the result cache")
+    parser.add_argument("query", nargs="?", choices=sorted(TEMPLATES))
+    parser.add_argument("params", nargs="*", metavar="NAME=VALUE", help="Parameters of the query")
+    parser.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    parser.add_argument("--repeat", type=int, default=1, help="Run the query N times and report the cache counters")
+    parser.add_argument("--metrics", metavar="DIR", help="Write the cache counters and query times to DIR")
+    parser.add_argument("--list", action="store_true", help="List the queries and their parameters")
+    args = parser.parse_args(argv)
+
+    if args.list or args.query is None:
+        for name in sorted(TEMPLATES):
+            template = TEMPLATES[name]
+            params = " ".join(key if value is REQUIRED else "[%s=%s]" % (key, value)
+                              for key, value in template.params.items())
+            print("%-20s %-40s %s" % (name, params, template.doc))
+        return 0
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    import main as kg
+    driver = kg.connect()
+    if driver is None:
+        return 1
+    try:
+        service = QueryService(driver)
+        params = parse_params(args.params)
+        for _ in range(args.repeat):
+            rows = service.query(args.query, **params)
+    finally:
+        driver.close()
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+    else:
+        for row in rows:
+            print("  ".join("%s=%s" % item for item in row.items()))
+    if args.repeat > 1:
+        print(", ".join("%s=%s" % item for item in service.stats().items()), file=sys.stderr)
+    if args.metrics:
+        service.write_metrics(args.metrics)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
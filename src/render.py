@@ -0,0 +1,174 @@
+import json
+import os
+
+import networkx as nx
+
+
+LAYOUTS = ("spring", "force", "cached")
+DEFAULT_LAYOUT = "spring"
+DEFAULT_ITERATIONS = 50
+DEFAULT_SEED = 42
+# Above this many nodes the node/edge labels and arrow heads are not drawn;
+# they are what makes matplotlib slow on big graphs
+DEFAULT_LABEL_CUTOFF = 200
+
+# Upper bound on the number of pairwise distances held at once by the NumPy
+# force layout
+_PAIR_CHUNK = 1 << 20
+# Node count up to which the force layout computes exact pairwise repulsion,
+# and the number of grid cells it approximates the far field with beyond it
+_EXACT_LIMIT = 1000
+_GRID_CELLS = 32 * 32
+
+
+def spring_layout(propGraph, iterations=DEFAULT_ITERATIONS, seed=DEFAULT_SEED, pos=None, fixed=None):
+    return nx.spring_layout(propGraph, iterations=iterations, seed=seed, pos=pos, fixed=fixed)
+
+
+def force_layout(propGraph, iterations=DEFAULT_ITERATIONS, seed=DEFAULT_SEED):
+    """Fruchterman-Reingold with the per-iteration work done in NumPy arrays.
+
+    Repulsion is computed in row chunks so memory stays bounded at
+    _PAIR_CHUNK pairwise distances whatever the graph size. Above
+    _EXACT_LIMIT nodes every node is repelled by the centroids of a grid
+    instead of by every other node, which keeps an iteration linear in the
+    node count."""
+    import numpy as np
+
+    nodes = list(propGraph)
+    count = len(nodes)
+    if count == 0:
+        return {}
+    if count == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in propGraph.edges()], dtype=np.intp).reshape(-1, 2)
+    pos = np.random.default_rng(seed).random((count, 2))
+    k = 1.0 / np.sqrt(count)
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    side = int(np.sqrt(_GRID_CELLS))
+
+    for _ in range(iterations):
+        displacement = np.zeros_like(pos)
+        x = pos[:, 0]
+        y = pos[:, 1]
+        if count <= _EXACT_LIMIT:
+            sx, sy, mass = x, y, None
+        else:
+            sx, sy, mass = _grid_centroids(np, x, y, side)
+        rows = max(1, _PAIR_CHUNK // len(sx))
+        for start in range(0, count, rows):
+            dx = x[start:start + rows, None] - sx[None, :]
+            dy = y[start:start + rows, None] - sy[None, :]
+            # k^2 / d^2 along the unit vector, i.e. the classic k^2 / d force
+            factor = (k * k) / np.maximum(dx * dx + dy * dy, 1e-4)
+            if mass is not None:
+                factor *= mass
+            displacement[start:start + rows, 0] += (dx * factor).sum(axis=1)
+            displacement[start:start + rows, 1] += (dy * factor).sum(axis=1)
+        if len(edges):
+            delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            distance = np.maximum(np.linalg.norm(delta, axis=1), 0.01)
+            pull = delta * (distance / k)[:, None]
+            np.add.at(displacement, edges[:, 0], -pull)
+            np.add.at(displacement, edges[:, 1], pull)
+        length = np.maximum(np.linalg.norm(displacement, axis=1), 0.01)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    pos -= pos.mean(axis=0)
+    scale = np.abs(pos).max()
+    if scale > 0:
+        pos /= scale
+    return dict(zip(nodes, pos))
+
+
+def _grid_centroids(np, x, y, side):
+    # Bins the nodes into a side x side grid and returns the centroid and the
+    # number of nodes of every non-empty cell
+    span = max(x.max() - x.min(), y.max() - y.min(), 1e-9)
+    col = np.minimum(((x - x.min()) / span * side).astype(np.intp), side - 1)
+    row = np.minimum(((y - y.min()) / span * side).astype(np.intp), side - 1)
+    cell = row * side + col
+    mass = np.bincount(cell, minlength=side * side).astype(float)
+    occupied = mass > 0
+    cx = np.bincount(cell, weights=x, minlength=side * side)[occupied] / mass[occupied]
+    cy = np.bincount(cell, weights=y, minlength=side * side)[occupied] / mass[occupied]
+    return cx, cy, mass[occupied]
+
+
+def layout_path(outputDir, filename):
+    return os.path.join(outputDir, filename + ".layout.json")
+
+
+def load_layout(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {node: tuple(xy) for node, xy in json.load(f).items()}
+
+
+def save_layout(path, pos):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({str(node): [float(x), float(y)] for node, (x, y) in pos.items()}, f)
+
+
+def cached_layout(propGraph, path, iterations=DEFAULT_ITERATIONS, seed=DEFAULT_SEED):
+    """Reuses the positions saved by the previous run. Nodes that are new since
+    then are placed by a spring layout with the known ones held in place."""
+    cached = load_layout(path)
+    known = {node: cached[node] for node in propGraph if node in cached}
+    if len(known) == propGraph.number_of_nodes():
+        return known
+    if not known:
+        return spring_layout(propGraph, iterations, seed)
+    return spring_layout(propGraph, iterations, seed, pos=known, fixed=list(known))
+
+
+def compute_layout(propGraph, layout, path, iterations=DEFAULT_ITERATIONS, seed=DEFAULT_SEED):
+    if layout == "spring":
+        return spring_layout(propGraph, iterations, seed)
+    if layout == "force":
+        return force_layout(propGraph, iterations, seed)
+    if layout == "cached":
+        return cached_layout(propGraph, path, iterations, seed)
+    raise ValueError("Unknown layout: %r" % (layout,))
+
+
+def render_graph(propGraph, filename, outputDir, layout=DEFAULT_LAYOUT, iterations=DEFAULT_ITERATIONS,
+                 seed=DEFAULT_SEED, labelCutoff=DEFAULT_LABEL_CUTOFF):
+    """Draws propGraph to outputDir/<filename>.png and stores the positions
+    next to it for the cached layout of the next run."""
+    # matplotlib is only needed here; keep it out of runs that just load the
+    # database
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    path = layout_path(outputDir, filename)
+    pos = compute_layout(propGraph, layout, path, iterations, seed)
+    labelled = propGraph.number_of_nodes() <= labelCutoff
+
+    plt.figure(1, figsize=(12,10), dpi=100)
+    if labelled:
+        nx.draw(
+            propGraph, pos, node_size=800,arrows=True,node_color="skyblue"
+        )
+
+        # Draw node labels
+        node_labels = nx.get_node_attributes(propGraph, "name")
+        nx.draw_networkx_labels(propGraph, pos,labels=node_labels,  font_size=16)
+
+        # Draw edge labels
+        nx.draw_networkx_edge_labels(propGraph, pos)
+    else:
+        # Plain line collection, no per-edge arrow patches or text
+        nx.draw(propGraph, pos, node_size=20, arrows=False, width=0.3, node_color="skyblue")
+
+    plt.savefig(os.path.join(outputDir, filename + ".png"))
+    #plt.show()
+    plt.close('all')
+
+    save_layout(path, pos)
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import shutil
+
+import numpy as np
+
+from compact_graph import CompactGraph
+from node_keys import file_hash
+
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "kg-snapshot"
+# Bump when the arrays or tables of CompactGraph change meaning
+SNAPSHOT_VERSION = 1
+META_NAME = "meta.json"
+
+
+class StringTable:
+    """A read-only sequence of str stored as one UTF-8 byte array and the
+    offsets of every string in it; strings are decoded when accessed, so a
+    memory-mapped table costs nothing until it is read."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @staticmethod
+    def arrays(strings):
+        encoded = [text.encode("utf-8") for text in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        data = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end].decode("utf-8")
+
+
+def source_hashes(paths, baseDir):
+    """{path relative to baseDir: content hash} of the files a snapshot is
+    made from; relative, so a snapshot stays valid when the checkout moves."""
+    return {os.path.relpath(path, baseDir).replace(os.sep, "/"): file_hash(path) for path in paths}
+
+
+def write_snapshot(path, graph, sources, params=None, extra=None):
+    """Saves the CompactGraph graph as the directory path: one .npy per
+    array and string table and meta.json with the format version, the
+    source hashes ({path: hash}), the params the graph was built with and
+    any extra JSON the caller needs to restore its own objects. The
+    directory is replaced as a whole, readers never see half a snapshot."""
+    arrays, tables, meta = graph.state()
+    tmp = path + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp, name + ".npy"), np.ascontiguousarray(array))
+    for name, strings in tables.items():
+        blob, offsets = StringTable.arrays(strings)
+        np.save(os.path.join(tmp, name + ".blob.npy"), blob)
+        np.save(os.path.join(tmp, name + ".offsets.npy"), offsets)
+    meta.update({"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION, "sources": sources,
+                 "params": params or {}, "arrays": sorted(arrays), "tables": sorted(tables), "extra": extra})
+    with open(os.path.join(tmp, META_NAME), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    old = path + ".old"
+    if os.path.exists(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    log.info("Wrote snapshot %s: %d nodes, %d relationships", path, graph.node_count, graph.edge_count)
+
+
+def read_meta(path):
+    try:
+        with open(os.path.join(path, META_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_snapshot(path, sources, params=None, mmap=True):
+    """(CompactGraph, extra) of the snapshot at path, or None when there is
+    none or it is stale: another format version, other params, or sources
+    ({path: hash}, see source_hashes) that differ from the ones it was made
+    from. The arrays are memory-mapped read-only, so processes loading the
+    same snapshot share its pages instead of each holding a copy."""
+    meta = read_meta(path)
+    if meta is None:
+        log.debug("No snapshot at %s", path)
+        return None
+    if meta.get("format") != SNAPSHOT_FORMAT or meta.get("version") != SNAPSHOT_VERSION:
+        log.info("Ignoring snapshot %s: format %s version %s", path, meta.get("format"), meta.get("version"))
+        return None
+    if meta["sources"] != sources or meta["params"] != (params or {}):
+        log.info("Snapshot %s is stale", path)
+        return None
+    mode = "r" if mmap else None
+    arrays = {name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mode) for name in meta["arrays"]}
+    tables = {name: StringTable(np.load(os.path.join(path, name + ".blob.npy"), mmap_mode=mode),
+                                np.load(os.path.join(path, name + ".offsets.npy"), mmap_mode=mode))
+              for name in meta["tables"]}
+    return CompactGraph.from_state(arrays, tables, meta), meta["extra"]
@@ -0,0 +1,209 @@
+"""
+Checks the GraphML files in input/ against glossary.txt and the structure
+main.py expects, in process and without building the graphs. Prints one
+`file:line: code: message` per problem (or --json) and exits 1 if any.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from xml.parsers import expat
+
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+INPUT_DIR = os.path.join(REPO_DIR, "input")
+GLOSSARY_PATH = os.path.join(REPO_DIR, "glossary.txt")
+
+# Node attributes every graph must declare and every node must carry; the
+# entity may also be given as label
+REQUIRED_NODE_KEYS = ("name", "entity")
+ENTITY_KEYS = ("entity", "label")
+
+
+@lru_cache(maxsize=None)
+def load_glossary(path=GLOSSARY_PATH):
+    """The entity names of glossary.txt, read once per process."""
+    with open(path, "r", encoding="utf-8") as f:
+        return frozenset(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+
+def problem(filename, line, code, message):
+    return {"file": filename, "line": line, "code": code, "message": message}
+
+
+def io_problem(filename, error):
+    """Problem of a file that cannot be read (a directory, no permission, ...);
+    it has no line, 0 stands for the whole file."""
+    return problem(filename, 0, "io-error", error.strerror or str(error))
+
+
+def format_problem(p):
+    return "%s:%d: %s: %s" % (p["file"], p["line"], p["code"], p["message"])
+
+
+class _GraphmlChecker:
+    """expat handlers for one file. Element names are compared without their
+    namespace, like the local-name() XPath the shell script used."""
+
+    def __init__(self, filename, glossary):
+        self.filename = filename
+        self.glossary = glossary
+        self.parser = expat.ParserCreate(namespace_separator=" ")
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.end
+        self.parser.CharacterDataHandler = self.text
+        self.problems = []
+        self.nodeKeys = {}
+        self.edgeKeys = set()
+        self.nodeIds = {}
+        self.edgeIds = {}
+        self.edges = []
+        self.node = None
+        self.edge = None
+        self.dataKey = None
+        self.dataText = []
+
+    def report(self, code, message, line=None):
+        if line is None:
+            line = self.parser.CurrentLineNumber
+        self.problems.append(problem(self.filename, line, code, message))
+
+    def start(self, tag, attrs):
+        tag = tag.rsplit(" ", 1)[-1]
+        line = self.parser.CurrentLineNumber
+        if tag == "key":
+            if attrs.get("for") == "node":
+                self.nodeKeys[attrs.get("id")] = attrs.get("attr.name")
+            elif attrs.get("for") == "edge":
+                self.edgeKeys.add(attrs.get("id"))
+        elif tag == "node":
+            nodeId = attrs.get("id")
+            if nodeId in self.nodeIds:
+                self.report("duplicate-node-id", "node id %r already used on line %d" % (nodeId, self.nodeIds[nodeId]))
+            else:
+                self.nodeIds[nodeId] = line
+            self.node = {"id": nodeId, "line": line, "data": {}}
+        elif tag == "edge":
+            edgeId = attrs.get("id")
+            if edgeId is not None:
+                if edgeId in self.edgeIds:
+                    self.report("duplicate-edge-id", "edge id %r already used on line %d" % (edgeId, self.edgeIds[edgeId]))
+                else:
+                    self.edgeIds[edgeId] = line
+            self.edges.append((attrs.get("source"), attrs.get("target"), line))
+            self.edge = {"line": line, "data": 0}
+        elif tag == "data":
+            self.dataKey = attrs.get("key")
+            self.dataText = []
+
+    def text(self, data):
+        if self.dataKey is not None:
+            self.dataText.append(data)
+
+    def end(self, tag):
+        tag = tag.rsplit(" ", 1)[-1]
+        if tag == "data" and self.dataKey is not None:
+            if self.node is not None:
+                if self.dataKey not in self.nodeKeys:
+                    self.report("unknown-data-key", "node data uses undeclared key %r" % self.dataKey)
+                else:
+                    self.node["data"][self.nodeKeys[self.dataKey]] = "".join(self.dataText)
+            elif self.edge is not None:
+                if self.dataKey not in self.edgeKeys:
+                    self.report("unknown-data-key", "edge data uses undeclared key %r" % self.dataKey)
+                self.edge["data"] += 1
+            self.dataKey = None
+        elif tag == "node" and self.node is not None:
+            self.check_node(self.node)
+            self.node = None
+        elif tag == "edge" and self.edge is not None:
+            if not self.edge["data"]:
+                self.report("edge-without-type", "edge has no relationship type (verb/relation data)",
+                            self.edge["line"])
+            self.edge = None
+
+    def check_node(self, node):
+        data = node["data"]
+        line = node["line"]
+        if "name" not in data:
+            self.report("missing-data", "node %r has no name" % node["id"], line)
+        entity = next((data[key] for key in ENTITY_KEYS if key in data), None)
+        if entity is None:
+            self.report("missing-data", "node %r has neither entity nor label" % node["id"], line)
+        elif entity not in self.glossary:
+            self.report("unknown-entity", "node %r: entity %r is not in the glossary" % (node["id"], entity), line)
+
+    def check_graph(self):
+        declared = set(self.nodeKeys.values())
+        for key in REQUIRED_NODE_KEYS:
+            if key not in declared and not (key == "entity" and "label" in declared):
+                self.report("missing-key", "no <key for=\"node\" attr.name=%r> declared" % key, 1)
+        for source, target, line in self.edges:
+            for end, nodeId in (("source", source), ("target", target)):
+                if nodeId not in self.nodeIds:
+                    self.report("dangling-edge", "edge %s %r is not a node of the graph" % (end, nodeId), line)
+
+
+def validate_file(path, glossary=None):
+    """Checks one GraphML file, returns its problems as a list of dicts with
+    file, line, code and message."""
+    if glossary is None:
+        glossary = load_glossary()
+    filename = os.path.basename(path)
+    checker = _GraphmlChecker(filename, glossary)
+    try:
+        with open(path, "rb") as f:
+            checker.parser.ParseFile(f)
+    except expat.ExpatError as e:
+        checker.problems.append(problem(filename, e.lineno, "xml-syntax", expat.ErrorString(e.code)))
+        return checker.problems
+    except OSError as e:
+        return [io_problem(filename, e)]
+    checker.check_graph()
+    return checker.problems
+
+
+def validate_files(paths, glossary=None, workers=None):
+    """Checks paths in parallel; returns {path: problems} in path order
+    (paths, not file names, so files of the same name in different
+    directories are all counted)."""
+    if glossary is None:
+        glossary = load_glossary()
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(paths) <= 1:
+        results = [validate_file(path, glossary) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            results = list(pool.map(partial(validate_file, glossary=glossary), paths, chunksize=chunksize))
+    return dict(zip(paths, results))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the GraphML files in input/")
+    parser.add_argument("files", nargs="*", help="Files to check (default: every file in --input-dir)")
+    parser.add_argument("--input-dir", default=INPUT_DIR)
+    parser.add_argument("--glossary", default=GLOSSARY_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--json", action="store_true", help="Print a JSON document instead of one line per problem")
+    args = parser.parse_args(argv)
+
+    paths = args.files or [os.path.join(args.input_dir, name) for name in sorted(os.listdir(args.input_dir))]
+    results = validate_files(paths, load_glossary(args.glossary), args.workers)
+    problems = [p for fileProblems in results.values() for p in fileProblems]
+    if args.json:
+        json.dump({"files": len(results), "invalid_files": sum(1 for p in results.values() if p),
+                   "problems": problems}, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+    else:
+        for p in problems:
+            print(format_problem(p))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())